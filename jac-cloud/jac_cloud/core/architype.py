@@ -1,5 +1,6 @@
 """Core constructs for Jac Language."""
 
+from collections import deque
 from dataclasses import (
     MISSING,
     asdict as _asdict,
@@ -35,6 +36,7 @@ from jaclang.runtimelib.architype import (
     DSFunc,
     EdgeAnchor as _EdgeAnchor,
     EdgeArchitype as _EdgeArchitype,
+    EdgeIndex,
     NodeAnchor as _NodeAnchor,
     NodeArchitype as _NodeArchitype,
     Permission as _Permission,
@@ -426,7 +428,11 @@ class BaseAnchor:
 
     def is_populated(self) -> bool:
         """Check if populated."""
-        return "architype" in self.__dict__
+        try:
+            object.__getattribute__(self, "architype")
+        except AttributeError:
+            return False
+        return True
 
     def make_stub(self: "BaseAnchor | TANCH") -> "BaseAnchor | TANCH":
         """Return unsynced copy of anchor."""
@@ -444,12 +450,25 @@ class BaseAnchor:
         jsrc = JaseciContext.get().mem
 
         if anchor := jsrc.find_by_id(self):
-            self.__dict__.update(anchor.__dict__)
+            self.sync(anchor)  # type: ignore[attr-defined]
         else:
             raise ValueError(
                 f"{self.__class__.__name__} [{self.ref_id}] is not a valid reference!"
             )
 
+    @staticmethod
+    def populate_many(anchors: Iterable["BaseAnchor"]) -> None:
+        """Retrieve multiple Architypes from db in one read."""
+        if stubs := [anchor for anchor in anchors if not anchor.is_populated()]:
+            from .context import JaseciContext
+
+            found = {
+                anchor.id: anchor for anchor in JaseciContext.get().mem.find(stubs)
+            }
+            for stub in stubs:
+                if anchor := found.get(stub.id):
+                    stub.sync(anchor)  # type: ignore[attr-defined]
+
     def build_query(
         self,
         bulk_write: BulkWrite,
@@ -627,11 +646,9 @@ class BaseAnchor:
     def __repr__(self) -> str:
         """Override representation."""
         if self.is_populated():
-            attrs = ""
-            for f in fields(self):
-                if f.name in self.__dict__:
-                    attrs += f"{f.name}={self.__dict__[f.name]}, "
-            attrs = attrs[:-2]
+            attrs = ", ".join(
+                f"{f.name}={getattr(self, f.name)}" for f in fields(self) if f.repr
+            )
         else:
             attrs = f"name={self.name}, id={self.id}"
 
@@ -643,7 +660,7 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
     """Node Anchor."""
 
     architype: "NodeArchitype"
-    edges: list["EdgeAnchor"]
+    edges: EdgeIndex
 
     class Collection(BaseCollection["NodeAnchor"]):
         """NodeAnchor collection interface."""
@@ -665,7 +682,9 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
             anchor = NodeAnchor(
                 architype=architype,
                 id=doc.pop("_id"),
-                edges=[e for edge in doc.pop("edges") if (e := EdgeAnchor.ref(edge))],
+                edges=EdgeIndex(
+                    e for edge in doc.pop("edges") if (e := EdgeAnchor.ref(edge))
+                ),
                 access=Permission.deserialize(doc.pop("access")),
                 state=AnchorState(connected=True),
                 persistent=True,
@@ -799,9 +818,9 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
 
     architype: "WalkerArchitype"
     path: list[Anchor] = field(default_factory=list)
-    next: list[Anchor] = field(default_factory=list)
+    next: deque[Anchor] = field(default_factory=deque)
     returns: list[Any] = field(default_factory=list)
-    ignores: list[Anchor] = field(default_factory=list)
+    ignores: set[Anchor] = field(default_factory=set)
     disengaged: bool = False
 
     class Collection(BaseCollection["WalkerAnchor"]):
@@ -916,7 +935,7 @@ class NodeArchitype(BaseArchitype, _NodeArchitype):
         self.__jac__ = NodeAnchor(
             architype=self,
             name=self.__class__.__name__,
-            edges=[],
+            edges=EdgeIndex(),
             access=Permission(),
             state=AnchorState(),
         )
@@ -992,7 +1011,7 @@ class Root(NodeArchitype):
         """Create node architype."""
         self.__jac__ = NodeAnchor(
             architype=self,
-            edges=[],
+            edges=EdgeIndex(),
             access=Permission(),
             state=AnchorState(),
         )
@@ -16,6 +16,7 @@ from .architype import (
     Anchor,
     AnchorState,
     BaseArchitype,
+    EdgeIndex,
     NodeAnchor,
     Permission,
     Root,
@@ -85,7 +86,7 @@ class JaseciContext(ExecutionContext):
                 access=Permission(),
                 state=AnchorState(connected=True),
                 persistent=True,
-                edges=[],
+                edges=EdgeIndex(),
             )
             system_root.architype.__jac__ = system_root
             NodeAnchor.Collection.insert_one(system_root.serialize())
@@ -107,7 +108,7 @@ class JaseciContext(ExecutionContext):
                     access=Permission(all=AccessLevel.WRITE),
                     state=AnchorState(),
                     persistent=True,
-                    edges=[],
+                    edges=EdgeIndex(),
                 )
                 public_root.architype.__jac__ = public_root
                 ctx.mem.set(public_root.id, public_root)
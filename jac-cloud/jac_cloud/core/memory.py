@@ -45,7 +45,7 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
                     nodes.add(edge.source)
                 if edge.target:
                     nodes.add(edge.target)
-            self.find(nodes)
+            self.prefetch(nodes)
 
     def find(  # type: ignore[override]
         self,
@@ -56,7 +56,25 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
         """Find anchors from datasource by ids with filter."""
         if not isinstance(anchors, Iterable):
             anchors = [anchors]
+        else:
+            anchors = list(anchors)
 
+        self.prefetch(anchors, session)
+
+        for anchor in anchors:
+            if (
+                anchor not in self.__gc__
+                and (anch_mem := self.__mem__.get(anchor.id))
+                and (not filter or filter(anch_mem))  # type: ignore[arg-type]
+            ):
+                yield cast(BA, anch_mem)
+
+    def prefetch(  # type: ignore[override]
+        self,
+        anchors: Iterable[BaseAnchor],
+        session: ClientSession | None = None,
+    ) -> None:
+        """Load anchors from datasource with one query per collection."""
         collections: dict[type[Collection[BaseAnchor]], list[ObjectId]] = {}
         for anchor in anchors:
             if anchor.id not in self.__mem__ and anchor not in self.__gc__:
@@ -75,14 +93,6 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
             ):
                 self.__mem__[anch_db.id] = anch_db
 
-        for anchor in anchors:
-            if (
-                anchor not in self.__gc__
-                and (anch_mem := self.__mem__.get(anchor.id))
-                and (not filter or filter(anch_mem))  # type: ignore[arg-type]
-            ):
-                yield cast(BA, anch_mem)
-
     def find_one(  # type: ignore[override]
         self,
         anchors: BA | Iterable[BA],
@@ -1,13 +1,23 @@
 """Jac Language Features."""
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from contextlib import suppress
 from dataclasses import Field, MISSING, fields, is_dataclass
 from functools import wraps
 from os import getenv
 from re import compile
-from types import NoneType
-from typing import Any, Callable, Type, TypeAlias, TypeVar, Union, cast, get_type_hints
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Callable,
+    Sequence,
+    Type,
+    TypeAlias,
+    TypeVar,
+    Union,
+    cast,
+    get_type_hints,
+)
 
 from asyncer import syncify
 
@@ -25,7 +35,7 @@ from fastapi.responses import ORJSONResponse
 from jaclang.compiler.constant import EdgeDir
 from jaclang.plugin.default import JacFeatureImpl, hookimpl
 from jaclang.plugin.feature import JacFeature as Jac
-from jaclang.runtimelib.architype import DSFunc
+from jaclang.runtimelib.architype import DSDispatch, DSFunc
 
 from orjson import loads
 
@@ -435,6 +445,25 @@ class JacAccessValidationPlugin:
 
         return access_level
 
+    @staticmethod
+    @hookimpl
+    def check_access_bulk(anchors: Sequence[Anchor]) -> list[AccessLevel]:
+        """Access validation of multiple anchors."""
+        if not FastAPI.is_enabled():
+            return JacFeatureImpl.check_access_bulk(anchors=anchors)
+
+        from ..core.context import JaseciContext
+
+        # fetch every missing root in a single query, check_access_level then
+        # finds each of them in memory
+        JaseciContext.get().mem.prefetch(
+            [
+                NodeAnchor.ref(f"n::{root_id}")
+                for root_id in {to.root for to in anchors if to.persistent and to.root}
+            ]
+        )
+        return [Jac.check_access_level(to) for to in anchors]
+
 
 class JacNodePlugin:
     """Jac Node Operations."""
@@ -446,13 +475,15 @@ class JacNodePlugin:
         dir: EdgeDir,
         filter_func: Callable[[list[EdgeArchitype]], list[EdgeArchitype]] | None,
         target_obj: list[NodeArchitype] | None,
+        edge_type: type | UnionType | None,
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
-        if FastAPI.is_enabled():
-            JaseciContext.get().mem.populate_data(node.edges)
-
-        return JacFeatureImpl.get_edges(
-            node=node, dir=dir, filter_func=filter_func, target_obj=target_obj  # type: ignore[arg-type, return-value]
+        return JacFeatureImpl.get_edges(  # type: ignore[return-value]
+            node=node,  # type: ignore[arg-type]
+            dir=dir,
+            filter_func=filter_func,
+            target_obj=target_obj,
+            edge_type=edge_type,
         )
 
     @staticmethod
@@ -462,13 +493,15 @@ class JacNodePlugin:
         dir: EdgeDir,
         filter_func: Callable[[list[EdgeArchitype]], list[EdgeArchitype]] | None,
         target_obj: list[NodeArchitype] | None,
+        edge_type: type | UnionType | None,
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
-        if FastAPI.is_enabled():
-            JaseciContext.get().mem.populate_data(node.edges)
-
-        return JacFeatureImpl.edges_to_nodes(
-            node=node, dir=dir, filter_func=filter_func, target_obj=target_obj  # type: ignore[arg-type, return-value]
+        return JacFeatureImpl.edges_to_nodes(  # type: ignore[return-value]
+            node=node,  # type: ignore[arg-type]
+            dir=dir,
+            filter_func=filter_func,
+            target_obj=target_obj,
+            edge_type=edge_type,
         )
 
 
@@ -517,6 +550,7 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
             )
         for i in on_entry + on_exit:
             i.resolve(cls)
+        DSDispatch.clear()
         if not hasattr(cls, "_jac_entry_funcs_") or not hasattr(
             cls, "_jac_exit_funcs_"
         ):
@@ -750,7 +784,7 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
             raise TypeError("Invalid walker object")
 
         walker.path = []
-        walker.next = [node]
+        walker.next = deque([node])
         walker.returns = []
 
         if walker.next:
@@ -762,41 +796,17 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
                     else:
                         raise ValueError(f"No function {i.name} to call.")
         while len(walker.next):
-            if current_node := walker.next.pop(0).architype:
-                for i in current_node._jac_entry_funcs_:
-                    if not i.trigger or isinstance(walker, i.trigger):
-                        if i.func:
-                            walker.returns.append(i.func(current_node, warch))
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
-                    if walker.disengaged:
-                        return warch
-                for i in warch._jac_entry_funcs_:
-                    if not i.trigger or isinstance(current_node, i.trigger):
-                        if i.func and i.trigger:
-                            walker.returns.append(i.func(warch, current_node))
-                        elif not i.trigger:
-                            continue
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
-                    if walker.disengaged:
-                        return warch
-                for i in warch._jac_exit_funcs_:
-                    if not i.trigger or isinstance(current_node, i.trigger):
-                        if i.func and i.trigger:
-                            walker.returns.append(i.func(warch, current_node))
-                        elif not i.trigger:
-                            continue
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
-                    if walker.disengaged:
-                        return warch
-                for i in current_node._jac_exit_funcs_:
-                    if not i.trigger or isinstance(walker, i.trigger):
-                        if i.func:
-                            walker.returns.append(i.func(current_node, warch))
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+            if current_node := walker.next.popleft().architype:
+                dispatch = DSDispatch.get(warch.__class__, current_node.__class__)
+                if dispatch.guarded and walker.disengaged:
+                    return warch
+                for i, walker_first in dispatch.steps:
+                    if not i.func:
+                        raise ValueError(f"No function {i.name} to call.")
+                    if walker_first:
+                        walker.returns.append(i.func(warch, current_node))
+                    else:
+                        walker.returns.append(i.func(current_node, warch))
                     if walker.disengaged:
                         return warch
         for i in warch._jac_exit_funcs_:
@@ -805,7 +815,7 @@ class JacPlugin(JacAccessValidationPlugin, JacNodePlugin, JacEdgePlugin):
                     walker.returns.append(i.func(warch, current_node))
                 else:
                     raise ValueError(f"No function {i.name} to call.")
-        walker.ignores = []
+        walker.ignores = set()
         return warch
 
     @staticmethod
@@ -1,5 +1,7 @@
 """The Jac Programming Language."""
 
+# puts the vendored packages on sys.path before anything imports them
+import jaclang.vendor  # noqa: F401
 from jaclang.plugin.default import JacFeatureImpl
 from jaclang.plugin.feature import JacFeature, plugin_manager
 
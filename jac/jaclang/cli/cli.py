@@ -1,7 +1,6 @@
 """Command line interface tool for the Jac language."""
 
 import ast as ast3
-import importlib
 import marshal
 import os
 import pickle
@@ -10,22 +9,17 @@ import sys
 import types
 from typing import Optional
 
-import jaclang.compiler.absyntree as ast
 from jaclang import jac_import
 from jaclang.cli.cmdreg import CommandShell, cmd_registry
-from jaclang.compiler.compile import jac_file_to_pass
 from jaclang.compiler.constant import Constants
-from jaclang.compiler.passes.main.pyast_load_pass import PyastBuildPass
-from jaclang.compiler.passes.main.schedules import py_code_gen_typed
-from jaclang.compiler.passes.tool.schedules import format_pass
 from jaclang.plugin.builtin import dotgen
 from jaclang.plugin.feature import JacCmd as Cmd
 from jaclang.plugin.feature import JacFeature as Jac
 from jaclang.runtimelib.constructs import WalkerArchitype
 from jaclang.runtimelib.context import ExecutionContext
 from jaclang.runtimelib.machine import JacMachine, JacProgram
+from jaclang.settings import settings
 from jaclang.utils.helpers import debugger as db
-from jaclang.utils.lang_tools import AstTool
 
 
 Cmd.create_cmd()
@@ -35,6 +29,8 @@ Jac.setup()
 @cmd_registry.register
 def format(path: str, outfile: str = "", debug: bool = False) -> None:
     """Run the specified .jac file or format all .jac files in a given directory."""
+    from jaclang.compiler.compile import jac_file_to_pass
+    from jaclang.compiler.passes.tool.schedules import format_pass
 
     def format_file(filename: str) -> None:
         code_gen_format = jac_file_to_pass(filename, schedule=format_pass)
@@ -182,10 +178,27 @@ def get_object(
 
 
 @cmd_registry.register
-def build(filename: str) -> None:
-    """Build the specified .jac file."""
+def build(filename: str, jobs: int = 0, profile: bool = False) -> None:
+    """Build the specified .jac file.
+
+    :param filename: The path to the .jac file.
+    :param jobs: Number of processes parsing imported modules, 0 to use settings.
+    :param profile: Report time, visits and peak memory of each compiler pass.
+    """
+    from jaclang.compiler.compile import jac_file_to_pass
+    from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+    from jaclang.compiler.passes.profiler import PassProfiler
+
+    if jobs:
+        settings.compile_jobs = jobs
     if filename.endswith(".jac"):
-        out = jac_file_to_pass(file_path=filename, schedule=py_code_gen_typed)
+        if profile:
+            with PassProfiler() as prof:
+                out = jac_file_to_pass(file_path=filename, schedule=py_code_gen_typed)
+            print(prof.table())
+            prof.dump(filename[:-4] + ".profile.json")
+        else:
+            out = jac_file_to_pass(file_path=filename, schedule=py_code_gen_typed)
         errs = len(out.errors_had)
         warnings = len(out.warnings_had)
         print(f"Errors: {errs}, Warnings: {warnings}")
@@ -198,11 +211,17 @@ def build(filename: str) -> None:
 
 
 @cmd_registry.register
-def check(filename: str, print_errs: bool = True) -> None:
+def check(filename: str, print_errs: bool = True, jobs: int = 0) -> None:
     """Run type checker for a specified .jac file.
 
     :param filename: The path to the .jac file.
+    :param jobs: Number of processes parsing imported modules, 0 to use settings.
     """
+    from jaclang.compiler.compile import jac_file_to_pass
+    from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+
+    if jobs:
+        settings.compile_jobs = jobs
     if filename.endswith(".jac"):
         out = jac_file_to_pass(
             file_path=filename,
@@ -244,7 +263,7 @@ def enter(
     :param filename: The path to the .jac file.
     :param entrypoint: The name of the entrypoint function.
     :param args: Arguments to pass to the entrypoint function.
-    :param session: shelve.Shelf file path.
+    :param session: shelve.Shelf file path or backend URI (e.g. sqlite:///graph.db).
     :param root: root executor.
     :param node: starting node.
     """
@@ -348,6 +367,8 @@ def tool(tool: str, args: Optional[list] = None) -> None:
     :param tool: The name of the AST tool to run.
     :param args: Optional arguments for the AST tool.
     """
+    from jaclang.utils.lang_tools import AstTool
+
     if hasattr(AstTool, tool):
         try:
             if args and len(args):
@@ -382,6 +403,8 @@ def clean() -> None:
 @cmd_registry.register
 def debug(filename: str, main: bool = True, cache: bool = False) -> None:
     """Debug the specified .jac file using pdb."""
+    from jaclang.compiler.compile import jac_file_to_pass
+
     base, mod = os.path.split(filename)
     base = base if base else "./"
     mod = mod[:-4]
@@ -482,6 +505,9 @@ def py2jac(filename: str) -> None:
 
     :param filename: The path to the .py file.
     """
+    import jaclang.compiler.absyntree as ast
+    from jaclang.compiler.passes.main.pyast_load_pass import PyastBuildPass
+
     if filename.endswith(".py"):
         with open(filename, "r") as f:
             file_source = f.read()
@@ -502,6 +528,8 @@ def jac2py(filename: str) -> None:
 
     :param filename: The path to the .jac file.
     """
+    from jaclang.compiler.compile import jac_file_to_pass
+
     if filename.endswith(".jac"):
         with open(filename, "r"):
             code = jac_file_to_pass(file_path=filename).ir.gen.py
@@ -522,7 +550,9 @@ def start_cli() -> None:
     cmd_registry.args = args
 
     if args.version:
-        version = importlib.metadata.version("jaclang")
+        from importlib.metadata import version as get_version
+
+        version = get_version("jaclang")
         print(f"Jac version {version}")
         return
 
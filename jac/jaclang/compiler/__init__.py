@@ -1,17 +1,28 @@
-"""Jac compiler tools."""
+"""Jac compiler tools.
+
+The generated parser (`jac_lark`) and the token map read from it are loaded
+on first access, so runtime code importing e.g. `jaclang.compiler.constant`
+doesn't pay for loading lark.
+"""
 
-import contextlib
 import logging
 import os
 import shutil
 import sys
+from types import ModuleType
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jaclang.compiler.generated import jac_parser as jac_lark
 
-from jaclang.utils.helpers import auto_generate_refs
-from jaclang.vendor.lark.tools import standalone
+    TOKEN_MAP: dict[str, str]
 
 
 def generate_static_parser(force: bool = False) -> None:
     """Generate static parser."""
+    from jaclang.utils.helpers import auto_generate_refs
+    from jaclang.vendor.lark.tools import standalone
+
     cur_dir = os.path.dirname(__file__)
     if force or not os.path.exists(os.path.join(cur_dir, "generated", "jac_parser.py")):
         if os.path.exists(os.path.join(cur_dir, "generated")):
@@ -35,43 +46,63 @@ def generate_static_parser(force: bool = False) -> None:
             logging.error(f"Error generating reference files: {e}")
 
 
-try:
-    from jaclang.compiler.generated import jac_parser as jac_lark
-except ModuleNotFoundError:
-    generate_static_parser(force=True)
-    from jaclang.compiler.generated import jac_parser as jac_lark
+# fmt: off
+TOKEN_MAP_EXTRAS = {
+    "CARROW_L": "<++", "CARROW_R": "++>", "GLOBAL_OP": ":global:",
+    "NONLOCAL_OP": ":nonlocal:", "WALKER_OP": ":walker:", "NODE_OP": ":node:",
+    "EDGE_OP": ":edge:", "CLASS_OP": ":class:", "OBJECT_OP": ":obj:",
+    "TYPE_OP": "`", "ABILITY_OP": ":can:", "ELVIS_OP": "?:", "NULL_OK": "?",
+    "KW_OR": "|", "ARROW_BI": "<-->", "ARROW_L": "<--",
+    "ARROW_R": "-->", "ARROW_L_P1": "<-:", "ARROW_R_P2": ":->",
+    "ARROW_L_P2": ":-", "ARROW_R_P1": "-:", "CARROW_BI": "<++>",
+    "CARROW_L_P1": "<+:", "RSHIFT_EQ": ">>=", "ELLIPSIS": "...",
+    "CARROW_R_P2": ":+>", "CARROW_L_P2": ":+", "CARROW_R_P1": "+:",
+    "PIPE_FWD": "|>", "PIPE_BKWD": "<|", "A_PIPE_FWD": ":>",
+    "A_PIPE_BKWD": "<:", "DOT_FWD": ".>", "STAR_POW": "**",
+    "STAR_MUL": "*", "FLOOR_DIV": "//", "DIV": "/",
+    "PYNLINE": "::py::", "ADD_EQ": "+=", "SUB_EQ": "-=",
+    "STAR_POW_EQ": "**=", "MUL_EQ": "*=", "FLOOR_DIV_EQ": "//=",
+    "DIV_EQ": "/=", "MOD_EQ": "%=", "BW_AND_EQ": "&=",
+    "BW_OR_EQ": "|=", "BW_XOR_EQ": "^=", "BW_NOT_EQ": "~=",
+    "LSHIFT_EQ": "<<=",
+}
+# fmt: on
 
-jac_lark.logger.setLevel(logging.DEBUG)
-contextlib.suppress(ModuleNotFoundError)
 
-TOKEN_MAP = {
-    x.name: x.pattern.value
-    for x in jac_lark.Lark_StandAlone().parser.lexer_conf.terminals
-}
+def load_jac_lark() -> ModuleType:
+    """Import the generated parser, generating it first if missing."""
+    try:
+        from jaclang.compiler.generated import jac_parser as jac_lark
+    except ModuleNotFoundError:
+        generate_static_parser(force=True)
+        from jaclang.compiler.generated import jac_parser as jac_lark
+    jac_lark.logger.setLevel(logging.DEBUG)
+    return jac_lark
 
-# fmt: off
-TOKEN_MAP.update(
-    {
-        "CARROW_L": "<++", "CARROW_R": "++>", "GLOBAL_OP": ":global:",
-        "NONLOCAL_OP": ":nonlocal:", "WALKER_OP": ":walker:", "NODE_OP": ":node:",
-        "EDGE_OP": ":edge:", "CLASS_OP": ":class:", "OBJECT_OP": ":obj:",
-        "TYPE_OP": "`", "ABILITY_OP": ":can:", "ELVIS_OP": "?:", "NULL_OK": "?",
-        "KW_OR": "|", "ARROW_BI": "<-->", "ARROW_L": "<--",
-        "ARROW_R": "-->", "ARROW_L_P1": "<-:", "ARROW_R_P2": ":->",
-        "ARROW_L_P2": ":-", "ARROW_R_P1": "-:", "CARROW_BI": "<++>",
-        "CARROW_L_P1": "<+:", "RSHIFT_EQ": ">>=", "ELLIPSIS": "...",
-        "CARROW_R_P2": ":+>", "CARROW_L_P2": ":+", "CARROW_R_P1": "+:",
-        "PIPE_FWD": "|>", "PIPE_BKWD": "<|", "A_PIPE_FWD": ":>",
-        "A_PIPE_BKWD": "<:", "DOT_FWD": ".>", "STAR_POW": "**",
-        "STAR_MUL": "*", "FLOOR_DIV": "//", "DIV": "/",
-        "PYNLINE": "::py::", "ADD_EQ": "+=", "SUB_EQ": "-=",
-        "STAR_POW_EQ": "**=", "MUL_EQ": "*=", "FLOOR_DIV_EQ": "//=",
-        "DIV_EQ": "/=", "MOD_EQ": "%=", "BW_AND_EQ": "&=",
-        "BW_OR_EQ": "|=", "BW_XOR_EQ": "^=", "BW_NOT_EQ": "~=",
-        "LSHIFT_EQ": "<<=",
-    }
-)
-# fmt: on
+
+def load_token_map(jac_lark: ModuleType) -> dict[str, str]:
+    """Map terminal names to patterns from the serialized parser data.
+
+    Reading the terminals from the data directly avoids building a whole
+    Lark_StandAlone parser only to list them.
+    """
+    lexer_conf = jac_lark.DATA["parser"]["lexer_conf"]
+    terminals = [jac_lark.MEMO[i["@"]] for i in lexer_conf["terminals"]]
+    token_map = {i["name"]: i["pattern"]["value"] for i in terminals}
+    token_map.update(TOKEN_MAP_EXTRAS)
+    return token_map
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Load the parser and token map on first access."""
+    if name == "jac_lark":
+        value: Any = load_jac_lark()
+    elif name == "TOKEN_MAP":
+        value = load_token_map(__getattr__("jac_lark"))
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
 __all__ = ["jac_lark", "TOKEN_MAP"]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import ast as ast3
 import builtins
 import os
+import threading
 from hashlib import md5
 from types import EllipsisType
 from typing import (
@@ -33,6 +34,7 @@ from jaclang.compiler.semtable import SemRegistry
 from jaclang.utils.treeprinter import dotgen_ast_tree, print_ast_tree
 
 if TYPE_CHECKING:
+    from jaclang.compiler.passes.main.sub_node_tab_pass import SubNodeRange
     from jaclang.compiler.symtable import Symbol, SymbolTable
 
 
@@ -44,7 +46,7 @@ class AstNode:
         self.parent: Optional[AstNode] = None
         self.kid: list[AstNode] = [x.set_parent(self) for x in kid]
         self._sym_tab: Optional[SymbolTable] = None
-        self._sub_node_tab: dict[type, list[AstNode]] = {}
+        self._sub_node_tab: Optional[SubNodeRange] = None
         self._in_mod_nodes: list[AstNode] = []
         self.gen: CodeGenTarget = CodeGenTarget()
         self.meta: dict[str, str] = {}
@@ -736,6 +738,8 @@ class Test(AstSymbolNode, ElementStmt):
     """Test node type for Jac Ast."""
 
     TEST_COUNT = 0
+    # tests may be numbered by parsers on several threads
+    TEST_COUNT_LOCK = threading.Lock()
 
     def __init__(
         self,
@@ -745,14 +749,16 @@ class Test(AstSymbolNode, ElementStmt):
         doc: Optional[String] = None,
     ) -> None:
         """Initialize test node."""
-        Test.TEST_COUNT += 1 if isinstance(name, Token) else 0
+        with Test.TEST_COUNT_LOCK:
+            Test.TEST_COUNT += 1 if isinstance(name, Token) else 0
+            count = Test.TEST_COUNT
         self.name: Name = (  # for auto generated test names
             name
             if isinstance(name, Name)
             else Name(
                 orig_src=name.orig_src,
                 name=Tok.NAME.value,
-                value=f"_jac_gen_{Test.TEST_COUNT}",
+                value=f"_jac_gen_{count}",
                 col_start=name.loc.col_start,
                 col_end=name.loc.col_end,
                 line=name.loc.first_line,
@@ -0,0 +1,114 @@
+"""Content hashed build cache for compiled Jac modules.
+
+Bytecode written to `__jac_gen__` is stored with a key made of the compiler
+version, the hash of the module source and the hashes of every Jac module
+compiled along with it (impl/test annexes and imported Jac modules). Cached
+bytecode is only reused while all of these still match what is on disk, so a
+change in a dependency invalidates its importers as well.
+"""
+
+from __future__ import annotations
+
+import marshal
+import os
+import sys
+from functools import cache
+from hashlib import md5
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import jaclang.compiler.absyntree as ast
+
+CacheKey = dict[str, object]
+
+
+@cache
+def get_compiler_version() -> str:
+    """Get the version bytecode produced by this compiler is tied to."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        jac_version = version("jaclang")
+    except PackageNotFoundError:
+        jac_version = "dev"
+    return f"{jac_version}-{sys.implementation.cache_tag}"
+
+
+# path -> (mtime_ns, size, hash), files are only rehashed once they change
+_file_hashes: dict[str, tuple[int, int, str]] = {}
+
+
+def source_hash(source: str) -> str:
+    """Hash source code the way JacSource does."""
+    return md5(source.encode()).hexdigest()
+
+
+def file_hash(path: str) -> Optional[str]:
+    """Hash source code of a file, None if it can't be read."""
+    try:
+        stat = os.stat(path)
+        if (cached := _file_hashes.get(path)) and cached[:2] == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return cached[2]
+        with open(path) as f:
+            digest = source_hash(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+    _file_hashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def get_cache_key(mod: ast.Module, deps: list[ast.Module]) -> CacheKey:
+    """Get the cache key of a module compiled along with its dependencies."""
+    return {
+        "compiler": get_compiler_version(),
+        "source": mod.source.hash,
+        "deps": {
+            dep.loc.mod_path: dep.source.hash
+            for dep in deps
+            if not dep.stub_only and dep.loc.mod_path != mod.loc.mod_path
+        },
+    }
+
+
+def is_fresh(key: CacheKey, mod_path: str) -> bool:
+    """Check if module and its dependencies on disk still match the key."""
+    deps = key.get("deps")
+    return (
+        key.get("compiler") == get_compiler_version()
+        and key.get("source") == file_hash(mod_path)
+        and isinstance(deps, dict)
+        and all(file_hash(path) == digest for path, digest in deps.items())
+    )
+
+
+def read_entry(out_path: str) -> Optional[tuple[CacheKey, bytes]]:
+    """Read a cache entry, None if missing or not in the cache format."""
+    try:
+        with open(out_path, "rb") as f:
+            entry = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (
+        isinstance(entry, tuple)
+        and len(entry) == 2
+        and isinstance(entry[0], dict)
+        and isinstance(entry[1], bytes)
+    ):
+        return entry
+    return None
+
+
+def write_entry(out_path: str, key: CacheKey, bytecode: bytes) -> None:
+    """Write a cache entry."""
+    with open(out_path, "wb") as f:
+        marshal.dump((key, bytecode), f)
+
+
+def load_bytecode(out_path: str, mod_path: str) -> Optional[bytes]:
+    """Get cached bytecode of a module, None if missing or stale."""
+    if (entry := read_entry(out_path)) and is_fresh(entry[0], mod_path):
+        return entry[1]
+    return None
@@ -6,15 +6,17 @@ import jaclang.compiler.absyntree as ast
 from jaclang.compiler.parser import JacParser
 from jaclang.compiler.passes import Pass
 from jaclang.compiler.passes.main import PyOutPass, pass_schedule
+from jaclang.compiler.passes.main.schedules import py_code_gen_lean
 from jaclang.compiler.passes.tool import JacFormatPass
 from jaclang.compiler.passes.tool.schedules import format_pass
+from jaclang.settings import settings
 
 
 def compile_jac(file_path: str, cache_result: bool = False) -> Pass:
     """Start Compile for Jac file and return python code as string."""
     code = jac_file_to_pass(
         file_path=file_path,
-        schedule=pass_schedule,
+        schedule=pass_schedule if settings.gen_py_debug else py_code_gen_lean,
     )
     # If there is syntax error, the code will be an instance of JacParser as there is
     # no more passes were processed, in that case we can ignore it.
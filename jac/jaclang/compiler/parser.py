@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
+import gc
 import keyword
 import logging
 import os
-from typing import Callable, TypeAlias
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeAlias
 
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler import jac_lark as jl  # type: ignore
 from jaclang.compiler.constant import EdgeDir, Tokens as Tok
 from jaclang.compiler.passes.ir_pass import Pass
+from jaclang.settings import settings
 from jaclang.vendor.lark import Lark, Transformer, Tree, logger
 
+# parses running with the garbage collector paused, on any thread
+gc_pauses = 0
+gc_lock = threading.Lock()
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Pause the garbage collector until no parse needs it paused."""
+    global gc_pauses
+    with gc_lock:
+        if not gc_pauses:
+            gc.disable()
+        gc_pauses += 1
+    try:
+        yield
+    finally:
+        with gc_lock:
+            gc_pauses -= 1
+            if not gc_pauses:
+                gc.enable()
+
 
 class JacParser(Pass):
     """Jac Parser."""
@@ -25,6 +50,7 @@ class JacParser(Pass):
         self.source = input_ir
         self.mod_path = input_ir.loc.mod_path
         self.node_list: list[ast.AstNode] = []
+        self.node_set: set[ast.AstNode] = set()
         if JacParser.dev_mode:
             JacParser.make_dev()
         Pass.__init__(self, input_ir=input_ir, prior=None)
@@ -32,10 +58,15 @@ class JacParser(Pass):
     def transform(self, ir: ast.AstNode) -> ast.Module:
         """Transform input IR."""
         try:
-            tree, comments = JacParser.parse(
-                self.source.value, on_error=self.error_callback
-            )
-            mod = JacParser.TreeToAST(parser=self).transform(tree)
+            if settings.fast_parser and not JacParser.dev_mode:
+                mod, comments = JacParser.parse_to_ast(
+                    self.source.value, JacParser.TreeToAST(parser=self)
+                )
+            else:
+                tree, comments = JacParser.parse(
+                    self.source.value, on_error=self.error_callback
+                )
+                mod = JacParser.TreeToAST(parser=self).transform(tree)
             self.source.comments = [self.proc_comment(i, mod) for i in comments]
             if isinstance(mod, ast.Module):
                 return mod
@@ -91,19 +122,31 @@ class JacParser(Pass):
 
     @staticmethod
     def _comment_callback(comment: jl.Token) -> None:
-        JacParser.comment_cache.append(comment)
+        JacParser.comments.cache.append(comment)
 
     @staticmethod
     def parse(
         ir: str, on_error: Callable[[jl.UnexpectedInput], bool]
     ) -> tuple[jl.Tree[jl.Tree[str]], list[jl.Token]]:
         """Parse input IR."""
-        JacParser.comment_cache = []
+        JacParser.comments.cache = []
         return (
             JacParser.parser.parse(ir, on_error=on_error),
-            JacParser.comment_cache,
+            JacParser.comments.cache,
         )
 
+    @staticmethod
+    def parse_to_ast(
+        ir: str, builder: JacParser.TreeToAST
+    ) -> tuple[ast.AstNode, list[jl.Token]]:
+        """Parse input IR straight into AST nodes."""
+        if JacParser.fast_parser is None:
+            JacParser.fast_parser = JacParser.FastParser(JacParser.parser)
+        JacParser.comments.cache = []
+        with gc_paused():  # parsing allocates a whole tree
+            mod = JacParser.fast_parser.parse(ir, builder)
+        return mod, JacParser.comments.cache
+
     @staticmethod
     def make_dev() -> None:
         """Make parser in dev mode."""
@@ -117,11 +160,125 @@ class JacParser(Pass):
         JacParser.JacTransformer = Transformer[Tree[str], ast.AstNode]  # type: ignore
         logger.setLevel(logging.DEBUG)
 
-    comment_cache: list[jl.Token] = []
+    # comments found by the lexer, for the parse running on each thread
+    comments = threading.local()
 
     parser = jl.Lark_StandAlone(lexer_callbacks={"COMMENT": _comment_callback})  # type: ignore
     JacTransformer: TypeAlias = jl.Transformer[jl.Tree[str], ast.AstNode]
 
+    class FastParser:
+        """LALR driver building AST nodes in parser callbacks.
+
+        Runs the parse table and contextual lexer of the lark parser, but skips
+        its parse tree. Rule methods of TreeToAST are called on each reduction
+        and terminals become AST tokens when shifted, which is the order the
+        transformer visits them in a parse tree, so the same AST is built.
+        """
+
+        def __init__(self, parser: jl.Lark) -> None:
+            """Flatten parse table so actions are looked up by state and symbol."""
+            self.parser = parser
+            rule_ids = {
+                rule: idx
+                for idx, (rule, _) in enumerate(
+                    parser._parse_tree_builder.rule_builders
+                )
+            }
+            table = parser.parser.parser.parser.parse_table
+            self.parse_conf = jl.ParseConf(table, {}, "start")
+            # shift actions are the next state, reductions are
+            # (size of rule, index of rule callback, name of reduced symbol),
+            # names are plain strings as lark's Token.__eq__ is slow on lookup
+            self.states: dict[int, dict[str, int | tuple[int, int, str]]] = {
+                state: {
+                    str(sym): (
+                        arg
+                        if action is jl.Shift
+                        else (len(arg.expansion), rule_ids[arg], str(arg.origin.name))
+                    )
+                    for sym, (action, arg) in actions.items()
+                }
+                for state, actions in table.states.items()
+            }
+
+        def parse(self, text: str, builder: JacParser.TreeToAST) -> ast.AstNode:
+            """Parse text into the AST built by the builder callbacks."""
+            callbacks = list(
+                self.parser._parse_tree_builder.create_callback(builder).values()
+            )
+            to_token = builder.__default_token__
+            state_stack = [self.parse_conf.start_state]
+            value_stack: list = []
+            lexer = jl.LexerThread.from_text(self.parser.parser.lexer, text)
+            parser_state = jl.ParserState(
+                self.parse_conf, lexer, state_stack, value_stack
+            )
+            token = None
+            for token in lexer.lex(parser_state):
+                state_stack.append(
+                    self.feed(token, state_stack, value_stack, callbacks, parser_state)
+                )
+                value_stack.append(to_token(token))
+            end_token = (
+                jl.Token(
+                    "$END",
+                    "",
+                    token.start_pos,
+                    token.line,
+                    token.column,
+                    token.end_line,
+                    token.end_column,
+                    token.end_pos,
+                )
+                if token
+                else jl.Token("$END", "", 0, 1, 1)
+            )
+            self.feed(end_token, state_stack, value_stack, callbacks, parser_state)
+            return value_stack[-1]
+
+        def feed(
+            self,
+            token: jl.Token,
+            state_stack: list[int],
+            value_stack: list,
+            callbacks: list[Callable],
+            parser_state: jl.ParserState,
+        ) -> int:
+            """Apply the reductions due before token, return state to shift to."""
+            states = self.states
+            end_state = self.parse_conf.end_state
+            while True:
+                try:
+                    action = states[state_stack[-1]][token.type]
+                except KeyError:
+                    expected = {
+                        s for s in states[state_stack[-1]].keys() if s.isupper()
+                    }
+                    raise jl.UnexpectedToken(
+                        token, expected, state=parser_state, interactive_parser=None
+                    )
+                if isinstance(action, int):
+                    return action
+                size, rule_id, origin = action
+                if size:
+                    kid = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    kid = []
+                try:
+                    value = callbacks[rule_id](kid)
+                except jl.GrammarError:
+                    raise
+                except Exception as e:
+                    raise jl.VisitError(origin, kid, e)
+                state_stack.append(states[state_stack[-1]][origin])  # type: ignore
+                value_stack.append(value)
+                if token.type == "$END" and state_stack[-1] == end_state:
+                    return end_state
+
+    fast_parser: FastParser | None = None
+
     class TreeToAST(JacTransformer):
         """Transform parse tree to AST."""
 
@@ -141,7 +298,8 @@ class JacParser(Pass):
         def nu(self, node: ast.T) -> ast.T:
             """Update node."""
             self.parse_ref.cur_node = node
-            if node not in self.parse_ref.node_list:
+            if node not in self.parse_ref.node_set:
+                self.parse_ref.node_set.add(node)
                 self.parse_ref.node_list.append(node)
             return node
 
@@ -3971,42 +4129,46 @@ class JacParser(Pass):
             else:
                 raise self.ice()
 
+        # AST node type of each token type, tokens not in it are ast.Token
+        TOKEN_TYPES: dict[str, type[ast.Token]] = {
+            **dict.fromkeys(
+                [
+                    Tok.NAME.value,
+                    Tok.KWESC_NAME.value,
+                    Tok.KW_INIT.value,
+                    Tok.KW_POST_INIT.value,
+                    Tok.KW_ROOT.value,
+                    Tok.KW_SUPER.value,
+                    Tok.KW_SELF.value,
+                    Tok.KW_HERE.value,
+                ],
+                ast.Name,
+            ),
+            Tok.SEMI.value: ast.Semi,
+            Tok.NULL.value: ast.Null,
+            Tok.ELLIPSIS.value: ast.Ellipsis,
+            Tok.FLOAT.value: ast.Float,
+            **dict.fromkeys(
+                [Tok.INT.value, Tok.HEX.value, Tok.BIN.value, Tok.OCT.value], ast.Int
+            ),
+            **dict.fromkeys(
+                [
+                    Tok.STRING.value,
+                    Tok.FSTR_BESC.value,
+                    Tok.FSTR_PIECE.value,
+                    Tok.FSTR_SQ_PIECE.value,
+                    Tok.DOC_STRING.value,
+                ],
+                ast.String,
+            ),
+            Tok.BOOL.value: ast.Bool,
+        }
+
         def __default_token__(self, token: jl.Token) -> ast.Token:
             """Token handler."""
-            ret_type = ast.Token
-            if token.type in [Tok.NAME, Tok.KWESC_NAME]:
-                ret_type = ast.Name
-            if token.type in [
-                Tok.KW_INIT,
-                Tok.KW_POST_INIT,
-                Tok.KW_ROOT,
-                Tok.KW_SUPER,
-                Tok.KW_SELF,
-                Tok.KW_HERE,
-            ]:
-                ret_type = ast.Name
-            elif token.type == Tok.SEMI:
-                ret_type = ast.Semi
-            elif token.type == Tok.NULL:
-                ret_type = ast.Null
-            elif token.type == Tok.ELLIPSIS:
-                ret_type = ast.Ellipsis
-            elif token.type == Tok.FLOAT:
-                ret_type = ast.Float
-            elif token.type in [Tok.INT, Tok.INT, Tok.HEX, Tok.BIN, Tok.OCT]:
-                ret_type = ast.Int
-            elif token.type in [
-                Tok.STRING,
-                Tok.FSTR_BESC,
-                Tok.FSTR_PIECE,
-                Tok.FSTR_SQ_PIECE,
-                Tok.DOC_STRING,
-            ]:
-                ret_type = ast.String
-                if token.type == Tok.FSTR_BESC:
-                    token.value = token.value[1:]
-            elif token.type == Tok.BOOL:
-                ret_type = ast.Bool
+            ret_type = self.TOKEN_TYPES.get(token.type, ast.Token)
+            if token.type == Tok.FSTR_BESC:
+                token.value = token.value[1:]
             elif token.type == Tok.PYNLINE and isinstance(token.value, str):
                 token.value = token.value.replace("::py::", "")
             ret = ret_type(
@@ -4023,7 +4185,7 @@ class JacParser(Pass):
             if isinstance(ret, ast.Name):
                 if token.type == Tok.KWESC_NAME:
                     ret.is_kwesc = True
-                if ret.value in keyword.kwlist:
+                if keyword.iskeyword(ret.value):
                     err = jl.UnexpectedInput(f"Python keyword {ret.value} used as name")
                     err.line = ret.loc.first_line
                     err.column = ret.loc.col_start
@@ -1,7 +1,7 @@
 """Abstract class for IR Passes for Jac."""
 
 import time
-from typing import Optional, Type, TypeVar
+from typing import Any, Callable, ClassVar, Optional, Type, TypeVar
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes.transform import Transform
@@ -11,9 +11,36 @@ from jaclang.utils.helpers import pascal_to_snake
 T = TypeVar("T", bound=ast.AstNode)
 
 
+class HandlerTable(dict[type, Optional[Callable[[Any, Any], None]]]):
+    """Node type to `<prefix>_<node_type>` handler of a pass class, resolved once."""
+
+    def __init__(self, pass_cls: type, prefix: str) -> None:
+        """Initialize handler table."""
+        super().__init__()
+        self.pass_cls = pass_cls
+        self.prefix = prefix
+
+    def __missing__(self, node_type: type) -> Optional[Callable[[Any, Any], None]]:
+        """Resolve the handler of a node type seen for the first time."""
+        handler = getattr(
+            self.pass_cls, f"{self.prefix}_{pascal_to_snake(node_type.__name__)}", None
+        )
+        self[node_type] = handler
+        return handler
+
+
 class Pass(Transform[T]):
     """Abstract class for IR passes."""
 
+    enter_handlers: ClassVar[HandlerTable]
+    exit_handlers: ClassVar[HandlerTable]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Give each pass class its own handler tables."""
+        super().__init_subclass__(**kwargs)
+        cls.enter_handlers = HandlerTable(cls, "enter")
+        cls.exit_handlers = HandlerTable(cls, "exit")
+
     def __init__(self, input_ir: T, prior: Optional[Transform]) -> None:
         """Initialize parser."""
         self.term_signal = False
@@ -32,13 +59,13 @@ class Pass(Transform[T]):
 
     def enter_node(self, node: ast.AstNode) -> None:
         """Run on entering node."""
-        if hasattr(self, f"enter_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"enter_{pascal_to_snake(type(node).__name__)}")(node)
+        if handler := self.enter_handlers[type(node)]:
+            handler(self, node)
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Run on exiting node."""
-        if hasattr(self, f"exit_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"exit_{pascal_to_snake(type(node).__name__)}")(node)
+        if handler := self.exit_handlers[type(node)]:
+            handler(self, node)
 
     def terminate(self) -> None:
         """Terminate traversal."""
@@ -57,11 +84,8 @@ class Pass(Transform[T]):
         # Assumes pass built the sub node table
         if not node:
             return result
-        elif len(node._sub_node_tab):
-            if typ in node._sub_node_tab:
-                for i in node._sub_node_tab[typ]:
-                    if isinstance(i, typ):
-                        result.append(i)
+        elif node._sub_node_tab:
+            return node._sub_node_tab.get(typ)
         elif len(node.kid):
             if not brute_force:
                 raise ValueError(f"Node has no sub_node_tab. {node}")
@@ -154,6 +178,10 @@ class Pass(Transform[T]):
         )
 
 
+Pass.enter_handlers = HandlerTable(Pass, "enter")
+Pass.exit_handlers = HandlerTable(Pass, "exit")
+
+
 class PrinterPass(Pass):
     """Printer Pass for Jac AST."""
 
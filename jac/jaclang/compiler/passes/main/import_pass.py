@@ -6,14 +6,19 @@ symbols are available for matching.
 """
 
 import ast as py_ast
+import gc
 import os
 import pathlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes import Pass
 from jaclang.compiler.passes.main import SubNodeTabPass, SymTabBuildPass
+from jaclang.compiler.passes.transform import Alert
+from jaclang.compiler.py_raise_cache import raise_cached
 from jaclang.settings import settings
 from jaclang.utils.log import logging
 
@@ -21,12 +26,34 @@ from jaclang.utils.log import logging
 logger = logging.getLogger(__name__)
 
 
+def parse_jac_file(target: str) -> bytes:
+    """Parse a Jac file in a worker, return the pickled (ir, errors, warnings)."""
+    from jaclang.compiler.parser import JacParser
+
+    with open(target) as file:
+        source = ast.JacSource(file.read(), mod_path=target)
+    prse = JacParser(input_ir=source)
+    return pickle.dumps(
+        (prse.ir, prse.errors_had, prse.warnings_had), pickle.HIGHEST_PROTOCOL
+    )
+
+
+def init_parse_worker() -> None:
+    """Silence worker logs, alerts are logged once merged in import order."""
+    logging.disable(logging.CRITICAL)
+
+
 class JacImportPass(Pass):
     """Jac statically imports Jac modules."""
 
     def before_pass(self) -> None:
         """Run once before pass."""
         self.import_table: dict[str, ast.Module] = {}
+        # files parsed ahead by worker processes, consumed in import order
+        self.prefetched: dict[str, bytes | Exception] = {}
+        # started by the first round with files to parse ahead, reused by the
+        # next rounds of the compile
+        self.pool: Optional[ProcessPoolExecutor] = None
 
     def enter_module(self, node: ast.Module) -> None:
         """Run Importer."""
@@ -35,13 +62,24 @@ class JacImportPass(Pass):
         self.annex_impl(node)
         self.terminate()  # Turns off auto traversal for deliberate traversal
         self.run_again = True
-        while self.run_again:
-            self.run_again = False
-            all_imports = self.get_all_sub_nodes(node, ast.ModulePath)
-            for i in all_imports:
-                self.process_import(i)
-                self.enter_module_path(i)
-            SubNodeTabPass(prior=self, input_ir=node)
+        indexed = False
+        try:
+            while self.run_again:
+                self.run_again = False
+                all_imports = self.get_all_sub_nodes(node, ast.ModulePath)
+                if settings.compile_jobs > 1:
+                    self.prefetch(all_imports)
+                for i in all_imports:
+                    self.process_import(i)
+                    self.enter_module_path(i)
+                # the table is still current after a round that attached nothing
+                if self.run_again or not indexed:
+                    SubNodeTabPass(prior=self, input_ir=node)
+                    indexed = True
+        finally:
+            if self.pool:
+                self.pool.shutdown()
+                self.pool = None
 
         node.mod_deps.update(self.import_table)
 
@@ -70,8 +108,22 @@ class JacImportPass(Pass):
             self.error("Module has no path")
         if not node.loc.mod_path.endswith(".jac"):
             return
-        base_path = node.loc.mod_path[:-4]
-        directory = os.path.dirname(node.loc.mod_path)
+        for cur_file, is_test in self.annex_files(node.loc.mod_path):
+            mod = self.import_jac_mod_from_file(cur_file)
+            if mod and not is_test:
+                node.impl_mod.append(mod)
+                node.add_kids_left([mod], pos_update=False)
+                mod.parent = node
+            if mod and is_test and not settings.ignore_test_annex:
+                node.test_mod.append(mod)
+                node.add_kids_right([mod], pos_update=False)
+                mod.parent = node
+
+    @staticmethod
+    def annex_files(mod_path: str) -> list[tuple[str, bool]]:
+        """Get (path, is_test) of the impl and test files annexed by a module."""
+        base_path = mod_path[:-4]
+        directory = os.path.dirname(mod_path)
         if not directory:
             directory = os.getcwd()
             base_path = os.path.join(directory, base_path)
@@ -90,27 +142,96 @@ class JacImportPass(Pass):
                 os.path.join(test_folder, test_file)
                 for test_file in os.listdir(test_folder)
             ]
+        annexes: list[tuple[str, bool]] = []
         for cur_file in search_files:
-            if node.loc.mod_path.endswith(cur_file):
+            if mod_path.endswith(cur_file):
                 continue
             if (
                 cur_file.startswith(f"{base_path}.")
                 or impl_folder == os.path.dirname(cur_file)
             ) and cur_file.endswith(".impl.jac"):
-                mod = self.import_jac_mod_from_file(cur_file)
-                if mod:
-                    node.impl_mod.append(mod)
-                    node.add_kids_left([mod], pos_update=False)
-                    mod.parent = node
+                annexes.append((cur_file, False))
             if (
                 cur_file.startswith(f"{base_path}.")
                 or test_folder == os.path.dirname(cur_file)
             ) and cur_file.endswith(".test.jac"):
-                mod = self.import_jac_mod_from_file(cur_file)
-                if mod and not settings.ignore_test_annex:
-                    node.test_mod.append(mod)
-                    node.add_kids_right([mod], pos_update=False)
-                    mod.parent = node
+                annexes.append((cur_file, True))
+        return annexes
+
+    def import_targets(self, node: ast.ModulePath) -> list[str]:
+        """Get the Jac files an import will load, mirrors import_jac_module."""
+        imp_node = node.parent_of_type(ast.Import)
+        if not imp_node.is_jac or node.sub_module:
+            return []
+        target = node.resolve_relative_path()
+        if not os.path.isdir(target):
+            return [target]
+        targets = [os.path.join(target, "__init__.jac")]
+        if node == imp_node.from_loc:
+            for i in imp_node.items.items:
+                if isinstance(i, ast.ModuleItem):
+                    from_mod_target = node.resolve_relative_path(i.name.value)
+                    targets.append(
+                        os.path.join(from_mod_target, "__init__.jac")
+                        if os.path.isdir(from_mod_target)
+                        else from_mod_target
+                    )
+        return targets
+
+    def prefetch(self, imports: list[ast.ModulePath]) -> None:
+        """Parse the files this round of imports will load in a process pool.
+
+        Only parsing runs in the workers, alerts and sub node tables are
+        produced when each module is imported, so results and their order
+        don't depend on scheduling.
+        """
+        targets: dict[str, None] = {}
+        for i in imports:
+            for target in self.import_targets(i):
+                if target.endswith(".jac") and os.path.isfile(target):
+                    targets[target] = None
+                    targets.update(
+                        (annex, None) for annex, _ in self.annex_files(target)
+                    )
+        pending = [
+            target
+            for target in targets
+            if target not in self.import_table and target not in self.prefetched
+        ]
+        # a single file is parsed faster in process than sent to a worker
+        if len(pending) < 2:
+            return
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(
+                max_workers=settings.compile_jobs, initializer=init_parse_worker
+            )
+        futures = [self.pool.submit(parse_jac_file, target) for target in pending]
+        for target, future in zip(pending, futures):
+            try:
+                self.prefetched[target] = future.result()
+            except Exception as e:
+                self.prefetched[target] = e
+
+    def load_prefetched(
+        self, target: str
+    ) -> tuple[ast.AstNode, list[Alert], list[Alert]]:
+        """Load a module parsed by a worker as jac_file_to_pass would return it."""
+        parsed = self.prefetched.pop(target)
+        if isinstance(parsed, Exception):
+            raise parsed
+        gc.disable()  # unpickling allocates a whole tree
+        try:
+            ir, errors, warnings = pickle.loads(parsed)
+        finally:
+            gc.enable()
+        alrt: Alert
+        for alrt in errors:
+            logging.getLogger(alrt.from_pass.__name__).error(alrt.as_log())
+        for alrt in warnings:
+            logging.getLogger(alrt.from_pass.__name__).warning(alrt.as_log())
+        if not errors:
+            SubNodeTabPass(input_ir=ir, prior=None)
+        return ir, errors, warnings
 
     def enter_module_path(self, node: ast.ModulePath) -> None:
         """Sub objects.
@@ -178,10 +299,14 @@ class JacImportPass(Pass):
         if target in self.import_table:
             return self.import_table[target]
         try:
-            mod_pass = jac_file_to_pass(file_path=target, target=SubNodeTabPass)
-            self.errors_had += mod_pass.errors_had
-            self.warnings_had += mod_pass.warnings_had
-            mod = mod_pass.ir
+            if target in self.prefetched:
+                mod, errors, warnings = self.load_prefetched(target)
+            else:
+                mod_pass = jac_file_to_pass(file_path=target, target=SubNodeTabPass)
+                mod = mod_pass.ir
+                errors, warnings = mod_pass.errors_had, mod_pass.warnings_had
+            self.errors_had += errors
+            self.warnings_had += warnings
         except Exception as e:
             logger.info(e)
             mod = None
@@ -253,8 +378,6 @@ class PyImportPass(JacImportPass):
         mod_path: str,
     ) -> Optional[ast.Module]:
         """Import a module."""
-        from jaclang.compiler.passes.main import PyastBuildPass
-
         assert isinstance(self.ir, ast.Module)
 
         python_raise_map = self.ir.py_raise_map
@@ -278,15 +401,7 @@ class PyImportPass(JacImportPass):
                 if file_to_raise in self.import_table:
                     return self.import_table[file_to_raise]
 
-                with open(file_to_raise, "r", encoding="utf-8") as f:
-                    file_source = f.read()
-                    mod = PyastBuildPass(
-                        input_ir=ast.PythonModuleAst(
-                            py_ast.parse(file_source),
-                            orig_src=ast.JacSource(file_source, file_to_raise),
-                        ),
-                    ).ir
-                    SubNodeTabPass(input_ir=mod, prior=self)
+                mod = raise_cached(file_to_raise, "ast", self.raise_py_file)
                 if mod:
                     mod.name = imported_mod_name
                     self.import_table[file_to_raise] = mod
@@ -300,10 +415,30 @@ class PyImportPass(JacImportPass):
             raise e
         return None
 
-    def __load_builtins(self) -> None:
-        """Pyraise builtins to help with builtins auto complete."""
+    def raise_py_file(self, file_path: str) -> ast.Module:
+        """Raise a python file to a Jac module."""
         from jaclang.compiler.passes.main import PyastBuildPass
 
+        with open(file_path, "r", encoding="utf-8") as f:
+            file_source = f.read()
+        mod = PyastBuildPass(
+            input_ir=ast.PythonModuleAst(
+                py_ast.parse(file_source),
+                orig_src=ast.JacSource(file_source, file_path),
+            ),
+        ).ir
+        assert isinstance(mod, ast.Module)
+        SubNodeTabPass(input_ir=mod, prior=self)
+        return mod
+
+    def raise_builtins(self, file_path: str) -> ast.Module:
+        """Raise builtins along with their own symbol table."""
+        mod = self.raise_py_file(file_path)
+        SymTabBuildPass(input_ir=mod, prior=self)
+        return mod
+
+    def __load_builtins(self) -> None:
+        """Pyraise builtins to help with builtins auto complete."""
         assert isinstance(self.ir, ast.Module)
 
         file_to_raise = str(
@@ -314,18 +449,9 @@ class PyImportPass(JacImportPass):
             / "stdlib"
             / "builtins.pyi"
         )
-        with open(file_to_raise, "r", encoding="utf-8") as f:
-            file_source = f.read()
-            mod = PyastBuildPass(
-                input_ir=ast.PythonModuleAst(
-                    py_ast.parse(file_source),
-                    orig_src=ast.JacSource(file_source, file_to_raise),
-                ),
-            ).ir
-            mod.parent = self.ir
-            SubNodeTabPass(input_ir=mod, prior=self)
-            SymTabBuildPass(input_ir=mod, prior=self)
-            mod.parent = None
+        mod = raise_cached(file_to_raise, "sym_tab", self.raise_builtins)
+        mod.sym_tab.parent = self.ir.sym_tab
+        self.ir.sym_tab.kid.append(mod.sym_tab)
 
     def annex_impl(self, node: ast.Module) -> None:
         """Annex impl and test modules."""
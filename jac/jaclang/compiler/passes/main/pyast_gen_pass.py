@@ -19,6 +19,10 @@ T = TypeVar("T", bound=ast3.AST)
 class PyastGenPass(Pass):
     """Jac blue transpilation to python pass."""
 
+    # Link python nodes back to jac nodes and unparse module source, needed by
+    # PyJacAstLinkPass, type checking and tools but not to run the bytecode
+    link_jac: bool = True
+
     # TODO: This should live in utils and perhaps a test added using it
     # @staticmethod
     # def node_compilable_test(node: ast3.AST) -> None:
@@ -248,7 +252,8 @@ class PyastGenPass(Pass):
                     and (jac_node.loc.col_end > jac_node.loc.col_start)
                     else jac_node.loc.col_start
                 )
-                i.jac_link: list[ast3.AST] = [jac_node]  # type: ignore
+                if self.link_jac:
+                    i.jac_link: list[ast3.AST] = [jac_node]  # type: ignore
         return py_node
 
     def pyinline_sync(
@@ -263,7 +268,8 @@ class PyastGenPass(Pass):
                         i.lineno += self.cur_node.loc.first_line
                     if hasattr(i, "end_lineno") and i.end_lineno is not None:
                         i.end_lineno += self.cur_node.loc.first_line
-                    i.jac_link: ast3.AST = [self.cur_node]  # type: ignore
+                    if self.link_jac:
+                        i.jac_link: ast3.AST = [self.cur_node]  # type: ignore
         return py_nodes
 
     def resolve_stmt_block(
@@ -376,7 +382,8 @@ class PyastGenPass(Pass):
                 )
             )
         ]
-        node.gen.py = ast3.unparse(node.gen.py_ast[0])
+        if self.link_jac:
+            node.gen.py = ast3.unparse(node.gen.py_ast[0])
 
     def exit_global_vars(self, node: ast.GlobalVars) -> None:
         """Sub objects.
@@ -2390,7 +2397,7 @@ class PyastGenPass(Pass):
                                 else self.sync(ast3.Constant(value=None))
                             ),
                         ],
-                        keywords=[],
+                        keywords=self.gen_edge_type_kw(node.op.edge_spec),
                     )
                 )
             ]
@@ -3276,10 +3283,24 @@ class PyastGenPass(Pass):
                             value=self.sync(ast3.Constant(value=edges_only)),
                         )
                     ),
+                    *self.gen_edge_type_kw(node),
                 ],
             )
         )
 
+    def gen_edge_type_kw(self, node: ast.EdgeOpRef) -> list[ast3.keyword]:
+        """Generate edge_type hint so typed edge queries can use the edge index."""
+        if node.filter_cond and node.filter_cond.f_type:
+            return [
+                self.sync(
+                    ast3.keyword(
+                        arg="edge_type",
+                        value=node.filter_cond.f_type.gen.py_ast[0],
+                    )
+                )
+            ]
+        return []
+
     def exit_disconnect_op(self, node: ast.DisconnectOp) -> None:
         """Sub objects.
 
@@ -3847,3 +3868,9 @@ class PyastGenPass(Pass):
         pos_start: int,
         pos_end: int,
         """
+
+
+class LeanPyastGenPass(PyastGenPass):
+    """Jac to python ast pass producing only what is compiled to bytecode."""
+
+    link_jac = False
@@ -9,6 +9,12 @@ import os
 
 
 import jaclang.compiler.absyntree as ast
+from jaclang.compiler.build_cache import (
+    CacheKey,
+    get_cache_key,
+    read_entry,
+    write_entry,
+)
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.passes import Pass
 
@@ -40,13 +46,15 @@ class PyOutPass(Pass):
         ]
         for mod in mods:
             mod_path, out_path_py, out_path_pyc = self.get_output_targets(mod)
-            if os.path.exists(out_path_pyc) and os.path.getmtime(
-                out_path_pyc
-            ) > os.path.getmtime(mod_path):
-                continue
+            key = get_cache_key(mod, self.get_all_sub_nodes(mod, ast.Module))
+            entry = read_entry(out_path_pyc)
+            fresh = entry is not None and entry[0] == key
             try:
-                self.gen_python(mod, out_path=out_path_py)
-                self.dump_bytecode(mod, mod_path=mod_path, out_path=out_path_pyc)
+                # bytecode cached by a lean run comes without its Python source
+                if mod.gen.py and not (fresh and os.path.exists(out_path_py)):
+                    self.gen_python(mod, out_path=out_path_py)
+                if not fresh:
+                    self.dump_bytecode(mod, out_path=out_path_pyc, key=key)
             except Exception as e:
                 self.warning(f"Error in generating Python code: {e}", node)
         self.terminate()
@@ -56,11 +64,10 @@ class PyOutPass(Pass):
         with open(out_path, "w") as f:
             f.write(node.gen.py)
 
-    def dump_bytecode(self, node: ast.Module, mod_path: str, out_path: str) -> None:
-        """Generate Python."""
+    def dump_bytecode(self, node: ast.Module, out_path: str, key: CacheKey) -> None:
+        """Write bytecode along with its cache key."""
         if node.gen.py_bytecode:
-            with open(out_path, "wb") as f:
-                f.write(node.gen.py_bytecode)
+            write_entry(out_path, key, node.gen.py_bytecode)
         else:
             self.error(
                 f"Soemthing went wrong with {node.loc.mod_path} compilation.", node
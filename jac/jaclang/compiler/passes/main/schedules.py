@@ -13,7 +13,7 @@ from .def_impl_match_pass import DeclImplMatchPass  # noqa: I100
 from .def_use_pass import DefUsePass  # noqa: I100
 from .pyout_pass import PyOutPass  # noqa: I100
 from .pybc_gen_pass import PyBytecodeGenPass  # noqa: I100
-from .pyast_gen_pass import PyastGenPass  # noqa: I100
+from .pyast_gen_pass import LeanPyastGenPass, PyastGenPass  # noqa: I100
 from .pyjac_ast_link_pass import PyJacAstLinkPass  # noqa: I100
 from .type_check_pass import JacTypeCheckPass  # noqa: I100
 from .fuse_typeinfo_pass import FuseTypeInfoPass  # noqa: I100
@@ -33,6 +33,18 @@ py_code_gen = [
     PyBytecodeGenPass,
 ]
 
+# Only what is needed to run the bytecode, no jac/python links or python source
+py_code_gen_lean = [
+    SubNodeTabPass,
+    JacImportPass,
+    SymTabBuildPass,
+    DeclImplMatchPass,
+    DefUsePass,
+    RegistryPass,
+    LeanPyastGenPass,
+    PyBytecodeGenPass,
+]
+
 type_checker_sched = [
     JacTypeCheckPass,
     PyCollectDepsPass,
@@ -3,34 +3,85 @@
 This pass builds a table of subnodes for each node in the AST. This is used
 for fast lookup of nodes of a certain type in the AST. This is just a utility
 pass and is not required for any other pass to work.
+
+The table is shared by the whole tree the pass runs on. It holds every node in
+post-order along with the positions of each node type, and the descendants of a
+node are the contiguous range of positions right before its own, so looking up
+sub nodes of a type is a range query on a single sorted list.
 """
 
-from copy import copy
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import NamedTuple, Type, TypeVar
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes import Pass
 
+T = TypeVar("T", bound=ast.AstNode)
+
+
+class SubNodeTab:
+    """Nodes of a tree in post-order and the positions of each node type."""
+
+    __slots__ = ("nodes", "positions")
+
+    def __init__(self) -> None:
+        """Initialize sub node table."""
+        self.nodes: list[ast.AstNode] = []
+        self.positions: dict[type, list[int]] = {}
+
+    def add(self, node: ast.AstNode) -> int:
+        """Add the next node in post-order, return its position."""
+        pos = len(self.nodes)
+        self.nodes.append(node)
+        if (positions := self.positions.get(type(node))) is not None:
+            positions.append(pos)
+        else:
+            self.positions[type(node)] = [pos]
+        return pos
+
+    def get(self, typ: Type[T], start: int, end: int) -> list[T]:
+        """Get nodes of type within [start, end) in post-order."""
+        positions = self.positions.get(typ)
+        if not positions:
+            return []
+        nodes = self.nodes
+        return [
+            nodes[i]  # type: ignore[misc]
+            for i in positions[
+                bisect_left(positions, start) : bisect_left(positions, end)
+            ]
+        ]
+
+
+class SubNodeRange(NamedTuple):
+    """Range of positions the descendants of a node take in a sub node table."""
+
+    tab: SubNodeTab
+    start: int
+    end: int
+
+    def get(self, typ: Type[T]) -> list[T]:
+        """Get descendants of type."""
+        return self.tab.get(typ, self.start, self.end)
+
 
 class SubNodeTabPass(Pass):
     """AST Enrichment Pass for basic high level semantics."""
 
+    def before_pass(self) -> None:
+        """Start a new table for the tree."""
+        self.tab = SubNodeTab()
+        self.starts: list[int] = []
+
     def enter_node(self, node: ast.AstNode) -> None:
         """Table builder."""
         super().enter_node(node)
-        node._sub_node_tab = {}  # clears on entry
+        self.starts.append(len(self.tab.nodes))
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Table builder."""
         super().exit_node(node)
-        for i in node.kid:
-            if not i:
-                continue
-            for k, v in i._sub_node_tab.items():
-                if k in node._sub_node_tab:
-                    node._sub_node_tab[k].extend(v)
-                else:
-                    node._sub_node_tab[k] = copy(v)
-            if type(i) in node._sub_node_tab:
-                node._sub_node_tab[type(i)].append(i)
-            else:
-                node._sub_node_tab[type(i)] = [i]
+        start = self.starts.pop()
+        node._sub_node_tab = SubNodeRange(self.tab, start, self.tab.add(node))
@@ -1,15 +1,22 @@
 """Test pass module."""
 
 import io
+import os
 import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
 
 import jaclang.compiler.absyntree as ast
 from jaclang.cli import cli
+from jaclang.compiler import py_raise_cache
 from jaclang.compiler.compile import jac_file_to_pass
-from jaclang.compiler.passes.main import JacImportPass
+from jaclang.compiler.passes.main import JacImportPass, import_pass
 from jaclang.compiler.passes.main.fuse_typeinfo_pass import FuseTypeInfoPass
-from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+from jaclang.compiler.passes.main.schedules import py_code_gen, py_code_gen_typed
+from jaclang.compiler.py_raise_cache import CACHE_DIR
+from jaclang.settings import settings
 from jaclang.utils.test import TestCase
 
 
@@ -125,3 +132,94 @@ class ImportPassPassTests(TestCase):
         self.assertIn("foo", stdout_value)
         self.assertIn("bar", stdout_value)
         self.assertIn("baz", stdout_value)
+
+    def test_parallel_import(self) -> None:
+        """Test parsing imports in worker processes gives the same result."""
+        results = []
+        for jobs in (1, 4):
+            settings.compile_jobs = jobs
+            try:
+                state = jac_file_to_pass(
+                    self.fixture_abs_path("incautoimpl.jac"), schedule=py_code_gen
+                )
+            finally:
+                settings.compile_jobs = 1
+            results.append(
+                (
+                    [i.loc.mod_path for i in state.ir.get_all_sub_nodes(ast.Module)],
+                    [str(i) for i in state.errors_had],
+                    [str(i) for i in state.warnings_had],
+                    state.ir.gen.py,
+                )
+            )
+        self.assertEqual(len(results[0][0]), 5)
+        self.assertEqual(results[0], results[1])
+
+    def test_parallel_import_pool(self) -> None:
+        """Test one worker pool parses the imports of every round of a compile."""
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, source in [
+                ("main", "import:jac one;\nimport:jac two;\n"),
+                ("one", "import:jac three;\nimport:jac four;\n"),
+                ("two", "glob b = 2;\n"),
+                ("three", "glob c = 3;\n"),
+                ("four", "glob d = 4;\n"),
+            ]:
+                with open(os.path.join(tmp, f"{name}.jac"), "w") as f:
+                    f.write(source)
+            settings.compile_jobs = 2
+            try:
+                with mock.patch.object(
+                    import_pass, "ProcessPoolExecutor", wraps=ProcessPoolExecutor
+                ) as pools:
+                    state = jac_file_to_pass(
+                        os.path.join(tmp, "main.jac"), JacImportPass
+                    )
+            finally:
+                settings.compile_jobs = 1
+        self.assertFalse(state.errors_had)
+        self.assertEqual(len(state.ir.get_all_sub_nodes(ast.Module)), 4)
+        self.assertEqual(pools.call_count, 1)
+        self.assertEqual(len(state.prefetched), 0)
+
+    def test_py_raise_cache(self) -> None:
+        """Test raised python modules are cached but never shared."""
+        py_raise_cache.clear()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            py_raise_cache.CACHE_DIR = cache_dir
+            settings.py_raise_cache = True
+            try:
+                states, files = [], []
+                for run in range(3):
+                    if run == 2:
+                        # a new process only finds raised modules on disk
+                        py_raise_cache.clear()
+                    states.append(
+                        jac_file_to_pass(
+                            self.fixture_abs_path("py_imp_test.jac"),
+                            schedule=py_code_gen_typed,
+                        )
+                    )
+                    files.append(sorted(os.listdir(cache_dir)))
+                self.assertTrue(files[0])
+                self.assertEqual(files[1], files[0])
+                self.assertEqual(files[2], files[0])
+            finally:
+                settings.py_raise_cache = False
+                py_raise_cache.CACHE_DIR = CACHE_DIR
+        raised = [
+            [i for i in state.ir.get_all_sub_nodes(ast.Module) if i.is_raised_from_py]
+            for state in states
+        ]
+        self.assertTrue(raised[0])
+        self.assertEqual(
+            [i.loc.mod_path for i in raised[0]], [i.loc.mod_path for i in raised[2]]
+        )
+        self.assertTrue(set(raised[0]).isdisjoint(raised[1]))
+        builtins = [state.ir.sym_tab.find_scope("builtins") for state in states]
+        self.assertIsNot(builtins[0], builtins[1])
+        for state, tab in zip(states, builtins):
+            assert tab
+            self.assertIs(tab.parent, state.ir.sym_tab)
+            self.assertIsNotNone(tab.lookup("print"))
+            self.assertEqual(state.ir.gen.py, states[0].ir.gen.py)
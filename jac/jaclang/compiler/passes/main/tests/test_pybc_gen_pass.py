@@ -2,7 +2,9 @@
 
 import marshal
 
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_file_to_pass
+from jaclang.compiler.passes.main.schedules import py_code_gen, py_code_gen_lean
 from jaclang.utils.test import TestCase
 
 
@@ -23,3 +25,26 @@ class PyBytecodeGenPassTests(TestCase):
             self.assertTrue(True)
         except ValueError:
             self.fail("Invalid bytecode generated")
+
+    def test_lean_bcgen(self) -> None:
+        """Test lean code gen compiles the same bytecode without debug info."""
+        full = jac_file_to_pass(
+            file_path=self.fixture_abs_path("game1.jac"),
+            schedule=py_code_gen,
+        )
+        lean = jac_file_to_pass(
+            file_path=self.fixture_abs_path("game1.jac"),
+            schedule=py_code_gen_lean,
+        )
+        full_mods = [full.ir, *full.ir.get_all_sub_nodes(ast.Module)]
+        lean_mods = [lean.ir, *lean.ir.get_all_sub_nodes(ast.Module)]
+        self.assertEqual(len(full_mods), len(lean_mods))
+        for full_mod, lean_mod in zip(full_mods, lean_mods):
+            self.assertEqual(
+                marshal.loads(full_mod.gen.py_bytecode),
+                marshal.loads(lean_mod.gen.py_bytecode),
+            )
+            self.assertNotEqual(full_mod.gen.py, "")
+            self.assertEqual(lean_mod.gen.py, "")
+            self.assertTrue(hasattr(full_mod.gen.py_ast[0], "jac_link"))
+            self.assertFalse(hasattr(lean_mod.gen.py_ast[0], "jac_link"))
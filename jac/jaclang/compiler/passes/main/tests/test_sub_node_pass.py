@@ -1,7 +1,8 @@
 """Test sub node pass module."""
 
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_file_to_pass
-from jaclang.compiler.passes.main import SubNodeTabPass
+from jaclang.compiler.passes.main import SubNodeTabPass, SymTabBuildPass
 from jaclang.utils.test import TestCase
 
 
@@ -18,8 +19,39 @@ class SubNodePassTests(TestCase):
             file_path=self.examples_abs_path("manual_code/circle.jac"),
             target=SubNodeTabPass,
         )
+        tab = code_gen.ir._sub_node_tab
+        assert tab
+        self.assertIs(tab.tab.nodes[tab.end], code_gen.ir)
         for i in code_gen.ir.kid[1].kid:
-            for k, v in i._sub_node_tab.items():
-                for n in v:
-                    self.assertIn(n, code_gen.get_all_sub_nodes(i, k, brute_force=True))
+            assert i._sub_node_tab
+            self.assertIs(i._sub_node_tab.tab, tab.tab)
+            walked = [n for n in self.walk(i) if n is not i]
+            for k in {type(n) for n in walked}:
+                self.assertEqual(
+                    code_gen.get_all_sub_nodes(i, k),
+                    [n for n in walked if type(n) is k],
+                )
         self.assertFalse(code_gen.errors_had)
+
+    def walk(self, node: ast.AstNode) -> list[ast.AstNode]:
+        """Get nodes of a tree in post-order."""
+        return [n for i in node.kid for n in self.walk(i)] + [node]
+
+    def test_handler_tables(self) -> None:
+        """Test handlers are resolved once per pass class and node type."""
+        jac_file_to_pass(
+            file_path=self.examples_abs_path("manual_code/circle.jac"),
+            target=SymTabBuildPass,
+        )
+        tables = SymTabBuildPass.enter_handlers, SymTabBuildPass.exit_handlers
+        self.assertIs(tables[0][ast.Module], SymTabBuildPass.enter_module)
+        self.assertIs(tables[1][ast.Module], SymTabBuildPass.exit_module)
+        self.assertIsNone(SubNodeTabPass.enter_handlers[ast.Module])
+        self.assertIsNot(SubNodeTabPass.enter_handlers, tables[0])
+
+        class Visited(SymTabBuildPass):
+            def enter_module(self, node: ast.Module) -> None:
+                self.visited = True
+
+        self.assertIs(Visited.enter_handlers[ast.Module], Visited.enter_module)
+        self.assertIs(tables[0][ast.Module], SymTabBuildPass.enter_module)
@@ -1,5 +1,6 @@
 """Test pass module."""
 
+import os
 from typing import List
 
 from jaclang.compiler.compile import jac_file_to_pass
@@ -62,3 +63,40 @@ class MypyTypeCheckPassTests(TestCase):
         self.assertEqual(out.count("Type: builtins.str"), 35)
         for i in lis:
             self.assertNotIn(i, out)
+
+    def test_type_check_session_reuse(self) -> None:
+        """Test rechecking in a session gives the results of a fresh check."""
+        from jaclang.compiler.passes.main import type_check_pass as tcp
+
+        def check() -> tuple[list[str], dict[str, str]]:
+            type_checked = jac_file_to_pass(
+                file_path=self.fixture_abs_path("func.jac"),
+                schedule=py_code_gen_typed,
+            )
+            return (
+                sorted(f"{i.loc} {i.msg}" for i in type_checked.warnings_had),
+                type_checked.ir.py_mod_dep_map,
+            )
+
+        tcp.sessions.clear()
+        fresh = check()
+        session = tcp.sessions[os.path.dirname(self.fixture_abs_path("func.jac"))]
+        library = dict(session.graph)
+        self.assertIn("builtins", library)
+        self.assertEqual(check(), fresh)
+        self.assertIs(tcp.get_session(session.options.mypy_path[0]), session)
+        for name, state in library.items():
+            self.assertIs(session.graph[name], state)
+
+    def test_type_check_session_affected(self) -> None:
+        """Test importers are rechecked only for dependencies with their full id."""
+        from types import SimpleNamespace
+
+        from jaclang.compiler.passes.main import type_check_pass as tcp
+
+        session = tcp.TypeCheckSession()
+        for name, deps in [("app", ["util"]), ("pkg", ["other.util"]), ("util", [])]:
+            state = SimpleNamespace(dependencies=deps, suppressed=[])
+            session.checked[name] = tcp.CheckedModule(name, state, [], [])
+        digests = {"app": "app", "pkg": "pkg", "util": "changed"}
+        self.assertEqual(session.affected(digests), {"util", "app"})
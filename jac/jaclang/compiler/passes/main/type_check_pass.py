@@ -2,63 +2,70 @@
 
 This is used to call mypy type checking into Jac files by integrating
 mypy apis into Jac and use jac py ast in it.
+
+Mypy's build manager and graph are kept alive between runs in a session per
+search path, so library modules are loaded once per process and Jac modules
+whose generated python AST is unchanged are not checked again.
 """
 
+import ast as py_ast
 import os
 import pathlib
 import sys
+from hashlib import md5
+from typing import Any, NamedTuple
 
 import jaclang.compiler.absyntree as ast
 import jaclang.compiler.passes.utils.mypy_ast_build as myab
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.passes import Pass
 
+MYPY_PATH = (
+    pathlib.Path(os.path.dirname(__file__)).parent.parent.parent / "vendor" / "mypy"
+)
 
-class JacTypeCheckPass(Pass):
-    """Python and bytecode file printing pass."""
 
-    def before_pass(self) -> None:
-        """Before pass."""
-        self.__path = (
-            pathlib.Path(os.path.dirname(__file__)).parent.parent.parent
-            / "vendor"
-            / "mypy"
-        )
-        self.__modules: list[ast.Module] = []
-        return super().before_pass()
+def is_checked_module(name: str) -> bool:
+    """Check if a mypy module is part of what Jac type checks."""
+    return name.startswith("jaclang.plugin") or not (
+        name.startswith("jaclang.") or name.startswith("mypy.")
+    )
 
-    def enter_module(self, node: ast.Module) -> None:
-        """Call mypy checks on module level only."""
-        self.__modules.append(node)
 
-    def after_pass(self) -> None:
-        """Call mypy api after traversing all the modules."""
-        try:
-            self.api(os.path.dirname(self.ir.loc.mod_path))
-        except Exception as e:
-            self.error(f"Unable to run type checking: {e}")
-        return super().after_pass()
+def py_ast_digest(tree: py_ast.AST) -> str:
+    """Hash a python AST along with the source locations of its nodes."""
+    return md5(py_ast.dump(tree, include_attributes=True).encode()).hexdigest()
 
-    def default_message_cb(
-        self, filename: str | None, new_messages: list[str], is_serious: bool
-    ) -> None:
-        """Mypy errors reporter."""
 
-    def api(self, top_module_path: str = "") -> None:
-        """Call mypy APIs to implement type checking in Jac."""
-        # Creating mypy api objects
+class CheckedModule(NamedTuple):
+    """Jac module checked by an earlier run of a session."""
+
+    digest: str
+    state: myab.myb.State
+    # (position of python node in ast.walk order, mypy node) for relinking
+    links: list[tuple[int, Any]]
+    reported: list[tuple[tuple[int, int | None, int | None, int | None], str]]
+
+
+class TypeCheckSession:
+    """Mypy build manager and graph kept alive between type checking runs."""
+
+    def __init__(self, top_module_path: str = "") -> None:
+        """Initialize mypy api objects."""
         options = myab.myb.Options()
         options.ignore_missing_imports = True
         options.cache_dir = Con.JAC_MYPY_CACHE
         if top_module_path != "":
             options.mypy_path.append(top_module_path)
 
-        errors = myab.Errors(self, options)
-        fs_cache = myab.FileSystemCache()
-        search_paths = myab.compute_search_paths([], options, str(self.__path))
+        errors = myab.Errors(None, options)
+        search_paths = myab.compute_search_paths([], options, str(MYPY_PATH))
         plugin, snapshot = myab.load_plugins(options, errors, sys.stdout, [])
 
-        manager = myab.BuildManager(
+        self.options = options
+        # the manager's errors, typed as the Jac reporting subclass
+        self.errors = errors
+        self.manager = myab.BuildManager(
             data_dir=".",
             search_paths=search_paths,
             ignore_prefix=os.getcwd(),
@@ -70,21 +77,84 @@ class JacTypeCheckPass(Pass):
             plugins_snapshot=snapshot,
             errors=errors,
             flush_errors=self.default_message_cb,
-            fscache=fs_cache,
+            fscache=myab.FileSystemCache(),
             stdout=sys.stdout,
             stderr=sys.stderr,
         )
+        # library modules processed so far and the mtimes of their files
+        self.graph: myab.Graph = {}
+        self.mtimes: dict[str, float] = {}
+        self.checked: dict[str, CheckedModule] = {}
+
+    def default_message_cb(
+        self, filename: str | None, new_messages: list[str], is_serious: bool
+    ) -> None:
+        """Mypy errors reporter."""
+
+    def is_stale(self) -> bool:
+        """Check if any library module loaded by the session changed on disk."""
+        for path, mtime in self.mtimes.items():
+            try:
+                if os.stat(path).st_mtime != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def affected(self, digests: dict[str, str]) -> set[str]:
+        """Get Jac modules to check, changed ones and the ones importing them."""
+        stale = {
+            name
+            for name, digest in digests.items()
+            if name not in self.checked or self.checked[name].digest != digest
+        }
+        grown = True
+        while grown:
+            grown = False
+            for name, checked in self.checked.items():
+                if name in digests and name not in stale:
+                    # mypy looks dependencies up in the graph by their full id
+                    deps = checked.state.dependencies + checked.state.suppressed
+                    if any(dep in stale for dep in deps):
+                        stale.add(name)
+                        grown = True
+        return stale
+
+    def check(self, cur_pass: Pass, modules: list[ast.Module]) -> myab.Graph:
+        """Type check modules, return the graph of modules checked by Jac."""
+        manager = self.manager
+        self.errors.reset()
+        self.errors.cur_pass = cur_pass
+        manager.fscache.flush()
+        myab.mypy_to_jac_node_map.clear()
+
+        trees = {module.name: module.gen.py_ast[0] for module in modules}
+        digests = {name: py_ast_digest(tree) for name, tree in trees.items()}
+        stale = self.affected(digests)
+        for name in list(self.checked):
+            if name not in digests or name in stale:
+                del self.checked[name]
+                manager.modules.pop(name, None)
+                manager.ast_cache.pop(name, None)
 
-        mypy_graph: myab.Graph = {}
-        new_modules = []
-        for module in self.__modules:
-            tree = myab.ASTConverter(
-                options=options,
+        mypy_graph: myab.Graph = dict(self.graph)
+        new_modules: list[myab.State] = []
+        converters: dict[str, myab.ASTConverter] = {}
+        for module in modules:
+            if module.name not in stale:
+                nodes = list(py_ast.walk(trees[module.name]))
+                for pos, mypy_node in self.checked[module.name].links:
+                    myab.link_mypy_to_jac_node(nodes[pos], mypy_node)
+                mypy_graph[module.name] = self.checked[module.name].state
+                continue
+            converter = myab.ASTConverter(
+                options=self.options,
                 is_stub=False,
-                errors=errors,
+                errors=manager.errors,
                 strip_function_bodies=False,
                 path=module.loc.mod_path,
-            ).visit(module.gen.py_ast[0])
+            )
+            tree = converter.visit(module.gen.py_ast[0])
 
             st = myab.State(
                 id=module.name,
@@ -96,32 +166,128 @@ class JacTypeCheckPass(Pass):
             )
             mypy_graph[module.name] = st
             new_modules.append(st)
+            converters[module.name] = converter
 
-        if not isinstance(self.ir, ast.Module):
-            raise self.ice("Expected module node. Impossible")
         mypy_graph = myab.load_graph(
-            [
-                myab.BuildSource(
-                    path=str(self.__path / "typeshed" / "stdlib" / "builtins.pyi"),
-                    module="builtins",
-                ),
-            ],
+            (
+                []
+                if self.graph
+                else [
+                    myab.BuildSource(
+                        path=str(MYPY_PATH / "typeshed" / "stdlib" / "builtins.pyi"),
+                        module="builtins",
+                    )
+                ]
+            ),
             manager,
             old_graph=mypy_graph,
             new_modules=new_modules,  # To parse the dependancies of modules
         )
-        mypy_graph = {
-            k: v
-            for k, v in mypy_graph.items()
-            if (
-                k.startswith("jaclang.plugin")
-                or not (k.startswith("jaclang.") or k.startswith("mypy."))
+        to_process = {st.id: st for st in new_modules if is_checked_module(st.id)}
+        if to_process:
+            myab.process_graph(myab.ProcessGraph(to_process, mypy_graph), manager)
+
+        for name, checked in self.checked.items():
+            if name in digests:
+                for key, message in checked.reported:
+                    self.errors.report_to_jac(key, message)
+        reported = self.errors.reported
+        for name, converter in converters.items():
+            state = mypy_graph[name]
+            positions = {
+                id(node): pos for pos, node in enumerate(py_ast.walk(trees[name]))
+            }
+            self.checked[name] = CheckedModule(
+                digest=digests[name],
+                state=state,
+                links=[(positions[id(node)], ret) for node, ret in converter.links],
+                reported=reported.get(state.xpath, []),
             )
+        for name, state in mypy_graph.items():
+            if (
+                name not in digests
+                and state.tree
+                and manager.modules.get(name) is state.tree
+            ):
+                self.graph[name] = state
+                if state.path and state.path not in self.mtimes:
+                    self.mtimes[state.path] = os.stat(state.path).st_mtime
+        self.errors.cur_pass = None
+        reached = self.reachable(mypy_graph, ["builtins", *digests])
+        # Jac modules come first like in a fresh graph, so the paths of the ones
+        # imported by others are not replaced by lookups of their names
+        return {
+            k: mypy_graph[k]
+            for k in dict.fromkeys([*digests, *reached])
+            if is_checked_module(k)
         }
+
+    @staticmethod
+    def reachable(mypy_graph: myab.Graph, roots: list[str]) -> list[str]:
+        """Get modules reachable from roots the way load_graph follows them."""
+        seen: dict[str, None] = {}
+        todo = [i for i in roots if i in mypy_graph]
+        while todo:
+            st = mypy_graph[todo.pop()]
+            if st.id in seen:
+                continue
+            seen[st.id] = None
+            deps = [
+                dep
+                for dep in st.dependencies
+                if st.priorities.get(dep) != myab.PRI_INDIRECT
+                and "jaclang.vendor" not in dep
+            ]
+            for dep in (st.ancestors or []) + deps + st.suppressed:
+                if dep in mypy_graph and dep not in seen:
+                    todo.append(dep)
+        return list(seen)
+
+
+# type checking sessions by the path of the top module being checked
+sessions: dict[str, TypeCheckSession] = {}
+
+
+def get_session(top_module_path: str = "") -> TypeCheckSession:
+    """Get the type checking session of a path, starting over if it is stale."""
+    session = sessions.get(top_module_path)
+    if session is None or session.is_stale():
+        session = sessions[top_module_path] = TypeCheckSession(top_module_path)
+    return session
+
+
+class JacTypeCheckPass(Pass):
+    """Python and bytecode file printing pass."""
+
+    def before_pass(self) -> None:
+        """Before pass."""
+        self.__modules: list[ast.Module] = []
+        return super().before_pass()
+
+    def enter_module(self, node: ast.Module) -> None:
+        """Call mypy checks on module level only."""
+        self.__modules.append(node)
+
+    def after_pass(self) -> None:
+        """Call mypy api after traversing all the modules."""
+        top_module_path = os.path.dirname(self.ir.loc.mod_path)
+        try:
+            self.api(top_module_path)
+        except Exception as e:
+            # build state may be half updated, don't reuse it
+            sessions.pop(top_module_path, None)
+            self.error(f"Unable to run type checking: {e}")
+        return super().after_pass()
+
+    def api(self, top_module_path: str = "") -> None:
+        """Call mypy APIs to implement type checking in Jac."""
+        if not isinstance(self.ir, ast.Module):
+            raise self.ice("Expected module node. Impossible")
+        session = get_session(top_module_path)
+        mypy_graph = session.check(self, self.__modules)
         for i in mypy_graph:
             self.ir.py_mod_dep_map[i] = mypy_graph[i].xpath
             for j in mypy_graph[i].dependencies:
                 self.ir.py_mod_dep_map[j] = str(
-                    myab.find_module_with_reason(j, manager)
+                    myab.find_module_with_reason(j, session.manager)
                 )
-        myab.process_graph(mypy_graph, manager)
@@ -0,0 +1,172 @@
+"""Profiler of compiler passes.
+
+While a PassProfiler is active, every pass run records its time, the number
+of nodes it visited, the time its enter and exit handlers took per node type
+and the peak of memory traced by tracemalloc while it ran.
+
+Times are self times: a pass run from inside another one (e.g. an imported
+module parsed by the import pass) counts towards its own time, not the time
+of the outer pass or of the handler that started it.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jaclang.compiler.absyntree import AstNode
+    from jaclang.compiler.passes.transform import Transform
+
+
+class PassStats:
+    """Profile of all the runs of a pass class."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize pass stats."""
+        self.name = name
+        self.runs = 0
+        self.seconds = 0.0
+        self.visits = 0
+        self.peak_bytes = 0
+        # node type -> [enter seconds, exit seconds, visits]
+        self.nodes: dict[str, list[float]] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get stats as plain data."""
+        return {
+            "name": self.name,
+            "runs": self.runs,
+            "seconds": self.seconds,
+            "visits": self.visits,
+            "peak_bytes": self.peak_bytes,
+            "nodes": {
+                name: {"enter": enter, "exit": leave, "visits": int(visits)}
+                for name, (enter, leave, visits) in self.nodes.items()
+            },
+        }
+
+
+class PassProfiler:
+    """Collects pass stats while active."""
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        """Initialize profiler."""
+        self.trace_memory = trace_memory
+        self.passes: dict[str, PassStats] = {}
+        # seconds of nested passes and handlers, excluded from the outer ones
+        self.nested_pass = 0.0
+        self.nested_handler = 0.0
+        # highest traced memory seen by nested passes
+        self.peak = 0
+
+    def __enter__(self) -> PassProfiler:
+        """Start profiling passes."""
+        global active
+        active = self
+        if self.trace_memory:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop profiling passes."""
+        global active
+        active = None
+        if self.trace_memory:
+            tracemalloc.stop()
+
+    def run(self, transform: Transform, ir: AstNode) -> AstNode:
+        """Run a pass, recording its stats."""
+        name = type(transform).__name__
+        stats = self.passes.get(name)
+        if stats is None:
+            stats = self.passes[name] = PassStats(name)
+        if hasattr(transform, "enter_node"):
+            for slot, attr in enumerate(("enter_node", "exit_node")):
+                handler = self.timed(stats, getattr(transform, attr), slot)
+                setattr(transform, attr, handler)
+
+        outer_pass, outer_handler = self.nested_pass, self.nested_handler
+        self.nested_pass = self.nested_handler = 0.0
+        if self.trace_memory:
+            start_bytes, peak = tracemalloc.get_traced_memory()
+            outer_peak = max(self.peak, peak)
+            self.peak = 0
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            return transform.transform(ir=ir)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.runs += 1
+            stats.seconds += elapsed - self.nested_pass
+            self.nested_pass = outer_pass + elapsed
+            self.nested_handler = outer_handler + elapsed
+            if self.trace_memory:
+                peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+                stats.peak_bytes = max(stats.peak_bytes, peak - start_bytes)
+                self.peak = max(outer_peak, peak)
+
+    def timed(
+        self, stats: PassStats, handler: Callable[[AstNode], None], slot: int
+    ) -> Callable[[AstNode], None]:
+        """Wrap enter or exit node of a pass to record time per node type."""
+
+        def run_handler(node: AstNode) -> None:
+            outer = self.nested_handler
+            self.nested_handler = 0.0
+            start = time.perf_counter()
+            try:
+                handler(node)
+            finally:
+                elapsed = time.perf_counter() - start
+                times = stats.nodes.get(type(node).__name__)
+                if times is None:
+                    times = stats.nodes[type(node).__name__] = [0.0, 0.0, 0]
+                times[slot] += elapsed - self.nested_handler
+                if not slot:
+                    times[2] += 1
+                    stats.visits += 1
+                self.nested_handler = outer + elapsed
+
+        return run_handler
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get profile as plain data."""
+        return {"passes": [stats.as_dict() for stats in self.passes.values()]}
+
+    def dump(self, path: str) -> None:
+        """Write profile as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def table(self, top: int = 3) -> str:
+        """Get profile as a table, with the slowest node types of each pass."""
+        lines = [
+            f"{'pass':<24}{'runs':>6}{'time (s)':>10}{'visits':>10}"
+            + (f"{'peak (MiB)':>12}" if self.trace_memory else "")
+        ]
+        for stats in self.passes.values():
+            lines.append(
+                f"{stats.name:<24}{stats.runs:>6}{stats.seconds:>10.3f}"
+                f"{stats.visits:>10}"
+                + (f"{stats.peak_bytes / 2**20:>12.1f}" if self.trace_memory else "")
+            )
+            slowest = sorted(
+                stats.nodes.items(), key=lambda i: i[1][0] + i[1][1], reverse=True
+            )
+            for name, (enter, leave, visits) in slowest[:top]:
+                if enter + leave >= 0.0005:
+                    lines.append(
+                        f"  {name:<22}{'':>6}{enter + leave:>10.3f}{int(visits):>10}"
+                        f"  (enter {enter:.3f}, exit {leave:.3f})"
+                    )
+        total = sum(stats.seconds for stats in self.passes.values())
+        lines.append(f"{'total':<24}{'':>6}{total:>10.3f}")
+        return "\n".join(lines)
+
+
+# profiler passes report to, if any
+active: Optional[PassProfiler] = None
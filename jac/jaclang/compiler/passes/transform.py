@@ -7,6 +7,7 @@ from typing import Generic, Optional, Type
 
 from jaclang.compiler.absyntree import AstNode, T
 from jaclang.compiler.codeloc import CodeLocInfo
+from jaclang.compiler.passes import profiler
 from jaclang.utils.helpers import pretty_print_source_location
 from jaclang.utils.log import logging
 
@@ -68,7 +69,11 @@ class Transform(ABC, Generic[T]):
         self.errors_had: list[Alert] = [] if not prior else prior.errors_had
         self.warnings_had: list[Alert] = [] if not prior else prior.warnings_had
         self.cur_node: AstNode = input_ir  # tracks current node during traversal
-        self.ir = self.transform(ir=input_ir)
+        self.ir = (
+            profiler.active.run(self, input_ir)
+            if profiler.active
+            else self.transform(ir=input_ir)
+        )
 
     @abstractmethod
     def transform(self, ir: T) -> AstNode:
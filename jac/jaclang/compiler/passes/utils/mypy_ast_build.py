@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import ast
 import os
-from typing import Callable, TYPE_CHECKING, TextIO
+from typing import Callable, Mapping, TYPE_CHECKING, TextIO
 
 from jaclang.compiler.absyntree import AstNode
 from jaclang.compiler.passes import Pass
@@ -663,9 +663,26 @@ class State(myb.State):
         manager.ast_cache[self.id] = (self.tree, self.early_errors)
 
 
+def link_mypy_to_jac_node(node: ast.AST, ret: myfp.Any) -> None:  # noqa: ANN401
+    """Link mypy AST node to the Jac AST nodes of a python AST node."""
+    if hasattr(node, "jac_link"):
+        for i in range(len(node.jac_link)):
+            node.jac_link[i].gen.mypy_ast.append(ret)
+        mypy_to_jac_node_map[(ret.line, ret.column, ret.end_line, ret.end_column)] = (
+            node.jac_link
+        )
+    # else:
+    #     raise Exception("AST node not linked to Jac node")
+
+
 class ASTConverter(myfp.ASTConverter):
     """Overrides to mypy AST converter for direct AST pass through."""
 
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        """Override to mypy AST converter to keep the links it makes."""
+        super().__init__(*args, **kwargs)
+        self.links: list[tuple[ast.AST, myfp.Any]] = []
+
     def visit(self, node: ast.AST | None) -> myfp.Any:  # noqa: ANN401
         """Override to mypy AST converter for direct AST pass through."""
         ret = super().visit(node)
@@ -691,23 +708,28 @@ class ASTConverter(myfp.ASTConverter):
     ) -> None:
         """Link mypy AST node to Jac AST node."""
         if hasattr(node, "jac_link"):
-            for i in range(len(node.jac_link)):
-                node.jac_link[i].gen.mypy_ast.append(ret)
-            mypy_to_jac_node_map[
-                (ret.line, ret.column, ret.end_line, ret.end_column)
-            ] = node.jac_link
-        # else:
-        #     raise Exception("AST node not linked to Jac node")
+            self.links.append((node, ret))
+            link_mypy_to_jac_node(node, ret)
 
 
 class Errors(mye.Errors):
     """Overrides to mypy errors for direct AST pass through."""
 
-    def __init__(self, cur_pass: Pass, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    def __init__(
+        self, cur_pass: Pass | None, *args, **kwargs  # noqa: ANN002, ANN003
+    ) -> None:
         """Override to mypy errors for direct AST pass through."""
         self.cur_pass = cur_pass
         super().__init__(*args, **kwargs)
 
+    def initialize(self) -> None:
+        """Override to mypy errors to also forget reported messages."""
+        super().initialize()
+        # file -> (location, message) of everything reported in it
+        self.reported: dict[
+            str, list[tuple[tuple[int, int | None, int | None, int | None], str]]
+        ] = {}
+
     def report(
         self,
         line: int,
@@ -741,15 +763,37 @@ class Errors(mye.Errors):
             end_line=end_line,
             end_column=end_column,
         )
-        if (line, column, end_line, end_column) in mypy_to_jac_node_map:
+        key = (line, column, end_line, end_column)
+        self.reported.setdefault(file or self.file, []).append((key, message))
+        self.report_to_jac(key, message)
+
+    def report_to_jac(
+        self, key: tuple[int, int | None, int | None, int | None], message: str
+    ) -> None:
+        """Report a message as a warning on the Jac node at its location."""
+        if self.cur_pass and key in mypy_to_jac_node_map:
             self.cur_pass.warning(
-                msg=message,
-                node_override=mypy_to_jac_node_map[
-                    (line, column, end_line, end_column)
-                ][0],
+                msg=message, node_override=mypy_to_jac_node_map[key][0]
             )
 
 
+class ProcessGraph(dict[str, myb.State]):
+    """Graph of modules to process, other modules are looked up in a full graph.
+
+    Lets a run process only its new modules while mypy still finds the ones
+    processed by earlier runs (builtins in particular) when it needs them.
+    """
+
+    def __init__(self, states: Mapping[str, myb.State], full_graph: Graph) -> None:
+        """Initialize graph."""
+        super().__init__(states)
+        self.full_graph = full_graph
+
+    def __missing__(self, id: str) -> myb.State:
+        """Look up a module processed by an earlier run."""
+        return self.full_graph[id]
+
+
 def load_graph(
     sources: list[BuildSource],
     manager: BuildManager,
@@ -923,6 +967,7 @@ def load_graph(
 
 
 __all__ = [
+    "PRI_INDIRECT",
     "BuildManager",
     "State",
     "BuildSource",
@@ -931,10 +976,12 @@ __all__ = [
     "find_module_with_reason",
     "compute_search_paths",
     "load_graph",
+    "ProcessGraph",
     "load_plugins",
     "process_graph",
     "Errors",
     "Options",
     "ASTConverter",
+    "link_mypy_to_jac_node",
     "semantic_analysis_for_scc",
 ]
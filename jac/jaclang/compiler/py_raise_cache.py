@@ -0,0 +1,103 @@
+"""Process wide cache of Python modules raised to Jac ASTs.
+
+Raising a stub such as typeshed's builtins.pyi means parsing it and running it
+through PyastBuildPass and friends, which costs far more than unpickling the
+result. Raised modules are kept pickled per process (and, with the
+`py_raise_cache` setting, on disk) keyed by the compiler version, the stub path
+and the stub content, which pins them to the typeshed version they came from.
+Every lookup unpickles a fresh copy, so passes are free to mutate what they get.
+"""
+
+import gc
+import os
+import pickle
+from hashlib import md5
+from typing import Callable, Optional
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.build_cache import file_hash, get_compiler_version
+from jaclang.settings import settings
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".jaclang", "py_raise_cache")
+
+# (file path, stage) -> (cache key, pickled module)
+_raised: dict[tuple[str, str], tuple[str, bytes]] = {}
+
+
+def get_cache_key(file_path: str, stage: str) -> Optional[str]:
+    """Get the key of a raised module, None if the file can't be read."""
+    digest = file_hash(file_path)
+    if digest is None:
+        return None
+    key = f"{get_compiler_version()}:{stage}:{file_path}:{digest}"
+    return md5(key.encode()).hexdigest()
+
+
+def read_blob(key: str) -> Optional[bytes]:
+    """Read a pickled module from disk, None if missing."""
+    try:
+        with open(os.path.join(CACHE_DIR, f"{key}.pickle"), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def write_blob(key: str, blob: bytes) -> None:
+    """Write a pickled module to disk, replacing it atomically."""
+    path = os.path.join(CACHE_DIR, f"{key}.pickle")
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(f"{path}.{os.getpid()}", "wb") as f:
+            f.write(blob)
+        os.replace(f"{path}.{os.getpid()}", path)
+    except OSError:
+        pass
+
+
+def load_blob(blob: bytes) -> Optional[ast.Module]:
+    """Unpickle a raised module, None if the blob is unusable."""
+    gc.disable()  # unpickling allocates a whole tree
+    try:
+        mod = pickle.loads(blob)
+    except Exception:
+        return None
+    finally:
+        gc.enable()
+    return mod if isinstance(mod, ast.Module) else None
+
+
+def raise_cached(
+    file_path: str, stage: str, build: Callable[[str], ast.Module]
+) -> ast.Module:
+    """Get a fresh copy of a raised module, building it with `build` on a miss.
+
+    `stage` names what `build` runs on the module, modules raised for different
+    stages are cached apart.
+    """
+    key = get_cache_key(file_path, stage)
+    if key is None:
+        return build(file_path)
+    cached = _raised.get((file_path, stage))
+    if cached and cached[0] == key and (mod := load_blob(cached[1])):
+        return mod
+    if (
+        settings.py_raise_cache
+        and (blob := read_blob(key))
+        and (mod := load_blob(blob))
+    ):
+        _raised[file_path, stage] = key, blob
+        return mod
+    mod = build(file_path)
+    try:
+        blob = pickle.dumps(mod, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, RecursionError, TypeError):
+        return mod
+    _raised[file_path, stage] = key, blob
+    if settings.py_raise_cache:
+        write_blob(key, blob)
+    return mod
+
+
+def clear() -> None:
+    """Drop raised modules cached in this process."""
+    _raised.clear()
@@ -1,11 +1,13 @@
 """Tests for Jac parser."""
 
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 
 from jaclang.compiler import jac_lark as jl
-from jaclang.compiler.absyntree import JacSource
+from jaclang.compiler.absyntree import JacSource, Test
 from jaclang.compiler.constant import Tokens
 from jaclang.compiler.parser import JacParser
+from jaclang.settings import settings
 from jaclang.utils.test import TestCaseMicroSuite
 
 
@@ -24,11 +26,27 @@ class TestLarkParser(TestCaseMicroSuite):
 
     def micro_suite_test(self, filename: str) -> None:
         """Parse micro jac file."""
+        test_count = Test.TEST_COUNT
         prse = JacParser(
             input_ir=JacSource(self.file_to_str(filename), mod_path=filename),
         )
         self.assertFalse(prse.errors_had)
 
+        # parsing through a lark parse tree must build the same AST
+        Test.TEST_COUNT, fast_parser = test_count, settings.fast_parser
+        settings.fast_parser = not fast_parser
+        try:
+            other = JacParser(
+                input_ir=JacSource(self.file_to_str(filename), mod_path=filename),
+            )
+        finally:
+            settings.fast_parser = fast_parser
+        self.assertEqual(prse.ir.pp(), other.ir.pp())
+        self.assertEqual(
+            [(type(i), i.loc.pos_start, i.loc.pos_end) for i in prse.ir._in_mod_nodes],
+            [(type(i), i.loc.pos_start, i.loc.pos_end) for i in other.ir._in_mod_nodes],
+        )
+
     def test_parser_fam(self) -> None:
         """Parse micro jac file."""
         prse = JacParser(input_ir=JacSource(self.load_fixture("fam.jac"), mod_path=""))
@@ -60,6 +78,23 @@ class TestLarkParser(TestCaseMicroSuite):
         )
         self.assertFalse(prse.errors_had)
 
+    def test_parse_on_threads(self) -> None:
+        """Test parses on several threads keep their own comments."""
+        sources = [
+            "\n".join(f"# comment {i} {j}\nglob x{j} = {j};" for j in range(200))
+            for i in range(8)
+        ]
+
+        def comments(source: str) -> list[str]:
+            prse = JacParser(input_ir=JacSource(source, mod_path=""))
+            self.assertFalse(prse.errors_had)
+            return [i.value for i in prse.source.comments]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            found = list(pool.map(comments, sources))
+        self.assertEqual(found, [comments(i) for i in sources])
+        self.assertEqual(found[3][5], "# comment 3 5")
+
     def test_enum_matches_lark_toks(self) -> None:
         """Test that enum stays synced with lexer."""
         tokens = [x.name for x in jl.Lark_StandAlone().parser.lexer_conf.terminals]
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Optional
+from typing import Any, Callable, Iterable, Iterator, MutableMapping, Optional
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_str_to_pass
@@ -14,24 +16,35 @@ from jaclang.compiler.parser import JacParser
 from jaclang.compiler.passes import Pass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
 from jaclang.compiler.passes.tool import FuseCommentsPass, JacFormatPass
+from jaclang.compiler.symtable import Symbol
+from jaclang.langserve.incremental import IncrementalParser
 from jaclang.langserve.sem_manager import SemTokManager
 from jaclang.langserve.utils import (
+    SymbolNodeIndex,
     add_unique_text_edit,
     collect_all_symbols_in_scope,
     collect_child_tabs,
     create_range,
-    find_deepest_symbol_node_at_pos,
-    find_index,
     gen_diagnostics,
     get_location_range,
     get_symbols_for_outline,
     parse_symbol_path,
 )
+from jaclang.langserve.workspace_index import (
+    Span,
+    WorkspaceIndex,
+    symbol_key,
+    to_location,
+)
+from jaclang.settings import settings
 from jaclang.vendor.pygls import uris
 from jaclang.vendor.pygls.server import LanguageServer
 
 import lsprotocol.types as lspt
 
+# if a check passed and its diagnostics by uri
+CheckResult = tuple[bool, dict[str, list[lspt.Diagnostic]]]
+
 
 class ModuleInfo:
     """Module IR and Stats."""
@@ -45,7 +58,9 @@ class ModuleInfo:
         self.ir = ir
         self.impl_parent: Optional[ModuleInfo] = impl_parent
         self.sem_manager = SemTokManager(ir=ir)
+        self.node_index = SymbolNodeIndex(ir)
         self.is_modified: bool = False
+        self.lines = ir.source.value.count("\n") + 1
 
     @property
     def uri(self) -> str:
@@ -53,15 +68,126 @@ class ModuleInfo:
         return uris.from_fs_path(self.ir.loc.mod_path)
 
 
+class ModuleCache(MutableMapping[str, ModuleInfo]):
+    """Module infos by uri, bounded by the lines of source they were built from.
+
+    Once the limit is exceeded, modules of closed documents without unsaved
+    changes are evicted, least recently used first. They are rebuilt by the
+    next deep check that needs them, through the module that imported them
+    if there was one. Checks trim the cache on the worker thread while
+    requests read it on the event loop, so entries are guarded by a lock.
+    """
+
+    def __init__(self, is_open: Callable[[str], bool]) -> None:
+        """Initialize cache."""
+        self.is_open = is_open
+        self.entries: OrderedDict[str, ModuleInfo] = OrderedDict()
+        self.lock = threading.Lock()
+        self.lines = 0
+        # uri of an evicted module -> uri of the module that imported it
+        self.evicted_parents: dict[str, str] = {}
+        self.hits = self.misses = self.evictions = self.rebuilds = 0
+
+    def __getitem__(self, uri: str) -> ModuleInfo:
+        """Get module info, marking it as recently used."""
+        with self.lock:
+            if uri not in self.entries:
+                self.misses += 1
+                raise KeyError(uri)
+            self.hits += 1
+            self.entries.move_to_end(uri)
+            return self.entries[uri]
+
+    def __setitem__(self, uri: str, info: ModuleInfo) -> None:
+        """Set module info."""
+        with self.lock:
+            if uri in self.entries:
+                self.lines -= self.entries[uri].lines
+            elif uri in self.evicted_parents:
+                del self.evicted_parents[uri]
+                self.rebuilds += 1
+            self.entries[uri] = info
+            self.entries.move_to_end(uri)
+            self.lines += info.lines
+
+    def __delitem__(self, uri: str) -> None:
+        """Delete module info."""
+        with self.lock:
+            self.lines -= self.entries.pop(uri).lines
+
+    def __contains__(self, uri: object) -> bool:
+        """Check for module info without marking it as used."""
+        return uri in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over uris, least recently used first."""
+        with self.lock:
+            return iter(list(self.entries))
+
+    def __len__(self) -> int:
+        """Count module infos."""
+        return len(self.entries)
+
+    def parent_uri(self, uri: str) -> Optional[str]:
+        """Get the uri of the module a module was built through, if any."""
+        with self.lock:
+            if uri in self.entries and (parent := self.entries[uri].impl_parent):
+                return parent.uri
+            return self.evicted_parents.get(uri)
+
+    def trim(self, keep: Iterable[Optional[str]] = ()) -> None:
+        """Evict module infos until within the limit, never those to keep."""
+        with self.lock:
+            for uri in list(self.entries):
+                if self.lines <= settings.lsp_module_cache_lines:
+                    break
+                info = self.entries[uri]
+                if uri in keep or info.is_modified or self.is_open(uri):
+                    continue
+                if info.impl_parent:
+                    self.evicted_parents[uri] = info.impl_parent.uri
+                self.lines -= self.entries.pop(uri).lines
+                self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self.lock:
+            open_count = sum(1 for i in self.entries if self.is_open(i))
+        return {
+            "modules": len(self.entries),
+            "open": open_count,
+            "lines": self.lines,
+            "max_lines": settings.lsp_module_cache_lines,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "rebuilds": self.rebuilds,
+        }
+
+
 class JacLangServer(LanguageServer):
     """Class for managing workspace."""
 
+    # seconds a document has to stay unchanged before it is checked
+    quick_check_delay = 0.3
+    deep_check_delay = 0.1
+
     def __init__(self) -> None:
         """Initialize workspace."""
         super().__init__("jac-lsp", "v0.1")
-        self.modules: dict[str, ModuleInfo] = {}
-        self.executor = ThreadPoolExecutor()
+        self.modules = ModuleCache(lambda uri: uri in self.workspace.text_documents)
+        self.parsers: dict[str, IncrementalParser] = {}
+        self.index = WorkspaceIndex()
+        # the compiler keeps state on classes (import caches, type check
+        # sessions), so deep checks and indexing run one at a time, in order,
+        # off the event loop. Quick checks and formatting only parse, which
+        # is safe alongside them, so they do not wait behind them.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.parse_executor = ThreadPoolExecutor(max_workers=1)
         self.tasks: dict[str, asyncio.Task] = {}
+        self.quick_tasks: dict[str, asyncio.Task] = {}
+        # document version of the deep check diagnostics last published
+        self.deep_checked: dict[str, Optional[int]] = {}
 
     def update_modules(
         self, file_path: str, build: Pass, refresh: bool = False
@@ -70,10 +196,12 @@ class JacLangServer(LanguageServer):
         if not isinstance(build.ir, ast.Module):
             self.log_error("Error with module build.")
             return
-        keep_parent = (
-            self.modules[file_path].impl_parent if file_path in self.modules else None
+        old = self.modules.get(file_path)
+        self.modules[file_path] = ModuleInfo(
+            ir=build.ir, impl_parent=old.impl_parent if old else None
         )
-        self.modules[file_path] = ModuleInfo(ir=build.ir, impl_parent=keep_parent)
+        # changes made while the module was checked still need a deep check
+        self.modules[file_path].is_modified = old.is_modified if old else False
         for p in build.ir.mod_deps.keys():
             uri = uris.from_fs_path(p)
             if file_path != uri:
@@ -84,90 +212,188 @@ class JacLangServer(LanguageServer):
 
     def quick_check(self, file_path: str) -> bool:
         """Rebuild a file."""
+        passed, diagnostics = self.run_quick_check(file_path)
+        self.publish_all(diagnostics)
+        return passed
+
+    def deep_check(self, file_path: str, annex_view: Optional[str] = None) -> bool:
+        """Rebuild a file and its dependencies."""
+        passed, diagnostics = self.run_deep_check(file_path, annex_view)
+        self.publish_all(diagnostics)
+        return passed
+
+    def run_quick_check(self, file_path: str) -> CheckResult:
+        """Rebuild a file, return if it passed and diagnostics by uri."""
         try:
             document = self.workspace.get_text_document(file_path)
-            build = jac_str_to_pass(
-                jac_str=document.source, file_path=document.path, schedule=[]
-            )
-            self.publish_diagnostics(
-                file_path,
-                gen_diagnostics(file_path, build.errors_had, build.warnings_had),
-            )
-            return len(build.errors_had) == 0
+            if (parser := self.parsers.get(file_path)) is None:
+                parser = self.parsers[file_path] = IncrementalParser(file_path)
+            passed, diagnostics = parser.check(document.source)
+            return passed, {file_path: diagnostics}
         except Exception as e:
             self.log_error(f"Error during syntax check: {e}")
-            return False
+            return False, {}
 
-    def deep_check(self, file_path: str, annex_view: Optional[str] = None) -> bool:
-        """Rebuild a file and its dependencies."""
+    def run_deep_check(
+        self, file_path: str, annex_view: Optional[str] = None
+    ) -> CheckResult:
+        """Rebuild a file and its dependencies, return diagnostics by uri."""
         try:
             start_time = time.time()
             document = self.workspace.get_text_document(file_path)
-            if file_path in self.modules and (
-                parent := self.modules[file_path].impl_parent
-            ):
-                return self.deep_check(
-                    uris.from_fs_path(parent.ir.loc.mod_path), annex_view=file_path
-                )
+            if parent := self.modules.parent_uri(file_path):
+                return self.run_deep_check(parent, annex_view=file_path)
             build = jac_str_to_pass(
                 jac_str=document.source,
                 file_path=document.path,
                 schedule=py_code_gen_typed,
             )
             self.update_modules(file_path, build)
+            self.modules.trim(keep=(file_path, annex_view))
+            if isinstance(build.ir, ast.Module):
+                self.index.index_module(build.ir)
             if discover := self.modules[file_path].ir.annexable_by:
-                return self.deep_check(
+                return self.run_deep_check(
                     uris.from_fs_path(discover), annex_view=file_path
                 )
 
-            self.publish_diagnostics(
-                annex_view if annex_view else file_path,
-                gen_diagnostics(
+            diagnostics = {
+                annex_view if annex_view else file_path: gen_diagnostics(
                     annex_view if annex_view else file_path,
                     build.errors_had,
                     build.warnings_had,
-                ),
-            )
+                )
+            }
             if annex_view:
-                self.publish_diagnostics(
+                diagnostics[file_path] = gen_diagnostics(
                     file_path,
-                    gen_diagnostics(
-                        file_path,
-                        build.errors_had,
-                        build.warnings_had,
-                    ),
+                    build.errors_had,
+                    build.warnings_had,
                 )
             self.log_py(f"PROFILE: Deep check took {time.time() - start_time} seconds.")
-            return len(build.errors_had) == 0
+            return len(build.errors_had) == 0, diagnostics
         except Exception as e:
             self.log_error(f"Error during deep check: {e}")
-            return False
+            return False, {}
+
+    def publish_all(
+        self,
+        diagnostics: dict[str, list[lspt.Diagnostic]],
+        uri: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> None:
+        """Publish diagnostics by uri, those of uri for the given version."""
+        for path, items in diagnostics.items():
+            self.publish_diagnostics(path, items, version if path == uri else None)
+
+    async def launch_quick_check(self, uri: str) -> bool:
+        """Analyze and publish diagnostics once a document stops changing."""
+        return await self.schedule_check(
+            self.quick_tasks, uri, self.run_quick_check, self.quick_check_delay
+        )
 
-    async def launch_quick_check(self, uri: str) -> None:
-        """Analyze and publish diagnostics."""
-        await asyncio.get_event_loop().run_in_executor(
-            self.executor, self.quick_check, uri
+    async def launch_deep_check(self, uri: str) -> bool:
+        """Analyze and publish diagnostics of a document and its dependencies."""
+        # a deep check reports syntax errors too, pending quick checks are moot
+        self.cancel_check(self.quick_tasks, uri)
+        return await self.schedule_check(
+            self.tasks, uri, self.run_deep_check, self.deep_check_delay, deep=True
         )
 
-    async def launch_deep_check(self, uri: str) -> None:
-        """Analyze and publish diagnostics."""
-
-        async def run_in_executor(
-            func: Callable[[str, Optional[str]], bool],
-            file_path: str,
-            annex_view: Optional[str] = None,
-        ) -> None:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(self.executor, func, file_path, annex_view)
-
-        if uri in self.tasks and not self.tasks[uri].done():
-            self.log_py(f"Canceling {uri} deep check...")
-            self.tasks[uri].cancel()
-            del self.tasks[uri]
+    def cancel_check(self, tasks: dict[str, asyncio.Task], uri: str) -> None:
+        """Cancel the check of a document, if scheduled or running."""
+        if uri in tasks and not tasks[uri].done():
+            self.log_py(f"Canceling {uri} check...")
+            tasks[uri].cancel()
+        tasks.pop(uri, None)
+
+    async def schedule_check(
+        self,
+        tasks: dict[str, asyncio.Task],
+        uri: str,
+        check: Callable[[str], CheckResult],
+        delay: float,
+        deep: bool = False,
+    ) -> bool:
+        """Run a check after a delay, superseding the previous one of its kind.
+
+        Returns if the check passed, False if it was superseded.
+        """
+        self.cancel_check(tasks, uri)
+        task = asyncio.create_task(self.run_check(uri, check, delay, deep))
+        tasks[uri] = task
+        try:
+            return await task
+        except asyncio.CancelledError:
+            return False
+        finally:
+            if tasks.get(uri) is task:
+                del tasks[uri]
+
+    async def run_check(
+        self,
+        uri: str,
+        check: Callable[[str], CheckResult],
+        delay: float,
+        deep: bool,
+    ) -> bool:
+        """Run a check in its executor, publish its diagnostics if still current."""
+        await asyncio.sleep(delay)
         self.log_py(f"Analyzing {uri}...")
-        task = asyncio.create_task(run_in_executor(self.deep_check, uri))
-        self.tasks[uri] = task
-        await task
+        version = self.workspace.get_text_document(uri).version
+        # cancelling while queued drops the check, once started it runs on and
+        # its diagnostics are discarded
+        passed, diagnostics = await asyncio.get_running_loop().run_in_executor(
+            self.executor if deep else self.parse_executor, check, uri
+        )
+        if self.workspace.get_text_document(uri).version != version or (
+            not deep and self.deep_checked.get(uri, -1) == version
+        ):
+            # the document changed since, or a deep check of this version
+            # already reported more than a quick check can
+            self.log_py(f"Discarding outdated diagnostics of {uri}.")
+            return passed
+        if deep:
+            self.deep_checked[uri] = version
+        self.publish_all(diagnostics, uri, version)
+        return passed
+
+    def index_file(self, file_path: str) -> None:
+        """Index a file of the workspace."""
+        try:
+            self.index.index_file(file_path)
+        except Exception as e:
+            self.log_py(f"Error while indexing {file_path}: {e}")
+
+    async def launch_index_files(self, file_paths: list[str]) -> None:
+        """Index files in the compiler worker, one at a time after deep checks."""
+        loop = asyncio.get_running_loop()
+        for file_path in file_paths:
+            # scheduled deep checks go first, so they wait for at most the
+            # file being indexed
+            while self.tasks:
+                await asyncio.wait(list(self.tasks.values()))
+            await loop.run_in_executor(self.executor, self.index_file, file_path)
+
+    async def launch_index_workspace(self) -> None:
+        """Index the Jac files of the workspace, up to the configured limit."""
+        if not (root := self.workspace.root_path):
+            return
+        start_time = time.time()
+        file_paths = await asyncio.get_running_loop().run_in_executor(
+            None, self.index.find_files, root
+        )
+        if len(file_paths) > settings.lsp_index_max_files:
+            self.log_py(
+                f"Indexing {settings.lsp_index_max_files} of the "
+                f"{len(file_paths)} files of the workspace."
+            )
+            file_paths = file_paths[: settings.lsp_index_max_files]
+        await self.launch_index_files(file_paths)
+        self.log_py(
+            f"PROFILE: Indexing {len(file_paths)} files took "
+            f"{time.time() - start_time} seconds."
+        )
 
     def get_completion(
         self, file_path: str, position: lspt.Position, completion_trigger: Optional[str]
@@ -181,8 +407,7 @@ class JacLangServer(LanguageServer):
         builtin_tab = mod_ir.sym_tab.kid[-1]
         completion_items = []
 
-        node_selected = find_deepest_symbol_node_at_pos(
-            mod_ir,
+        node_selected = self.modules[file_path].node_index.find_deepest(
             position.line,
             position.character - 2,
         )
@@ -281,11 +506,22 @@ class JacLangServer(LanguageServer):
         if old_path in self.modules and new_path != old_path:
             self.modules[new_path] = self.modules[old_path]
             del self.modules[old_path]
+        self.parsers.pop(old_path, None)
+        self.index.remove(uris.to_fs_path(old_path))
 
     def delete_module(self, uri: str) -> None:
         """Delete module."""
         if uri in self.modules:
             del self.modules[uri]
+        self.modules.evicted_parents.pop(uri, None)
+        self.parsers.pop(uri, None)
+        self.index.remove(uris.to_fs_path(uri))
+
+    async def launch_formatting(self, file_path: str) -> list[lspt.TextEdit]:
+        """Format a document in the parse worker."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.parse_executor, self.formatted_jac, file_path
+        )
 
     def formatted_jac(self, file_path: str) -> list[lspt.TextEdit]:
         """Return formatted jac."""
@@ -323,10 +559,8 @@ class JacLangServer(LanguageServer):
         """Return hover information for a file."""
         if file_path not in self.modules:
             return None
-        token_index = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        token_index = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if token_index is None:
             return None
@@ -378,10 +612,8 @@ class JacLangServer(LanguageServer):
         """Return definition location for a file."""
         if file_path not in self.modules:
             return None
-        token_index = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        token_index = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if token_index is None:
             return None
@@ -467,10 +699,8 @@ class JacLangServer(LanguageServer):
         """Return references for a file."""
         if file_path not in self.modules:
             return []
-        index1 = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        index1 = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if index1 is None:
             return []
@@ -483,19 +713,47 @@ class JacLangServer(LanguageServer):
                 )
                 for node in node_selected.sym.uses
             ]
-            return list_of_references
+            return list_of_references + [
+                to_location(path, span)
+                for path, span in self.get_indexed_uses(
+                    node_selected, node_selected.sym
+                )
+            ]
         return []
 
+    def get_indexed_uses(
+        self, node: ast.AstSymbolNode, sym: Symbol, with_defs: bool = False
+    ) -> list[tuple[str, Span]]:
+        """Return indexed uses of a symbol outside the module graph of a node.
+
+        Symbol links found by checking the module graph the node was built in
+        are more precise than the index, so the index only adds what lies
+        outside of it. Modules it shares with other graphs may have been
+        cached from those, so they do not tell which files it covers.
+        """
+        root: ast.AstNode = node
+        while root.parent:
+            root = root.parent
+        # paths of the root, its imports and annexed modules
+        graph = root.mod_deps if isinstance(root, ast.Module) else {}
+        key = symbol_key(sym)
+        found = self.index.find_uses(key)
+        if with_defs:
+            found = found + self.index.find_defs(key)
+        return [(path, span) for path, span in found if path not in graph]
+
+    def get_workspace_symbols(self, query: str) -> list[lspt.SymbolInformation]:
+        """Return symbols of the workspace matching a query."""
+        return self.index.find_symbols(query)
+
     def rename_symbol(
         self, file_path: str, position: lspt.Position, new_name: str
     ) -> Optional[lspt.WorkspaceEdit]:
         """Rename a symbol in a file."""
         if file_path not in self.modules:
             return None
-        index1 = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        index1 = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if index1 is None:
             return None
@@ -512,6 +770,15 @@ class JacLangServer(LanguageServer):
                     new_text=new_name,
                 )
                 add_unique_text_edit(changes, key, new_edit)
+            for path, span in self.get_indexed_uses(
+                node_selected, node_selected.sym, True
+            ):
+                location = to_location(path, span)
+                add_unique_text_edit(
+                    changes,
+                    location.uri,
+                    lspt.TextEdit(range=location.range, new_text=new_name),
+                )
             return lspt.WorkspaceEdit(changes=changes)
         return None
 
@@ -0,0 +1,146 @@
+"""Incremental syntax checking of Jac documents.
+
+A document is split into its top level elements (architypes, abilities,
+impls, imports, ...) and each element is parsed on its own, after the element
+before it so the lexer sees it in the same state as in the whole document.
+Diagnostics are kept per element text, relative to the first line of the
+element, so after an edit only the changed elements and the ones right after
+them are parsed again, wherever they moved in the document.
+"""
+
+from __future__ import annotations
+
+import re
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.parser import JacParser
+from jaclang.langserve.utils import gen_diagnostics
+from jaclang.vendor.pygls import uris
+
+import lsprotocol.types as lspt
+
+# comments and text the lexer matches as one token (inline python, doc
+# strings and strings, as in jac.lark), f-string starts, brackets, semicolons,
+# lines that may start a top level element and anything else
+CODE = re.compile(
+    r"(?P<comment>#\*(?:.|\n|\r)*?\*#|#.*)"
+    r"|(?P<opaque>::py::(?:.|\n|\r)*?::py::"
+    r'|"""(?:.|\n|\r)*?"""'
+    r"|'''(?:.|\n|\r)*?'''"
+    r'|(?:r?b?|b?r?)"[^"\r\n]*"'
+    r"|(?:r?b?|b?r?)'[^'\r\n]*')"
+    r"|(?P<fstr>\bf[\"'])"
+    r"|(?P<open>[{(\[])|(?P<close>[})\]])|(?P<semi>;)"
+    r"|(?P<line>\n(?=[^\s})\]]))"
+    r"|\w+|\S"
+)
+# escaped braces, expression starts and ends of f-strings by their quote
+FSTRING = {q: re.compile(r"(?P<esc>{{|}})|(?P<open>{)|(?P<end>%s)" % q) for q in "\"'"}
+
+
+def split_elements(source: str) -> list[tuple[int, str]]:
+    """Split source into top level elements, as (first line, text) pairs.
+
+    An element ends before an unindented line following a `}` or `;` outside
+    of any bracket, string, comment or inline python. Anything the split gets
+    wrong stays in one larger element, which is parsed as a whole.
+    """
+    elements = []
+    start = line = pos = 0
+    last = ""
+    # open brackets and f-strings, innermost last
+    stack: list[str] = []
+    while True:
+        if stack and stack[-1] in FSTRING:
+            match = FSTRING[stack[-1]].search(source, pos)
+            if match is None:
+                break
+            if match.lastgroup == "open":
+                stack.append("{")
+            elif match.lastgroup == "end":
+                stack.pop()
+                last = "f"
+            pos = match.end()
+            continue
+        match = CODE.search(source, pos)
+        if match is None:
+            break
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "fstr":
+            stack.append(match.group()[-1])
+        elif kind == "open":
+            stack.append(match.group())
+        elif kind == "close" and stack:
+            stack.pop()
+        if kind == "line":
+            if not stack and last in ("}", ";"):
+                end = match.end()
+                elements.append((line, source[start:end]))
+                line += source.count("\n", start, end)
+                start = end
+        elif kind != "comment":
+            last = match.group()
+    elements.append((line, source[start:]))
+    return elements
+
+
+def shift(diagnostic: lspt.Diagnostic, lines: int) -> lspt.Diagnostic:
+    """Get a diagnostic moved down by a number of lines."""
+    start, end = diagnostic.range.start, diagnostic.range.end
+    return lspt.Diagnostic(
+        range=lspt.Range(
+            start=lspt.Position(line=start.line + lines, character=start.character),
+            end=lspt.Position(line=end.line + lines, character=end.character),
+        ),
+        message=diagnostic.message,
+        severity=diagnostic.severity,
+    )
+
+
+class IncrementalParser:
+    """Syntax checks a document, parsing only the elements that changed."""
+
+    def __init__(self, file_path: str) -> None:
+        """Initialize parser."""
+        self.file_path = file_path
+        # (previous element text, element text) -> (had no errors, diagnostics
+        # relative to the element)
+        self.elements: dict[tuple[str, str], tuple[bool, list[lspt.Diagnostic]]] = {}
+        self.parsed = 0
+
+    def check(self, source: str) -> tuple[bool, list[lspt.Diagnostic]]:
+        """Check source, return if it has no syntax errors and diagnostics."""
+        passed = True
+        diagnostics: list[lspt.Diagnostic] = []
+        elements: dict[tuple[str, str], tuple[bool, list[lspt.Diagnostic]]] = {}
+        prev = ""
+        for line, text in split_elements(source):
+            key = (prev, text)
+            result = self.elements.get(key) or elements.get(key)
+            if result is None:
+                result = self.parse(prev, text)
+            elements[key] = result
+            passed = passed and result[0]
+            diagnostics += (shift(i, line) for i in result[1])
+            prev = text
+        # elements no longer in the document are dropped
+        self.elements = elements
+        return passed, diagnostics
+
+    def parse(self, prev: str, text: str) -> tuple[bool, list[lspt.Diagnostic]]:
+        """Parse an element after the previous one, return its diagnostics."""
+        self.parsed += 1
+        lines = prev.count("\n")
+        prse = JacParser(
+            ast.JacSource(prev + text, mod_path=uris.to_fs_path(self.file_path))
+        )
+        if prev and any(i.loc.first_line <= lines for i in prse.errors_had):
+            # the previous element has errors of its own, parsing stopped there
+            return self.parse("", text)
+        diagnostics = [
+            shift(i, -lines)
+            for i in gen_diagnostics(self.file_path, prse.errors_had, prse.warnings_had)
+            if i.range.start.line >= lines
+        ]
+        return len(prse.errors_had) == 0, diagnostics
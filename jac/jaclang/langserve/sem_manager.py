@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import List, Optional, Tuple
 
 import jaclang.compiler.absyntree as ast
@@ -23,6 +24,9 @@ class SemTokManager:
         self.static_sem_tokens: List[
             Tuple[lspt.Position, int, int, ast.AstSymbolNode]
         ] = self.gen_sem_tok_node(ir)
+        # (line, start, end) of each semantic token, built when first looked up
+        # and reset when the tokens are updated
+        self.token_positions: Optional[List[Tuple[int, int, int]]] = None
 
     def gen_sem_tokens(self, ir: ast.Module) -> list[int]:
         """Return semantic tokens."""
@@ -62,6 +66,32 @@ class SemTokManager:
                 tokens += [(pos, col_end, length, node)]
         return tokens
 
+    def gen_token_positions(self) -> List[Tuple[int, int, int]]:
+        """Return the line, start and end of each semantic token."""
+        positions = []
+        line = char = 0
+        for i in range(0, len(self.sem_tokens), 5):
+            line_delta, char_delta, length = self.sem_tokens[i : i + 3]
+            if line_delta > 0:
+                line += line_delta
+                char = 0
+            char += char_delta
+            positions.append((line, char, char + length))
+        return positions
+
+    def find_index(self, line: int, char: int) -> Optional[int]:
+        """Return the index of the semantic token at a position."""
+        if self.token_positions is None:
+            self.token_positions = self.gen_token_positions()
+        positions = self.token_positions
+        # the last two tokens starting at or before the position, the earlier
+        # one first as a token ending where the next starts holds it too
+        after = bisect_right(positions, (line, char + 1, 0))
+        for i in (after - 2, after - 1):
+            if i >= 0 and positions[i][0] == line and char <= positions[i][2]:
+                return i
+        return None
+
     def update_sem_tokens(
         self,
         content_changes: lspt.DidChangeTextDocumentParams,
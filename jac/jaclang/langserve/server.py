@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
 
 from jaclang.compiler.constant import (
     JacSemTokenModifier as SemTokMod,
@@ -10,16 +10,23 @@ from jaclang.compiler.constant import (
 )
 from jaclang.langserve.engine import JacLangServer
 from jaclang.settings import settings
+from jaclang.vendor.pygls import uris
 
 import lsprotocol.types as lspt
 
 server = JacLangServer()
 
 
+@server.feature(lspt.INITIALIZED)
+async def initialized(ls: JacLangServer, params: lspt.InitializedParams) -> None:
+    """Index the workspace in the background."""
+    await ls.launch_index_workspace()
+
+
 @server.feature(lspt.TEXT_DOCUMENT_DID_OPEN)
 async def did_open(ls: JacLangServer, params: lspt.DidOpenTextDocumentParams) -> None:
     """Check syntax on change."""
-    ls.deep_check(params.text_document.uri)
+    await ls.launch_deep_check(params.text_document.uri)
     ls.lsp.send_request(lspt.WORKSPACE_SEMANTIC_TOKENS_REFRESH)
 
 
@@ -27,10 +34,11 @@ async def did_open(ls: JacLangServer, params: lspt.DidOpenTextDocumentParams) ->
 async def did_save(ls: JacLangServer, params: lspt.DidOpenTextDocumentParams) -> None:
     """Check syntax on change."""
     file_path = params.text_document.uri
-    if ls.modules[file_path].is_modified:
+    if file_path not in ls.modules or ls.modules[file_path].is_modified:
+        if file_path in ls.modules:
+            ls.modules[file_path].is_modified = False
         await ls.launch_deep_check(file_path)
         ls.lsp.send_request(lspt.WORKSPACE_SEMANTIC_TOKENS_REFRESH)
-        ls.modules[file_path].is_modified = False
 
 
 @server.feature(lspt.TEXT_DOCUMENT_DID_CHANGE)
@@ -38,24 +46,34 @@ async def did_change(
     ls: JacLangServer, params: lspt.DidChangeTextDocumentParams
 ) -> None:
     """Check syntax on change."""
-    module = ls.modules[params.text_document.uri]
-    module.is_modified = True
-    await ls.launch_quick_check(file_path := params.text_document.uri)
-    if file_path in ls.modules:
+    if (file_path := params.text_document.uri) in ls.modules:
+        ls.modules[file_path].is_modified = True
         document = ls.workspace.get_text_document(file_path)
         lines = document.source.splitlines()
         ls.modules[file_path].sem_manager.update_sem_tokens(
             params, ls.modules[file_path].sem_manager.sem_tokens, lines
         )
+        ls.modules[file_path].sem_manager.token_positions = None
         ls.lsp.send_request(lspt.WORKSPACE_SEMANTIC_TOKENS_REFRESH)
+    await ls.launch_quick_check(file_path)
+
+
+@server.feature(lspt.TEXT_DOCUMENT_DID_CLOSE)
+def did_close(ls: JacLangServer, params: lspt.DidCloseTextDocumentParams) -> None:
+    """Let the module of a closed document be evicted."""
+    if (file_path := params.text_document.uri) in ls.modules:
+        # unsaved changes are discarded with the document
+        ls.modules[file_path].is_modified = False
+    ls.parsers.pop(file_path, None)
+    ls.modules.trim()
 
 
 @server.feature(lspt.TEXT_DOCUMENT_FORMATTING)
-def formatting(
+async def formatting(
     ls: JacLangServer, params: lspt.DocumentFormattingParams
 ) -> list[lspt.TextEdit]:
     """Format the given document."""
-    return ls.formatted_jac(params.text_document.uri)
+    return await ls.launch_formatting(params.text_document.uri)
 
 
 @server.feature(
@@ -66,8 +84,9 @@ def formatting(
         ]
     ),
 )
-def did_create_files(ls: JacLangServer, params: lspt.CreateFilesParams) -> None:
+async def did_create_files(ls: JacLangServer, params: lspt.CreateFilesParams) -> None:
     """Check syntax on file creation."""
+    await ls.launch_index_files([uris.to_fs_path(file.uri) for file in params.files])
 
 
 @server.feature(
@@ -78,12 +97,13 @@ def did_create_files(ls: JacLangServer, params: lspt.CreateFilesParams) -> None:
         ]
     ),
 )
-def did_rename_files(ls: JacLangServer, params: lspt.RenameFilesParams) -> None:
+async def did_rename_files(ls: JacLangServer, params: lspt.RenameFilesParams) -> None:
     """Check syntax on file rename."""
     new_uris = [file.new_uri for file in params.files]
     old_uris = [file.old_uri for file in params.files]
     for i in range(len(new_uris)):
         ls.rename_module(old_uris[i], new_uris[i])
+    await ls.launch_index_files([uris.to_fs_path(uri) for uri in new_uris])
 
 
 @server.feature(
@@ -137,6 +157,14 @@ def definition(
     return ls.get_definition(params.text_document.uri, params.position)
 
 
+@server.feature(lspt.WORKSPACE_SYMBOL)
+def workspace_symbol(
+    ls: JacLangServer, params: lspt.WorkspaceSymbolParams
+) -> list[lspt.SymbolInformation]:
+    """Provide workspace symbols."""
+    return ls.get_workspace_symbols(params.query)
+
+
 @server.feature(lspt.TEXT_DOCUMENT_REFERENCES)
 def references(ls: JacLangServer, params: lspt.ReferenceParams) -> list[lspt.Location]:
     """Provide references."""
@@ -166,6 +194,12 @@ def semantic_tokens_full(
     return ls.get_semantic_tokens(params.text_document.uri)
 
 
+@server.command("jac.moduleCacheStats")
+def module_cache_stats(ls: JacLangServer, *args: object) -> dict[str, Any]:
+    """Provide module cache statistics."""
+    return ls.modules.stats()
+
+
 def run_lang_server() -> None:
     """Run the language server."""
     settings.pass_timer = True
@@ -0,0 +1,84 @@
+"""Test incremental syntax checks."""
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.parser import JacParser
+from jaclang.langserve.incremental import IncrementalParser, split_elements
+from jaclang.utils.test import TestCase
+from jaclang.vendor.pygls import uris
+
+
+class TestIncrementalParser(TestCase):
+    """Test incremental parser."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.file_path = self.fixture_abs_path("circle.jac")
+        self.uri = uris.from_fs_path(self.file_path)
+        with open(self.file_path) as f:
+            self.source = f.read()
+
+    def full_errors(self, source: str) -> list[tuple[int, int]]:
+        """Get syntax error positions of a whole module parse."""
+        prse = JacParser(ast.JacSource(source, mod_path=self.file_path))
+        return [(i.loc.first_line - 1, i.loc.col_start - 1) for i in prse.errors_had]
+
+    def test_split_elements(self) -> None:
+        """Test a module splits into elements covering all its lines."""
+        elements = split_elements(self.source)
+        self.assertGreater(len(elements), 5)
+        self.assertEqual("".join(text for _, text in elements), self.source)
+        for line, text in elements:
+            self.assertEqual(self.source.splitlines()[line], text.splitlines()[0])
+
+    def test_only_changed_elements_parsed(self) -> None:
+        """Test an edit reparses the changed element and the one after it."""
+        parser = IncrementalParser(self.uri)
+        passed, diagnostics = parser.check(self.source)
+        self.assertTrue(passed)
+        self.assertEqual(diagnostics, [])
+        parsed = parser.parsed
+        edited = self.source.replace("self.radius * self.radius", "self.radius**2")
+        self.assertTrue(parser.check(edited)[0])
+        self.assertEqual(parser.parsed - parsed, 2)
+
+    def test_errors_match_full_parse(self) -> None:
+        """Test syntax errors are reported where a full parse reports them."""
+        parser = IncrementalParser(self.uri)
+        parser.check(self.source)
+        for broken in (
+            self.source.replace("area(radius: float)", "area(radius float)"),
+            self.source.replace("with entry {\n    c", "withentry {\n    c"),
+            self.source.replace("radius;\n}", "radius;\n"),
+        ):
+            passed, diagnostics = parser.check(broken)
+            self.assertFalse(passed)
+            self.assertEqual(
+                (diagnostics[0].range.start.line, diagnostics[0].range.start.character),
+                self.full_errors(broken)[0],
+            )
+        self.assertEqual(parser.check(self.source), (True, []))
+
+    def test_no_split_inside_tokens(self) -> None:
+        """Test inline python, strings and comments are never split."""
+        source = (
+            "::py::\n"
+            "config = {\n"
+            '    "a": 1,\n'
+            "}\n"
+            "::py::\n"
+            "\n"
+            "can greet() -> str {\n"
+            "    x = f\"{ {'k': 1}['k'] } }}{{ \";\n"
+            '    y = "} ;";\n'
+            "    return 'hi';  # }\n"
+            "}\n"
+            "#* block\n"
+            "}\n"
+            "*#\n"
+            "with entry {\n"
+            "    print(greet());\n"
+            "}\n"
+        )
+        self.assertEqual(self.full_errors(source), [])
+        self.assertEqual([line for line, _ in split_elements(source)], [0, 11, 14])
+        self.assertEqual(IncrementalParser(self.uri).check(source), (True, []))
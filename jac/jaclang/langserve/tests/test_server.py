@@ -1,12 +1,82 @@
+import asyncio
+import os
+import tempfile
+import threading
+from typing import Optional
+
+import jaclang.compiler.absyntree as ast
 from jaclang.utils.test import TestCase
 from jaclang.vendor.pygls import uris
 from jaclang.vendor.pygls.workspace import Workspace
+from jaclang.langserve import workspace_index
 from jaclang.langserve.engine import JacLangServer
+from jaclang.langserve.utils import get_token_start
+from jaclang.settings import settings
 from .session import LspSession
 
 import lsprotocol.types as lspt
 
 
+def find_deepest_symbol_node_at_pos(
+    node: ast.AstNode, line: int, character: int
+) -> Optional[ast.AstSymbolNode]:
+    """Return the deepest symbol node at a position by walking the AST."""
+    last_symbol_node = None
+
+    if position_within_node(node, line, character):
+        if isinstance(node, ast.AstSymbolNode):
+            last_symbol_node = node
+
+        for child in [i for i in node.kid if i.loc.mod_path == node.loc.mod_path]:
+            if position_within_node(child, line, character):
+                deeper_node = find_deepest_symbol_node_at_pos(child, line, character)
+                if deeper_node is not None:
+                    last_symbol_node = deeper_node
+
+    return last_symbol_node
+
+
+def position_within_node(node: ast.AstNode, line: int, character: int) -> bool:
+    """Check if the position falls within the node's location."""
+    if node.loc.first_line < line + 1 < node.loc.last_line:
+        return True
+    if (
+        node.loc.first_line == line + 1
+        and node.loc.col_start <= character + 1
+        and (
+            node.loc.last_line == line + 1
+            and node.loc.col_end >= character + 1
+            or node.loc.last_line > line + 1
+        )
+    ):
+        return True
+    if (
+        node.loc.last_line == line + 1
+        and node.loc.col_start <= character + 1 <= node.loc.col_end
+    ):
+        return True
+    return False
+
+
+def find_index(
+    sem_tokens: list[int],
+    line: int,
+    char: int,
+) -> Optional[int]:
+    """Return the index of the token at a position by walking the tokens."""
+    index = None
+
+    # A list contains all the token start positions.
+    token_start_list = [
+        get_token_start(i, sem_tokens) for i in range(0, len(sem_tokens), 5)
+    ]
+    for i, j in enumerate(token_start_list):
+        if j[0] == line and j[1] <= char <= j[2]:
+            return i
+
+    return index
+
+
 class TestJacLangServer(TestCase):
 
     def test_formatting(self) -> None:
@@ -63,6 +133,264 @@ class TestJacLangServer(TestCase):
             lsp.get_hover_info(circle_impl_file, pos).contents.value,
         )
 
+    def test_check_scheduler(self) -> None:
+        """Test superseded checks are dropped and outdated diagnostics discarded."""
+        lsp = JacLangServer()
+        lsp.quick_check_delay = lsp.deep_check_delay = 0.01
+        workspace_path = self.fixture_abs_path("")
+        workspace = Workspace(workspace_path, lsp)
+        lsp.lsp._workspace = workspace
+        circle_file = uris.from_fs_path(self.fixture_abs_path("circle_pure.jac"))
+        with open(self.fixture_abs_path("circle_pure.jac")) as f:
+            source = f.read()
+        workspace.put_text_document(
+            lspt.TextDocumentItem(circle_file, "jac", 1, source)
+        )
+        published = []
+        lsp.publish_diagnostics = (  # type: ignore[method-assign]
+            lambda uri, diagnostics, version=None: published.append((uri, version))
+        )
+
+        async def edit_burst() -> list[bool]:
+            return await asyncio.gather(
+                *(lsp.launch_quick_check(circle_file) for _ in range(3))
+            )
+
+        self.assertEqual(asyncio.run(edit_burst()), [False, False, True])
+        self.assertEqual(published, [(circle_file, 1)])
+        self.assertTrue(asyncio.run(lsp.launch_deep_check(circle_file)))
+        self.assertEqual(published[-1], (circle_file, 1))
+        count = len(published)
+        # a quick check reports less than the deep check of the same version
+        asyncio.run(lsp.launch_quick_check(circle_file))
+        self.assertEqual(len(published), count)
+
+        run_deep_check = lsp.run_deep_check
+
+        def edited_while_checking(file_path: str, annex_view: None = None) -> tuple:
+            workspace.put_text_document(
+                lspt.TextDocumentItem(circle_file, "jac", 2, source)
+            )
+            return run_deep_check(file_path, annex_view)
+
+        lsp.run_deep_check = edited_while_checking  # type: ignore[method-assign]
+        asyncio.run(lsp.launch_deep_check(circle_file))
+        self.assertEqual(len(published), count)
+        self.assertIn(circle_file, lsp.modules)
+
+    def test_quick_check_during_deep_check(self) -> None:
+        """Test a quick check does not wait for a running deep check."""
+        lsp = JacLangServer()
+        lsp.quick_check_delay = lsp.deep_check_delay = 0.01
+        workspace = Workspace(self.fixture_abs_path(""), lsp)
+        lsp.lsp._workspace = workspace
+        circle_file = uris.from_fs_path(self.fixture_abs_path("circle_pure.jac"))
+        published = []
+        lsp.publish_diagnostics = (  # type: ignore[method-assign]
+            lambda uri, diagnostics, version=None: published.append(uri)
+        )
+        started, release = threading.Event(), threading.Event()
+        run_deep_check = lsp.run_deep_check
+
+        def long_deep_check(file_path: str, annex_view: None = None) -> tuple:
+            started.set()
+            release.wait(30)
+            return run_deep_check(file_path, annex_view)
+
+        lsp.run_deep_check = long_deep_check  # type: ignore[method-assign]
+
+        async def check() -> tuple[bool, bool, bool]:
+            deep = asyncio.create_task(lsp.launch_deep_check(circle_file))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 30)
+            quick = await asyncio.wait_for(lsp.launch_quick_check(circle_file), 30)
+            running = not deep.done()
+            release.set()
+            return quick, running, await deep
+
+        self.assertEqual(asyncio.run(check()), (True, True, True))
+        self.assertEqual(published, [circle_file, circle_file])
+
+    def test_position_index(self) -> None:
+        """Test indexed lookups by position match walking tokens and the AST."""
+        lsp = JacLangServer()
+        workspace_path = self.fixture_abs_path("")
+        workspace = Workspace(workspace_path, lsp)
+        lsp.lsp._workspace = workspace
+        circle_file = uris.from_fs_path(self.fixture_abs_path("circle.jac"))
+        lsp.deep_check(circle_file)
+        module = lsp.modules[circle_file]
+        with open(self.fixture_abs_path("circle.jac")) as f:
+            lines = f.read().splitlines()
+        differences: dict[tuple[int, int], tuple[type, type]] = {}
+        for line, text in enumerate(lines):
+            for char in range(len(text) + 1):
+                self.assertEqual(
+                    module.sem_manager.find_index(line, char),
+                    find_index(module.sem_manager.sem_tokens, line, char),
+                )
+                indexed = module.node_index.find_deepest(line, char)
+                walked = find_deepest_symbol_node_at_pos(module.ir, line, char)
+                if indexed is not walked:
+                    differences[line, char] = (type(indexed), type(walked))
+        # on the leading whitespace of an ability's last line the walk compares
+        # the column with the ability's start column and reports the class
+        self.assertEqual(
+            differences,
+            {
+                (line, char): (ast.Ability, ast.Architype)
+                for line in (30, 38, 43)
+                for char in range(4)
+            },
+        )
+
+    def test_workspace_index(self) -> None:
+        """Test symbols and uses are found in files that were never checked."""
+        cache_dir = workspace_index.CACHE_DIR
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace_index.CACHE_DIR = tmp
+            try:
+                lsp = JacLangServer()
+                workspace = Workspace(self.fixture_abs_path(""), lsp)
+                lsp.lsp._workspace = workspace
+                asyncio.run(lsp.launch_index_workspace())
+                self.assertIn(
+                    "circle.jac:",
+                    str(lsp.get_workspace_symbols("calculate_area")),
+                )
+                base_file = uris.from_fs_path(
+                    self.fixture_abs_path("base_module_structure.jac")
+                )
+                lsp.deep_check(base_file)
+                self.assertIn(
+                    "import_include_statements.jac:3:60-3:68",
+                    str(lsp.get_references(base_file, lspt.Position(13, 5))),
+                )
+                # a restarted server reads entries from disk
+                index = workspace_index.WorkspaceIndex()
+                circle_path = self.fixture_abs_path("circle.jac")
+                self.assertTrue(index.is_fresh(circle_path))
+                self.assertEqual(
+                    index.files[circle_path].defs, lsp.index.files[circle_path].defs
+                )
+            finally:
+                workspace_index.CACHE_DIR = cache_dir
+
+    def test_indexed_uses_of_shared_module(self) -> None:
+        """Test uses in another graph are found for a module shared with it."""
+        cache_dir = workspace_index.CACHE_DIR
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace_index.CACHE_DIR = tmp
+            for name, source in [
+                ("shared.jac", "can greet() -> str {\n    return 'hi';\n}\n"),
+                ("user_a.jac", "import:jac from shared {greet}\n"),
+                ("user_b.jac", "import:jac from shared {greet}\n"),
+            ]:
+                with open(f"{tmp}/{name}", "w") as f:
+                    f.write(source)
+            try:
+                lsp = JacLangServer()
+                lsp.lsp._workspace = Workspace(tmp, lsp)
+                asyncio.run(lsp.launch_index_workspace())
+                lsp.deep_check(uris.from_fs_path(f"{tmp}/user_a.jac"))
+                lsp.deep_check(uris.from_fs_path(f"{tmp}/user_b.jac"))
+                # the shared module was last built in the graph of user_b
+                references = str(
+                    lsp.get_references(
+                        uris.from_fs_path(f"{tmp}/shared.jac"), lspt.Position(0, 5)
+                    )
+                )
+                self.assertIn("user_a.jac:0:24-0:29", references)
+            finally:
+                workspace_index.CACHE_DIR = cache_dir
+
+    def test_index_after_deep_checks(self) -> None:
+        """Test indexing waits for scheduled deep checks and is bounded."""
+        max_files = settings.lsp_index_max_files
+        with tempfile.TemporaryDirectory() as tmp:
+            for i in range(3):
+                with open(f"{tmp}/mod{i}.jac", "w") as f:
+                    f.write("glob x = 1;\n")
+            settings.lsp_index_max_files = 2
+            try:
+                lsp = JacLangServer()
+                lsp.deep_check_delay = 0.1
+                lsp.lsp._workspace = Workspace(tmp, lsp)
+                events = []
+                started, release = threading.Event(), threading.Event()
+
+                def index_file(file_path: str) -> None:
+                    events.append(os.path.basename(file_path))
+                    started.set()
+                    release.wait(30)
+
+                def deep_check(file_path: str, annex_view: None = None) -> tuple:
+                    events.append("deep")
+                    return True, {}
+
+                lsp.index_file = index_file  # type: ignore[method-assign]
+                lsp.run_deep_check = deep_check  # type: ignore[method-assign]
+
+                async def check() -> None:
+                    index = asyncio.create_task(lsp.launch_index_workspace())
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, started.wait, 30
+                    )
+                    deep = asyncio.create_task(
+                        lsp.launch_deep_check(uris.from_fs_path(f"{tmp}/mod2.jac"))
+                    )
+                    await asyncio.sleep(0)
+                    release.set()
+                    await asyncio.gather(index, deep)
+
+                asyncio.run(check())
+                self.assertEqual(events, ["mod0.jac", "deep", "mod1.jac"])
+            finally:
+                settings.lsp_index_max_files = max_files
+
+    def test_module_cache(self) -> None:
+        """Test closed modules are evicted past the limit and rebuilt on demand."""
+        lsp = JacLangServer()
+        workspace = Workspace(self.fixture_abs_path(""), lsp)
+        lsp.lsp._workspace = workspace
+        circle_file = uris.from_fs_path(self.fixture_abs_path("circle.jac"))
+        base_file = uris.from_fs_path(
+            self.fixture_abs_path("base_module_structure.jac")
+        )
+        import_file = uris.from_fs_path(
+            self.fixture_abs_path("import_include_statements.jac")
+        )
+        with open(self.fixture_abs_path("circle.jac")) as f:
+            workspace.put_text_document(
+                lspt.TextDocumentItem(circle_file, "jac", 1, f.read())
+            )
+        max_lines = settings.lsp_module_cache_lines
+        settings.lsp_module_cache_lines = 1
+        try:
+            lsp.deep_check(circle_file)
+            lsp.deep_check(import_file)
+            # the open document and the module just checked are kept
+            self.assertIn(circle_file, lsp.modules)
+            self.assertIn(import_file, lsp.modules)
+            self.assertNotIn(base_file, lsp.modules)
+            self.assertEqual(lsp.modules.parent_uri(base_file), import_file)
+            self.assertEqual(
+                lsp.modules.lines,
+                sum(lsp.modules[i].lines for i in list(lsp.modules)),
+            )
+            # an evicted module is rebuilt through the module importing it
+            lsp.deep_check(base_file)
+            self.assertIn(base_file, lsp.modules)
+            stats = lsp.modules.stats()
+            self.assertEqual(stats["open"], 1)
+            self.assertEqual(stats["rebuilds"], 1)
+            self.assertGreater(stats["evictions"], 1)
+            # closed documents are evicted too
+            workspace.remove_text_document(circle_file)
+            lsp.modules.trim()
+            self.assertNotIn(circle_file, lsp.modules)
+        finally:
+            settings.lsp_module_cache_lines = max_lines
+
     def test_impl_auto_discover(self) -> None:
         """Test that the server doesn't run if there is a syntax error."""
         lsp = JacLangServer()
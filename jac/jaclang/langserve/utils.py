@@ -3,6 +3,7 @@
 import asyncio
 import builtins
 import re
+from bisect import bisect_right
 from functools import wraps
 from typing import Any, Awaitable, Callable, Coroutine, Optional, ParamSpec, TypeVar
 
@@ -85,64 +86,43 @@ def sym_tab_list(sym_tab: SymbolTable, file_path: str) -> list[SymbolTable]:
     return sym_tabs
 
 
-def find_deepest_symbol_node_at_pos(
-    node: ast.AstNode, line: int, character: int
-) -> Optional[ast.AstSymbolNode]:
-    """Return the deepest symbol node that contains the given position."""
-    last_symbol_node = None
-
-    if position_within_node(node, line, character):
-        if isinstance(node, ast.AstSymbolNode):
-            last_symbol_node = node
-
-        for child in [i for i in node.kid if i.loc.mod_path == node.loc.mod_path]:
-            if position_within_node(child, line, character):
-                deeper_node = find_deepest_symbol_node_at_pos(child, line, character)
-                if deeper_node is not None:
-                    last_symbol_node = deeper_node
-
-    return last_symbol_node
-
-
-def position_within_node(node: ast.AstNode, line: int, character: int) -> bool:
-    """Check if the position falls within the node's location."""
-    if node.loc.first_line < line + 1 < node.loc.last_line:
-        return True
-    if (
-        node.loc.first_line == line + 1
-        and node.loc.col_start <= character + 1
-        and (
-            node.loc.last_line == line + 1
-            and node.loc.col_end >= character + 1
-            or node.loc.last_line > line + 1
-        )
-    ):
-        return True
-    if (
-        node.loc.last_line == line + 1
-        and node.loc.col_start <= character + 1 <= node.loc.col_end
-    ):
-        return True
-    return False
-
-
-def find_index(
-    sem_tokens: list[int],
-    line: int,
-    char: int,
-) -> Optional[int]:
-    """Find index."""
-    index = None
-
-    # A list contains all the token start positions.
-    token_start_list = [
-        get_token_start(i, sem_tokens) for i in range(0, len(sem_tokens), 5)
-    ]
-    for i, j in enumerate(token_start_list):
-        if j[0] == line and j[1] <= char <= j[2]:
-            return i
+class SymbolNodeIndex:
+    """Symbol nodes of a module by position.
+
+    Nodes are kept in preorder, which sorts them by start as the spans of a
+    node's children fall within its own. The deepest node at a position is
+    then the last one starting before it or one of its enclosing nodes.
+    """
+
+    def __init__(self, ir: ast.AstNode) -> None:
+        """Index the symbol nodes of a module."""
+        self.nodes: list[ast.AstSymbolNode] = []
+        self.starts: list[tuple[int, int]] = []
+        self.ends: list[tuple[int, int]] = []
+        # index of the closest enclosing symbol node, -1 if none
+        self.parents: list[int] = []
+        stack: list[tuple[ast.AstNode, int]] = [(ir, -1)]
+        while stack:
+            node, parent = stack.pop()
+            if isinstance(node, ast.AstSymbolNode):
+                self.nodes.append(node)
+                self.starts.append((node.loc.first_line, node.loc.col_start))
+                self.ends.append((node.loc.last_line, node.loc.col_end))
+                self.parents.append(parent)
+                parent = len(self.nodes) - 1
+            stack.extend(
+                (i, parent)
+                for i in reversed(node.kid)
+                if i.loc.mod_path == node.loc.mod_path
+            )
 
-    return index
+    def find_deepest(self, line: int, character: int) -> Optional[ast.AstSymbolNode]:
+        """Return the deepest symbol node that contains the given position."""
+        pos = (line + 1, character + 1)
+        index = bisect_right(self.starts, pos) - 1
+        while index >= 0 and self.ends[index] < pos:
+            index = self.parents[index]
+        return self.nodes[index] if index >= 0 else None
 
 
 def get_symbols_for_outline(node: SymbolTable) -> list[lspt.DocumentSymbol]:
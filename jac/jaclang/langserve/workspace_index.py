@@ -0,0 +1,270 @@
+"""Workspace wide index of symbol definitions and uses.
+
+Every Jac file of the workspace is compiled up to the def-use pass, and the
+definitions and uses of Jac symbols found in it are recorded by file. Symbols
+are identified by the path of the file declaring them and their dotted name,
+so uses in one file point to definitions in another without either being
+open. Entries are kept on disk (with the `lsp_index_cache` setting) keyed by
+the compiler version, the file path and the file hash, so a restarted server
+only compiles the files that changed since they were indexed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from hashlib import md5
+from typing import Any, Optional
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.build_cache import file_hash, get_compiler_version
+from jaclang.compiler.compile import jac_file_to_pass
+from jaclang.compiler.constant import Constants as Con
+from jaclang.compiler.passes.main import DefUsePass
+from jaclang.compiler.passes.main.schedules import py_code_gen
+from jaclang.compiler.symtable import Symbol
+from jaclang.langserve.utils import kind_map
+from jaclang.settings import settings
+from jaclang.vendor.pygls import uris
+
+import lsprotocol.types as lspt
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".jaclang", "lsp_index")
+
+# (path of the declaring file, dotted name)
+SymbolKey = tuple[str, str]
+# first line, first column, last line, last column, zero based
+Span = tuple[int, int, int, int]
+
+
+class FileEntry:
+    """Definitions and uses of symbols in a file."""
+
+    def __init__(
+        self,
+        digest: str,
+        defs: list[tuple[str, str, int, Span]],
+        uses: list[tuple[SymbolKey, Span]],
+    ) -> None:
+        """Initialize file entry."""
+        self.hash = digest
+        # name, dotted name, lspt.SymbolKind, span
+        self.defs = defs
+        self.uses = uses
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get entry as plain data."""
+        return {"hash": self.hash, "defs": self.defs, "uses": self.uses}
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> FileEntry:
+        """Get entry from plain data."""
+        return FileEntry(
+            data["hash"],
+            [
+                (name, dotted, kind, tuple(span))
+                for name, dotted, kind, span in data["defs"]
+            ],
+            [((path, dotted), tuple(span)) for (path, dotted), span in data["uses"]],
+        )
+
+
+def get_span(node: ast.AstNode) -> Span:
+    """Get the zero based span of a node."""
+    loc = node.loc
+    return (
+        max(loc.first_line - 1, 0),
+        max(loc.col_start - 1, 0),
+        max(loc.last_line - 1, 0),
+        max(loc.col_end - 1, 0),
+    )
+
+
+def symbol_key(sym: Symbol) -> SymbolKey:
+    """Get the key of a symbol.
+
+    The dotted name leaves out the module, whose name depends on whether the
+    module was compiled on its own or imported, and the modules importing it,
+    whose tables an imported module's table is nested in. Names imported from
+    a Jac module are keyed by the symbol they import.
+    """
+    decl = sym.decl
+    if (
+        isinstance(decl.parent, ast.ModuleItem)
+        and decl is decl.parent.name
+        and (target := import_target(decl.parent))
+    ):
+        return target
+    names = [sym.sym_name]
+    tab = sym.parent_tab
+    while tab.parent and not isinstance(tab.owner, ast.Module):
+        names.append(tab.name)
+        tab = tab.parent
+    return decl.loc.mod_path, ".".join(reversed(names))
+
+
+def import_target(item: ast.ModuleItem) -> Optional[SymbolKey]:
+    """Get the key of the symbol an import item imports, if a Jac one."""
+    mod = item.from_mod_path.sub_module
+    if mod is None or not mod.loc.mod_path.endswith(".jac"):
+        return None
+    return mod.loc.mod_path, item.name.value
+
+
+def collect_entries(mod: ast.Module) -> dict[str, FileEntry]:
+    """Get the entries of a compiled module and its impl and test annexes."""
+    entries = {
+        i.loc.mod_path: FileEntry(i.source.hash, [], [])
+        for i in [mod, *mod.impl_mod, *mod.test_mod]
+        if i.loc.mod_path
+    }
+    stack: list[ast.AstNode] = [mod]
+    while stack:
+        node = stack.pop()
+        for kid in node.kid:
+            # imported modules are indexed on their own
+            if not isinstance(kid, ast.Module) or kid.loc.mod_path in entries:
+                stack.append(kid)
+        if not isinstance(node, ast.NameAtom) or not node.sym:
+            continue
+        entry = entries.get(node.loc.mod_path)
+        if entry is None or not node.sym.decl.loc.mod_path.endswith(".jac"):
+            continue
+        key = symbol_key(node.sym)
+        if node.sym.decl is node and key[0] == node.loc.mod_path:
+            entry.defs.append(
+                (node.sym_name, key[1], kind_map(node.name_of), get_span(node))
+            )
+        else:
+            entry.uses.append((key, get_span(node)))
+    return entries
+
+
+def get_cache_key(file_path: str, digest: str) -> str:
+    """Get the key an entry is stored on disk with."""
+    key = f"{get_compiler_version()}:{file_path}:{digest}"
+    return md5(key.encode()).hexdigest()
+
+
+def read_entry(file_path: str, digest: str) -> Optional[FileEntry]:
+    """Read an entry from disk, None if missing or unusable."""
+    path = os.path.join(CACHE_DIR, f"{get_cache_key(file_path, digest)}.json")
+    try:
+        with open(path) as f:
+            return FileEntry.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_entry(file_path: str, entry: FileEntry) -> None:
+    """Write an entry to disk, replacing it atomically."""
+    path = os.path.join(CACHE_DIR, f"{get_cache_key(file_path, entry.hash)}.json")
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(f"{path}.{os.getpid()}", "w") as f:
+            json.dump(entry.as_dict(), f)
+        os.replace(f"{path}.{os.getpid()}", path)
+    except OSError:
+        pass
+
+
+class WorkspaceIndex:
+    """Definitions and uses of symbols in every Jac file of a workspace."""
+
+    def __init__(self) -> None:
+        """Initialize index."""
+        self.files: dict[str, FileEntry] = {}
+        # symbol key -> (file path, span) of its uses, rebuilt when needed
+        self._uses: Optional[dict[SymbolKey, list[tuple[str, Span]]]] = None
+
+    def set_entries(self, entries: dict[str, FileEntry]) -> None:
+        """Store entries by file path."""
+        self.files.update(entries)
+        self._uses = None
+
+    def find_files(self, root: str) -> list[str]:
+        """Get the Jac files of a workspace."""
+        found = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [
+                i for i in dirnames if not i.startswith(".") and i != Con.JAC_GEN_DIR
+            ]
+            found += [os.path.join(dirpath, i) for i in filenames if i.endswith(".jac")]
+        return sorted(found)
+
+    def is_fresh(self, file_path: str) -> bool:
+        """Check if a file is indexed as it is on disk, loading it from disk."""
+        digest = file_hash(file_path)
+        if digest is None:
+            return True
+        if (entry := self.files.get(file_path)) and entry.hash == digest:
+            return True
+        if settings.lsp_index_cache and (entry := read_entry(file_path, digest)):
+            self.set_entries({file_path: entry})
+            return True
+        return False
+
+    def index_file(self, file_path: str) -> None:
+        """Index a file, with its annexes, from what is on disk."""
+        if self.is_fresh(file_path):
+            return
+        mod = jac_file_to_pass(file_path, target=DefUsePass, schedule=py_code_gen).ir
+        if isinstance(mod, ast.Module) and (base := mod.annexable_by):
+            # annexes are linked through the module they belong to
+            mod = jac_file_to_pass(base, target=DefUsePass, schedule=py_code_gen).ir
+        if isinstance(mod, ast.Module):
+            self.index_module(mod)
+
+    def index_module(self, mod: ast.Module) -> None:
+        """Index a compiled module and its annexes."""
+        entries = collect_entries(mod)
+        self.set_entries(entries)
+        if settings.lsp_index_cache:
+            for file_path, entry in entries.items():
+                write_entry(file_path, entry)
+
+    def remove(self, file_path: str) -> None:
+        """Drop a file from the index."""
+        if self.files.pop(file_path, None):
+            self._uses = None
+
+    def find_uses(self, key: SymbolKey) -> list[tuple[str, Span]]:
+        """Get file path and span of each use of a symbol."""
+        if self._uses is None:
+            uses: dict[SymbolKey, list[tuple[str, Span]]] = {}
+            for file_path, entry in list(self.files.items()):
+                for use, span in entry.uses:
+                    uses.setdefault(use, []).append((file_path, span))
+            self._uses = uses
+        return self._uses.get(key, [])
+
+    def find_defs(self, key: SymbolKey) -> list[tuple[str, Span]]:
+        """Get file path and span of the definition of a symbol."""
+        entry = self.files.get(key[0])
+        return [(key[0], i[3]) for i in entry.defs if i[1] == key[1]] if entry else []
+
+    def find_symbols(self, query: str) -> list[lspt.SymbolInformation]:
+        """Get definitions with names containing a query, ignoring case."""
+        query = query.lower()
+        return [
+            lspt.SymbolInformation(
+                name=name,
+                kind=lspt.SymbolKind(kind),
+                location=to_location(file_path, span),
+                container_name=dotted.rsplit(".", 1)[0] if "." in dotted else None,
+            )
+            for file_path, entry in list(self.files.items())
+            for name, dotted, kind, span in entry.defs
+            if query in name.lower()
+        ]
+
+
+def to_location(file_path: str, span: Span) -> lspt.Location:
+    """Get the location of a span in a file."""
+    return lspt.Location(
+        uri=uris.from_fs_path(file_path),
+        range=lspt.Range(
+            start=lspt.Position(span[0], span[1]),
+            end=lspt.Position(span[2], span[3]),
+        ),
+    )
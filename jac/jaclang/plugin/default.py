@@ -8,11 +8,21 @@ import html
 import os
 import pickle
 import types
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from dataclasses import field
 from functools import wraps
 from logging import getLogger
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, Union
+from types import UnionType
+from typing import (
+    Any,
+    Callable,
+    Mapping,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 from jaclang.compiler.constant import colors
@@ -30,13 +40,12 @@ from jaclang.plugin.feature import (
     NodeAnchor,
     NodeArchitype,
     P,
-    PyastGenPass,
     Root,
     T,
     WalkerArchitype,
-    ast,
 )
 from jaclang.runtimelib.constructs import (
+    DSDispatch,
     GenericEdge,
     JacTestCheck,
 )
@@ -44,9 +53,12 @@ from jaclang.runtimelib.importer import ImportPathSpec, JacImporter, PythonImpor
 from jaclang.runtimelib.machine import JacMachine, JacProgram
 from jaclang.runtimelib.utils import collect_node_connections, traverse_graph
 
-
 import pluggy
 
+if TYPE_CHECKING:
+    from jaclang.compiler import absyntree as ast
+    from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
+
 hookimpl = pluggy.HookimplMarker("jac")
 logger = getLogger(__name__)
 
@@ -60,12 +72,13 @@ class JacAccessValidationImpl:
         architype: Architype, root_id: UUID, level: AccessLevel | int | str
     ) -> None:
         """Allow all access from target root graph to current Architype."""
+        anchor = architype.__jac__
         level = AccessLevel.cast(level)
-        access = architype.__jac__.access.roots
 
         _root_id = str(root_id)
-        if level != access.anchors.get(_root_id, AccessLevel.NO_ACCESS):
-            access.anchors[_root_id] = level
+        if level != anchor.access.roots.check(_root_id):
+            anchor.writable_access().roots.anchors[_root_id] = level
+            anchor.dirty = True
 
     @staticmethod
     @hookimpl
@@ -73,10 +86,13 @@ class JacAccessValidationImpl:
         architype: Architype, root_id: UUID, level: AccessLevel | int | str
     ) -> None:
         """Disallow all access from target root graph to current Architype."""
+        anchor = architype.__jac__
         level = AccessLevel.cast(level)
-        access = architype.__jac__.access.roots
 
-        access.anchors.pop(str(root_id), None)
+        _root_id = str(root_id)
+        if _root_id in anchor.access.roots.anchors:
+            del anchor.writable_access().roots.anchors[_root_id]
+            anchor.dirty = True
 
     @staticmethod
     @hookimpl
@@ -85,7 +101,8 @@ class JacAccessValidationImpl:
         anchor = architype.__jac__
         level = AccessLevel.cast(level)
         if level != anchor.access.all:
-            anchor.access.all = level
+            anchor.writable_access().all = level
+            anchor.dirty = True
 
     @staticmethod
     @hookimpl
@@ -93,7 +110,8 @@ class JacAccessValidationImpl:
         """Disallow others to access current Architype."""
         anchor = architype.__jac__
         if anchor.access.all > AccessLevel.NO_ACCESS:
-            anchor.access.all = AccessLevel.NO_ACCESS
+            anchor.writable_access().all = AccessLevel.NO_ACCESS
+            anchor.dirty = True
 
     @staticmethod
     @hookimpl
@@ -166,6 +184,23 @@ class JacAccessValidationImpl:
 
         return access_level
 
+    @staticmethod
+    @hookimpl
+    def check_access_bulk(anchors: Sequence[Anchor]) -> list[AccessLevel]:
+        """Access validation of multiple anchors."""
+        # load the roots of every anchor in one read, check_access_level then
+        # finds each of them in memory
+        if roots := {to.root for to in anchors if to.persistent and to.root}:
+            Jac.get_context().mem.prefetch(roots)
+        levels = []
+        for to in anchors:
+            if (access_level := Jac.check_access_level(to)) == AccessLevel.NO_ACCESS:
+                logger.info(
+                    f"Current root doesn't have read access to {to.__class__.__name__}[{to.id}]"
+                )
+            levels.append(access_level)
+        return levels
+
 
 class JacNodeImpl:
     """Jac Node Operations."""
@@ -202,10 +237,15 @@ class JacNodeImpl:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type | UnionType],
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
-        ret_edges: list[EdgeArchitype] = []
-        for anchor in node.edges:
+        candidates: list[tuple[EdgeAnchor, NodeAnchor]] = []
+        for anchor, outgoing in node.edges.find(
+            dir in [EdgeDir.OUT, EdgeDir.ANY],
+            dir in [EdgeDir.IN, EdgeDir.ANY],
+            edge_type,
+        ):
             if (
                 (source := anchor.source)
                 and (target := anchor.target)
@@ -213,21 +253,16 @@ class JacNodeImpl:
                 and source.architype
                 and target.architype
             ):
-                if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
-                    and node == source
-                    and (not target_obj or target.architype in target_obj)
-                    and Jac.check_read_access(target)
-                ):
-                    ret_edges.append(anchor.architype)
-                if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
-                    and node == target
-                    and (not target_obj or source.architype in target_obj)
-                    and Jac.check_read_access(source)
-                ):
-                    ret_edges.append(anchor.architype)
-        return ret_edges
+                other = target if outgoing else source
+                if not target_obj or other.architype in target_obj:
+                    candidates.append((anchor, other))
+
+        levels = Jac.check_access_bulk([other for _, other in candidates])
+        return [
+            anchor.architype
+            for (anchor, _), level in zip(candidates, levels)
+            if level > AccessLevel.NO_ACCESS
+        ]
 
     @staticmethod
     @hookimpl
@@ -236,10 +271,15 @@ class JacNodeImpl:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type | UnionType],
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
-        ret_edges: list[NodeArchitype] = []
-        for anchor in node.edges:
+        candidates: list[NodeAnchor] = []
+        for anchor, outgoing in node.edges.find(
+            dir in [EdgeDir.OUT, EdgeDir.ANY],
+            dir in [EdgeDir.IN, EdgeDir.ANY],
+            edge_type,
+        ):
             if (
                 (source := anchor.source)
                 and (target := anchor.target)
@@ -247,30 +287,22 @@ class JacNodeImpl:
                 and source.architype
                 and target.architype
             ):
-                if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
-                    and node == source
-                    and (not target_obj or target.architype in target_obj)
-                    and Jac.check_read_access(target)
-                ):
-                    ret_edges.append(target.architype)
-                if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
-                    and node == target
-                    and (not target_obj or source.architype in target_obj)
-                    and Jac.check_read_access(source)
-                ):
-                    ret_edges.append(source.architype)
-        return ret_edges
+                other = target if outgoing else source
+                if not target_obj or other.architype in target_obj:
+                    candidates.append(other)
+
+        levels = Jac.check_access_bulk(candidates)
+        return [
+            other.architype
+            for other, level in zip(candidates, levels)
+            if level > AccessLevel.NO_ACCESS
+        ]
 
     @staticmethod
     @hookimpl
     def remove_edge(node: NodeAnchor, edge: EdgeAnchor) -> None:
         """Remove reference without checking sync status."""
-        for idx, ed in enumerate(node.edges):
-            if ed.id == edge.id:
-                node.edges.pop(idx)
-                break
+        node.edges.remove(edge)
 
 
 class JacEdgeImpl:
@@ -303,19 +335,22 @@ class JacWalkerImpl:
         if isinstance(walker, WalkerArchitype):
             """Walker visits node."""
             wanch = walker.__jac__
-            before_len = len(wanch.next)
+            queued: list[NodeAnchor] = []
             for anchor in (
                 (i.__jac__ for i in expr) if isinstance(expr, list) else [expr.__jac__]
             ):
                 if anchor not in wanch.ignores:
                     if isinstance(anchor, NodeAnchor):
-                        wanch.next.append(anchor)
+                        queued.append(anchor)
                     elif isinstance(anchor, EdgeAnchor):
                         if target := anchor.target:
-                            wanch.next.append(target)
+                            queued.append(target)
                         else:
                             raise ValueError("Edge has no target.")
-            return len(wanch.next) > before_len
+            # load the whole frontier at once instead of one node per hop
+            wanch.populate_many(queued)
+            wanch.next.extend(queued)
+            return bool(queued)
         else:
             raise TypeError("Invalid walker object")
 
@@ -340,10 +375,10 @@ class JacWalkerImpl:
             ):
                 if anchor not in wanch.ignores:
                     if isinstance(anchor, NodeAnchor):
-                        wanch.ignores.append(anchor)
+                        wanch.ignores.add(anchor)
                     elif isinstance(anchor, EdgeAnchor):
                         if target := anchor.target:
-                            wanch.ignores.append(target)
+                            wanch.ignores.add(target)
                         else:
                             raise ValueError("Edge has no target.")
             return len(wanch.ignores) > before_len
@@ -376,7 +411,7 @@ class JacWalkerImpl:
             raise TypeError("Invalid walker object")
 
         walker.path = []
-        walker.next = [node]
+        walker.next = deque([node])
         if walker.next:
             current_node = walker.next[-1].architype
             for i in warch._jac_entry_funcs_:
@@ -386,41 +421,17 @@ class JacWalkerImpl:
                     else:
                         raise ValueError(f"No function {i.name} to call.")
         while len(walker.next):
-            if current_node := walker.next.pop(0).architype:
-                for i in current_node._jac_entry_funcs_:
-                    if not i.trigger or isinstance(warch, i.trigger):
-                        if i.func:
-                            i.func(current_node, warch)
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
-                    if walker.disengaged:
-                        return warch
-                for i in warch._jac_entry_funcs_:
-                    if not i.trigger or isinstance(current_node, i.trigger):
-                        if i.func and i.trigger:
-                            i.func(warch, current_node)
-                        elif not i.trigger:
-                            continue
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
-                    if walker.disengaged:
-                        return warch
-                for i in warch._jac_exit_funcs_:
-                    if not i.trigger or isinstance(current_node, i.trigger):
-                        if i.func and i.trigger:
-                            i.func(warch, current_node)
-                        elif not i.trigger:
-                            continue
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
-                    if walker.disengaged:
-                        return warch
-                for i in current_node._jac_exit_funcs_:
-                    if not i.trigger or isinstance(warch, i.trigger):
-                        if i.func:
-                            i.func(current_node, warch)
-                        else:
-                            raise ValueError(f"No function {i.name} to call.")
+            if current_node := walker.next.popleft().architype:
+                dispatch = DSDispatch.get(warch.__class__, current_node.__class__)
+                if dispatch.guarded and walker.disengaged:
+                    return warch
+                for i, walker_first in dispatch.steps:
+                    if not i.func:
+                        raise ValueError(f"No function {i.name} to call.")
+                    if walker_first:
+                        i.func(warch, current_node)
+                    else:
+                        i.func(current_node, warch)
                     if walker.disengaged:
                         return warch
         for i in warch._jac_exit_funcs_:
@@ -429,7 +440,7 @@ class JacWalkerImpl:
                     i.func(warch, current_node)
                 else:
                     raise ValueError(f"No function {i.name} to call.")
-        walker.ignores = []
+        walker.ignores = set()
         return warch
 
     @staticmethod
@@ -589,6 +600,7 @@ class JacFeatureImpl(
         """Create a new architype."""
         for i in on_entry + on_exit:
             i.resolve(cls)
+        DSDispatch.clear()
         if not hasattr(cls, "_jac_entry_funcs_") or not hasattr(
             cls, "_jac_exit_funcs_"
         ):
@@ -871,6 +883,7 @@ class JacFeatureImpl(
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool,
+        edge_type: Optional[type | UnionType],
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
         if isinstance(node_obj, NodeArchitype):
@@ -880,25 +893,34 @@ class JacFeatureImpl(
             if isinstance(target_obj, NodeArchitype)
             else target_obj if target_obj else None
         )
+        seen: set[int] = set()
         if edges_only:
             connected_edges: list[EdgeArchitype] = []
             for node in node_obj:
-                edges = Jac.get_edges(
-                    node.__jac__, dir, filter_func, target_obj=targ_obj_set
-                )
-                connected_edges.extend(
-                    edge for edge in edges if edge not in connected_edges
-                )
+                for edge in Jac.get_edges(
+                    node.__jac__,
+                    dir,
+                    filter_func,
+                    target_obj=targ_obj_set,
+                    edge_type=edge_type,
+                ):
+                    if id(edge) not in seen:
+                        seen.add(id(edge))
+                        connected_edges.append(edge)
             return connected_edges
         else:
             connected_nodes: list[NodeArchitype] = []
             for node in node_obj:
-                nodes = Jac.edges_to_nodes(
-                    node.__jac__, dir, filter_func, target_obj=targ_obj_set
-                )
-                connected_nodes.extend(
-                    node for node in nodes if node not in connected_nodes
-                )
+                for nd in Jac.edges_to_nodes(
+                    node.__jac__,
+                    dir,
+                    filter_func,
+                    target_obj=targ_obj_set,
+                    edge_type=edge_type,
+                ):
+                    if id(nd) not in seen:
+                        seen.add(id(nd))
+                        connected_nodes.append(nd)
             return connected_nodes
 
     @staticmethod
@@ -933,6 +955,7 @@ class JacFeatureImpl(
         right: NodeArchitype | list[NodeArchitype],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type | UnionType],
     ) -> bool:  # noqa: ANN401
         """Jac's disconnect operator feature."""
         disconnect_occurred = False
@@ -941,7 +964,11 @@ class JacFeatureImpl(
 
         for i in left:
             node = i.__jac__
-            for anchor in set(node.edges):
+            for anchor, outgoing in node.edges.find(
+                dir in [EdgeDir.OUT, EdgeDir.ANY],
+                dir in [EdgeDir.IN, EdgeDir.ANY],
+                edge_type,
+            ):
                 if (
                     (source := anchor.source)
                     and (target := anchor.target)
@@ -949,20 +976,8 @@ class JacFeatureImpl(
                     and source.architype
                     and target.architype
                 ):
-                    if (
-                        dir in [EdgeDir.OUT, EdgeDir.ANY]
-                        and node == source
-                        and target.architype in right
-                        and Jac.check_write_access(target)
-                    ):
-                        Jac.destroy(anchor) if anchor.persistent else Jac.detach(anchor)
-                        disconnect_occurred = True
-                    if (
-                        dir in [EdgeDir.IN, EdgeDir.ANY]
-                        and node == target
-                        and source.architype in right
-                        and Jac.check_write_access(source)
-                    ):
+                    other = target if outgoing else source
+                    if other.architype in right and Jac.check_write_access(other):
                         Jac.destroy(anchor) if anchor.persistent else Jac.detach(anchor)
                         disconnect_occurred = True
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import ast as ast3
 import types
+from types import UnionType
 from typing import (
     Any,
     Callable,
@@ -11,6 +12,7 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    TYPE_CHECKING,
     Type,
     TypeAlias,
     Union,
@@ -29,14 +31,16 @@ from jaclang.plugin.spec import (
     NodeAnchor,
     NodeArchitype,
     P,
-    PyastGenPass,
     Root,
     T,
     WalkerArchitype,
-    ast,
     plugin_manager,
 )
 
+if TYPE_CHECKING:
+    from jaclang.compiler import absyntree as ast
+    from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
+
 
 class JacAccessValidation:
     """Jac Access Validation Specs."""
@@ -48,7 +52,7 @@ class JacAccessValidation:
         level: AccessLevel | int | str = AccessLevel.READ,
     ) -> None:
         """Allow all access from target root graph to current Architype."""
-        plugin_manager.hook.allow_root(
+        plugin_manager.dispatch.allow_root(
             architype=architype, root_id=root_id, level=level
         )
 
@@ -59,7 +63,7 @@ class JacAccessValidation:
         level: AccessLevel | int | str = AccessLevel.READ,
     ) -> None:
         """Disallow all access from target root graph to current Architype."""
-        plugin_manager.hook.disallow_root(
+        plugin_manager.dispatch.disallow_root(
             architype=architype, root_id=root_id, level=level
         )
 
@@ -68,32 +72,37 @@ class JacAccessValidation:
         architype: Architype, level: AccessLevel | int | str = AccessLevel.READ
     ) -> None:
         """Allow everyone to access current Architype."""
-        plugin_manager.hook.unrestrict(architype=architype, level=level)
+        plugin_manager.dispatch.unrestrict(architype=architype, level=level)
 
     @staticmethod
     def restrict(architype: Architype) -> None:
         """Disallow others to access current Architype."""
-        plugin_manager.hook.restrict(architype=architype)
+        plugin_manager.dispatch.restrict(architype=architype)
 
     @staticmethod
     def check_read_access(to: Anchor) -> bool:
         """Read Access Validation."""
-        return plugin_manager.hook.check_read_access(to=to)
+        return plugin_manager.dispatch.check_read_access(to=to)
 
     @staticmethod
     def check_connect_access(to: Anchor) -> bool:
         """Write Access Validation."""
-        return plugin_manager.hook.check_connect_access(to=to)
+        return plugin_manager.dispatch.check_connect_access(to=to)
 
     @staticmethod
     def check_write_access(to: Anchor) -> bool:
         """Write Access Validation."""
-        return plugin_manager.hook.check_write_access(to=to)
+        return plugin_manager.dispatch.check_write_access(to=to)
 
     @staticmethod
     def check_access_level(to: Anchor) -> AccessLevel:
         """Access validation."""
-        return plugin_manager.hook.check_access_level(to=to)
+        return plugin_manager.dispatch.check_access_level(to=to)
+
+    @staticmethod
+    def check_access_bulk(anchors: Sequence[Anchor]) -> list[AccessLevel]:
+        """Access validation of multiple anchors."""
+        return plugin_manager.dispatch.check_access_bulk(anchors=anchors)
 
 
 class JacNode:
@@ -102,7 +111,7 @@ class JacNode:
     @staticmethod
     def node_dot(node: NodeArchitype, dot_file: Optional[str] = None) -> str:
         """Generate Dot file for visualizing nodes and edges."""
-        return plugin_manager.hook.node_dot(node=node, dot_file=dot_file)
+        return plugin_manager.dispatch.node_dot(node=node, dot_file=dot_file)
 
     @staticmethod
     def get_edges(
@@ -110,10 +119,15 @@ class JacNode:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type | UnionType] = None,
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
-        return plugin_manager.hook.get_edges(
-            node=node, dir=dir, filter_func=filter_func, target_obj=target_obj
+        return plugin_manager.dispatch.get_edges(
+            node=node,
+            dir=dir,
+            filter_func=filter_func,
+            target_obj=target_obj,
+            edge_type=edge_type,
         )
 
     @staticmethod
@@ -122,16 +136,21 @@ class JacNode:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type | UnionType] = None,
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
-        return plugin_manager.hook.edges_to_nodes(
-            node=node, dir=dir, filter_func=filter_func, target_obj=target_obj
+        return plugin_manager.dispatch.edges_to_nodes(
+            node=node,
+            dir=dir,
+            filter_func=filter_func,
+            target_obj=target_obj,
+            edge_type=edge_type,
         )
 
     @staticmethod
     def remove_edge(node: NodeAnchor, edge: EdgeAnchor) -> None:
         """Remove reference without checking sync status."""
-        return plugin_manager.hook.remove_edge(node=node, edge=edge)
+        return plugin_manager.dispatch.remove_edge(node=node, edge=edge)
 
 
 class JacEdge:
@@ -140,7 +159,7 @@ class JacEdge:
     @staticmethod
     def detach(edge: EdgeAnchor) -> None:
         """Detach edge from nodes."""
-        return plugin_manager.hook.detach(edge=edge)
+        return plugin_manager.dispatch.detach(edge=edge)
 
 
 class JacWalker:
@@ -158,7 +177,7 @@ class JacWalker:
         ),
     ) -> bool:  # noqa: ANN401
         """Jac's visit stmt feature."""
-        return plugin_manager.hook.visit_node(walker=walker, expr=expr)
+        return plugin_manager.dispatch.visit_node(walker=walker, expr=expr)
 
     @staticmethod
     def ignore(
@@ -172,17 +191,17 @@ class JacWalker:
         ),
     ) -> bool:  # noqa: ANN401
         """Jac's ignore stmt feature."""
-        return plugin_manager.hook.ignore(walker=walker, expr=expr)
+        return plugin_manager.dispatch.ignore(walker=walker, expr=expr)
 
     @staticmethod
     def spawn_call(op1: Architype, op2: Architype) -> WalkerArchitype:
         """Jac's spawn operator feature."""
-        return plugin_manager.hook.spawn_call(op1=op1, op2=op2)
+        return plugin_manager.dispatch.spawn_call(op1=op1, op2=op2)
 
     @staticmethod
     def disengage(walker: WalkerArchitype) -> bool:
         """Jac's disengage stmt feature."""
-        return plugin_manager.hook.disengage(walker=walker)
+        return plugin_manager.dispatch.disengage(walker=walker)
 
 
 class JacClassReferences:
@@ -212,7 +231,7 @@ class JacBuiltin:
         dot_file: Optional[str],
     ) -> str:
         """Generate Dot file for visualizing nodes and edges."""
-        return plugin_manager.hook.dotgen(
+        return plugin_manager.dispatch.dotgen(
             node=node,
             depth=depth,
             traverse=traverse,
@@ -230,7 +249,7 @@ class JacCmd:
     @staticmethod
     def create_cmd() -> None:
         """Create Jac CLI cmds."""
-        return plugin_manager.hook.create_cmd()
+        return plugin_manager.dispatch.create_cmd()
 
 
 class JacFeature(
@@ -247,22 +266,22 @@ class JacFeature(
     @staticmethod
     def setup() -> None:
         """Set Class References."""
-        plugin_manager.hook.setup()
+        plugin_manager.dispatch.setup()
 
     @staticmethod
     def get_context() -> ExecutionContext:
         """Get current execution context."""
-        return plugin_manager.hook.get_context()
+        return plugin_manager.dispatch.get_context()
 
     @staticmethod
     def get_object(id: str) -> Architype | None:
         """Get object given id."""
-        return plugin_manager.hook.get_object(id=id)
+        return plugin_manager.dispatch.get_object(id=id)
 
     @staticmethod
     def object_ref(obj: Architype) -> str:
         """Get object reference id."""
-        return plugin_manager.hook.object_ref(obj=obj)
+        return plugin_manager.dispatch.object_ref(obj=obj)
 
     @staticmethod
     def make_architype(
@@ -272,7 +291,7 @@ class JacFeature(
         on_exit: list[DSFunc],
     ) -> Type[Architype]:
         """Create a obj architype."""
-        return plugin_manager.hook.make_architype(
+        return plugin_manager.dispatch.make_architype(
             cls=cls, on_entry=on_entry, on_exit=on_exit, arch_base=arch_base
         )
 
@@ -281,35 +300,35 @@ class JacFeature(
         on_entry: list[DSFunc], on_exit: list[DSFunc]
     ) -> Callable[[type], type]:
         """Create a obj architype."""
-        return plugin_manager.hook.make_obj(on_entry=on_entry, on_exit=on_exit)
+        return plugin_manager.dispatch.make_obj(on_entry=on_entry, on_exit=on_exit)
 
     @staticmethod
     def make_node(
         on_entry: list[DSFunc], on_exit: list[DSFunc]
     ) -> Callable[[type], type]:
         """Create a node architype."""
-        return plugin_manager.hook.make_node(on_entry=on_entry, on_exit=on_exit)
+        return plugin_manager.dispatch.make_node(on_entry=on_entry, on_exit=on_exit)
 
     @staticmethod
     def make_edge(
         on_entry: list[DSFunc], on_exit: list[DSFunc]
     ) -> Callable[[type], type]:
         """Create a edge architype."""
-        return plugin_manager.hook.make_edge(on_entry=on_entry, on_exit=on_exit)
+        return plugin_manager.dispatch.make_edge(on_entry=on_entry, on_exit=on_exit)
 
     @staticmethod
     def make_walker(
         on_entry: list[DSFunc], on_exit: list[DSFunc]
     ) -> Callable[[type], type]:
         """Create a walker architype."""
-        return plugin_manager.hook.make_walker(on_entry=on_entry, on_exit=on_exit)
+        return plugin_manager.dispatch.make_walker(on_entry=on_entry, on_exit=on_exit)
 
     @staticmethod
     def impl_patch_filename(
         file_loc: str,
     ) -> Callable[[Callable[P, T]], Callable[P, T]]:
         """Update impl file location."""
-        return plugin_manager.hook.impl_patch_filename(file_loc=file_loc)
+        return plugin_manager.dispatch.impl_patch_filename(file_loc=file_loc)
 
     @staticmethod
     def jac_import(
@@ -324,7 +343,7 @@ class JacFeature(
         reload_module: Optional[bool] = False,
     ) -> tuple[types.ModuleType, ...]:
         """Core Import Process."""
-        return plugin_manager.hook.jac_import(
+        return plugin_manager.dispatch.jac_import(
             target=target,
             base_path=base_path,
             absorb=absorb,
@@ -339,7 +358,7 @@ class JacFeature(
     @staticmethod
     def create_test(test_fun: Callable) -> Callable:
         """Create a test."""
-        return plugin_manager.hook.create_test(test_fun=test_fun)
+        return plugin_manager.dispatch.create_test(test_fun=test_fun)
 
     @staticmethod
     def run_test(
@@ -351,7 +370,7 @@ class JacFeature(
         verbose: bool = False,
     ) -> int:
         """Run the test suite in the specified .jac file."""
-        return plugin_manager.hook.run_test(
+        return plugin_manager.dispatch.run_test(
             filepath=filepath,
             filter=filter,
             xit=xit,
@@ -363,17 +382,17 @@ class JacFeature(
     @staticmethod
     def elvis(op1: Optional[T], op2: T) -> T:
         """Jac's elvis operator feature."""
-        return plugin_manager.hook.elvis(op1=op1, op2=op2)
+        return plugin_manager.dispatch.elvis(op1=op1, op2=op2)
 
     @staticmethod
     def has_instance_default(gen_func: Callable[[], T]) -> T:
         """Jac's has container default feature."""
-        return plugin_manager.hook.has_instance_default(gen_func=gen_func)
+        return plugin_manager.dispatch.has_instance_default(gen_func=gen_func)
 
     @staticmethod
     def report(expr: Any, custom: bool = False) -> None:  # noqa: ANN401
         """Jac's report stmt feature."""
-        plugin_manager.hook.report(expr=expr, custom=custom)
+        plugin_manager.dispatch.report(expr=expr, custom=custom)
 
     @staticmethod
     def edge_ref(
@@ -382,14 +401,16 @@ class JacFeature(
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool = False,
+        edge_type: Optional[type | UnionType] = None,
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
-        return plugin_manager.hook.edge_ref(
+        return plugin_manager.dispatch.edge_ref(
             node_obj=node_obj,
             target_obj=target_obj,
             dir=dir,
             filter_func=filter_func,
             edges_only=edges_only,
+            edge_type=edge_type,
         )
 
     @staticmethod
@@ -403,7 +424,7 @@ class JacFeature(
 
         Note: connect needs to call assign compr with tuple in op
         """
-        return plugin_manager.hook.connect(
+        return plugin_manager.dispatch.connect(
             left=left, right=right, edge_spec=edge_spec, edges_only=edges_only
         )
 
@@ -413,13 +434,15 @@ class JacFeature(
         right: NodeArchitype | list[NodeArchitype],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type | UnionType] = None,
     ) -> bool:
         """Jac's disconnect operator feature."""
-        return plugin_manager.hook.disconnect(
+        return plugin_manager.dispatch.disconnect(
             left=left,
             right=right,
             dir=dir,
             filter_func=filter_func,
+            edge_type=edge_type,
         )
 
     @staticmethod
@@ -427,17 +450,17 @@ class JacFeature(
         target: list[T], attr_val: tuple[tuple[str], tuple[Any]]
     ) -> list[T]:
         """Jac's assign comprehension feature."""
-        return plugin_manager.hook.assign_compr(target=target, attr_val=attr_val)
+        return plugin_manager.dispatch.assign_compr(target=target, attr_val=attr_val)
 
     @staticmethod
     def get_root() -> Root:
         """Jac's root getter."""
-        return plugin_manager.hook.get_root()
+        return plugin_manager.dispatch.get_root()
 
     @staticmethod
     def get_root_type() -> Type[Root]:
         """Jac's root type getter."""
-        return plugin_manager.hook.get_root_type()
+        return plugin_manager.dispatch.get_root_type()
 
     @staticmethod
     def build_edge(
@@ -446,7 +469,7 @@ class JacFeature(
         conn_assign: Optional[tuple[tuple, tuple]],
     ) -> Callable[[NodeAnchor, NodeAnchor], EdgeArchitype]:
         """Jac's root getter."""
-        return plugin_manager.hook.build_edge(
+        return plugin_manager.dispatch.build_edge(
             is_undirected=is_undirected, conn_type=conn_type, conn_assign=conn_assign
         )
 
@@ -455,33 +478,33 @@ class JacFeature(
         obj: Architype | Anchor,
     ) -> None:
         """Destroy object."""
-        plugin_manager.hook.save(obj=obj)
+        plugin_manager.dispatch.save(obj=obj)
 
     @staticmethod
     def destroy(
         obj: Architype | Anchor,
     ) -> None:
         """Destroy object."""
-        plugin_manager.hook.destroy(obj=obj)
+        plugin_manager.dispatch.destroy(obj=obj)
 
     @staticmethod
     def get_semstr_type(
         file_loc: str, scope: str, attr: str, return_semstr: bool
     ) -> Optional[str]:
         """Jac's get_semstr_type feature."""
-        return plugin_manager.hook.get_semstr_type(
+        return plugin_manager.dispatch.get_semstr_type(
             file_loc=file_loc, scope=scope, attr=attr, return_semstr=return_semstr
         )
 
     @staticmethod
     def obj_scope(file_loc: str, attr: str) -> str:
         """Jac's get_semstr_type feature."""
-        return plugin_manager.hook.obj_scope(file_loc=file_loc, attr=attr)
+        return plugin_manager.dispatch.obj_scope(file_loc=file_loc, attr=attr)
 
     @staticmethod
     def get_sem_type(file_loc: str, attr: str) -> tuple[str | None, str | None]:
         """Jac's get_semstr_type feature."""
-        return plugin_manager.hook.get_sem_type(file_loc=file_loc, attr=attr)
+        return plugin_manager.dispatch.get_sem_type(file_loc=file_loc, attr=attr)
 
     @staticmethod
     def with_llm(
@@ -498,7 +521,7 @@ class JacFeature(
         _locals: Mapping,
     ) -> Any:  # noqa: ANN401
         """Jac's with_llm feature."""
-        return plugin_manager.hook.with_llm(
+        return plugin_manager.dispatch.with_llm(
             file_loc=file_loc,
             model=model,
             model_params=model_params,
@@ -515,7 +538,7 @@ class JacFeature(
     @staticmethod
     def gen_llm_body(_pass: PyastGenPass, node: ast.Ability) -> list[ast3.AST]:
         """Generate the by LLM body."""
-        return plugin_manager.hook.gen_llm_body(_pass=_pass, node=node)
+        return plugin_manager.dispatch.gen_llm_body(_pass=_pass, node=node)
 
     @staticmethod
     def by_llm_call(
@@ -530,7 +553,7 @@ class JacFeature(
         exclude_info: list[tuple[str, ast3.AST]],
     ) -> ast3.Call:
         """Return the LLM Call, e.g. _Jac.with_llm()."""
-        return plugin_manager.hook.by_llm_call(
+        return plugin_manager.dispatch.by_llm_call(
             _pass=_pass,
             model=model,
             model_params=model_params,
@@ -545,4 +568,4 @@ class JacFeature(
     @staticmethod
     def get_by_llm_call_args(_pass: PyastGenPass, node: ast.FuncCall) -> dict:
         """Get the by LLM call args."""
-        return plugin_manager.hook.get_by_llm_call_args(_pass=_pass, node=node)
+        return plugin_manager.dispatch.get_by_llm_call_args(_pass=_pass, node=node)
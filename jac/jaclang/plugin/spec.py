@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import ast as ast3
 import types
+from types import UnionType
 from typing import (
     Any,
     Callable,
@@ -11,15 +12,14 @@ from typing import (
     Optional,
     ParamSpec,
     Sequence,
+    TYPE_CHECKING,
     Type,
     TypeVar,
     Union,
 )
 from uuid import UUID
 
-from jaclang.compiler import absyntree as ast
 from jaclang.compiler.constant import EdgeDir
-from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
 from jaclang.runtimelib.constructs import (
     AccessLevel,
     Anchor,
@@ -36,8 +36,115 @@ from jaclang.runtimelib.context import ExecutionContext
 
 import pluggy
 
+if TYPE_CHECKING:
+    from jaclang.compiler import absyntree as ast
+    from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
+
 hookspec = pluggy.HookspecMarker("jac")
-plugin_manager = pluggy.PluginManager("jac")
+
+
+class HookDispatch:
+    """Hook callables resolved to their implementations."""
+
+    def __init__(self, manager: JacPluginManager) -> None:
+        """Initialize hook dispatch."""
+        self._manager = manager
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """Resolve and cache the callable of the hook."""
+        func = self._resolve(getattr(self._manager.hook, name))
+        setattr(self, name, func)
+        return func
+
+    def _resolve(self, caller: pluggy.HookCaller) -> Callable[..., Any]:
+        """Bind the hook directly when pluggy's call loop is not needed."""
+        if (
+            not caller.spec
+            or not caller.spec.opts.get("firstresult")
+            or caller.is_historic()
+            or self._manager.is_monitored()
+        ):
+            return caller
+
+        impls = caller.get_hookimpls()
+        if not impls or any(
+            impl.wrapper
+            or impl.hookwrapper
+            or impl.argnames != caller.spec.argnames
+            or impl.kwargnames
+            for impl in impls
+        ):
+            return caller
+
+        if len(impls) == 1:
+            return impls[0].function
+
+        # pluggy calls the last registered implementation first
+        funcs = tuple(impl.function for impl in reversed(impls))
+
+        def first_result(**kwargs: Any) -> Any:  # noqa: ANN401
+            for func in funcs:
+                if (res := func(**kwargs)) is not None:
+                    return res
+            return None
+
+        return first_result
+
+    def reset(self) -> None:
+        """Drop every resolved hook, plugins or tracers have changed."""
+        for name in [name for name in vars(self) if name != "_manager"]:
+            delattr(self, name)
+
+
+class JacPluginManager(pluggy.PluginManager):
+    """Plugin manager with hooks bound directly to their implementations."""
+
+    def __init__(self, project_name: str) -> None:
+        """Initialize plugin manager."""
+        super().__init__(project_name)
+        self._default_hookexec = self._inner_hookexec
+        self.dispatch = HookDispatch(self)
+
+    def is_monitored(self) -> bool:
+        """Check if hook calls are traced."""
+        return self._inner_hookexec is not self._default_hookexec
+
+    def add_hookspecs(self, module_or_class: types.ModuleType | type) -> None:
+        """Add new hook specifications."""
+        super().add_hookspecs(module_or_class)
+        self.dispatch.reset()
+
+    def register(self, plugin: object, name: Optional[str] = None) -> Optional[str]:
+        """Register a plugin."""
+        try:
+            return super().register(plugin, name)
+        finally:
+            self.dispatch.reset()
+
+    def unregister(
+        self, plugin: Optional[object] = None, name: Optional[str] = None
+    ) -> Optional[Any]:  # noqa: ANN401
+        """Unregister a plugin."""
+        try:
+            return super().unregister(plugin, name)
+        finally:
+            self.dispatch.reset()
+
+    def add_hookcall_monitoring(
+        self, before: Callable[..., None], after: Callable[..., None]
+    ) -> Callable[[], None]:
+        """Add before/after tracing functions for all hooks."""
+        undo = super().add_hookcall_monitoring(before, after)
+        self.dispatch.reset()
+
+        def reset_undo() -> None:
+            undo()
+            self.dispatch.reset()
+
+        return reset_undo
+
+
+plugin_manager = JacPluginManager("jac")
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -98,6 +205,12 @@ class JacAccessValidationSpec:
         """Access validation."""
         raise NotImplementedError
 
+    @staticmethod
+    @hookspec(firstresult=True)
+    def check_access_bulk(anchors: Sequence[Anchor]) -> list[AccessLevel]:
+        """Access validation of multiple anchors."""
+        raise NotImplementedError
+
 
 class JacNodeSpec:
     """Jac Node Operations."""
@@ -115,6 +228,7 @@ class JacNodeSpec:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type | UnionType],
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
         raise NotImplementedError
@@ -126,6 +240,7 @@ class JacNodeSpec:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type | UnionType],
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
         raise NotImplementedError
@@ -368,6 +483,7 @@ class JacFeatureSpec(
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool,
+        edge_type: Optional[type | UnionType],
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
         raise NotImplementedError
@@ -393,6 +509,7 @@ class JacFeatureSpec(
         right: NodeArchitype | list[NodeArchitype],
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        edge_type: Optional[type | UnionType],
     ) -> bool:  # noqa: ANN401
         """Jac's disconnect operator feature."""
         raise NotImplementedError
@@ -1,11 +1,21 @@
 """Tests for Jac parser."""
 
 import inspect
+import pickle
 from typing import List, Type
+from unittest import mock
 
-from jaclang.plugin.default import JacFeatureImpl
+from jaclang.compiler.constant import EdgeDir
+from jaclang.plugin.default import JacFeatureImpl, hookimpl
 from jaclang.plugin.feature import JacFeature
-from jaclang.plugin.spec import JacFeatureSpec
+from jaclang.plugin.spec import JacFeatureSpec, plugin_manager
+from jaclang.runtimelib.architype import Anchor, DEFAULT_PERMISSION, EdgeIndex
+from jaclang.runtimelib.constructs import (
+    AccessLevel,
+    ExecutionContext,
+    NodeArchitype,
+    Root,
+)
 from jaclang.utils.test import TestCase
 
 
@@ -54,3 +64,161 @@ class TestFeatures(TestCase):
         self.assertEqual(jac_feature_spec_methods, jac_feature_defaults_methods)
         for i in jac_feature_spec_methods:
             self.assertIn(i, jac_feature_methods)
+
+    def test_hook_dispatch(self) -> None:
+        """Test hooks are bound directly and rebound on plugin changes."""
+        calls: list[str] = []
+
+        class Override:
+            """Plugin that defers get_root to the default impl."""
+
+            @staticmethod
+            @hookimpl
+            def get_root() -> None:
+                """Record the call."""
+                calls.append("override")
+
+        dispatch = plugin_manager.dispatch
+        root = JacFeature.get_root()
+        self.assertIs(dispatch.get_root, JacFeatureImpl.get_root)
+        self.assertIs(dispatch.create_cmd, plugin_manager.hook.create_cmd)
+
+        plugin_manager.register(Override)
+        try:
+            self.assertIsNot(dispatch.get_root, JacFeatureImpl.get_root)
+            self.assertIs(JacFeature.get_root(), root)
+            self.assertEqual(calls, ["override"])
+
+            undo = plugin_manager.add_hookcall_monitoring(
+                lambda *args: calls.append("traced"), lambda *args: None
+            )
+            self.assertIs(JacFeature.get_root(), root)
+            self.assertEqual(calls, ["override", "traced", "override"])
+            undo()
+            self.assertIsNot(dispatch.get_root, plugin_manager.hook.get_root)
+        finally:
+            plugin_manager.unregister(Override)
+        self.assertIs(dispatch.get_root, JacFeatureImpl.get_root)
+
+    def test_check_access_bulk(self) -> None:
+        """Test bulk access validation matches per anchor validation."""
+        ctx = ExecutionContext.create()
+        try:
+            other_root = Root().__jac__
+            other_root.persistent = True
+            ctx.mem.set(other_root.id, other_root)
+            ctx.root = Root().__jac__
+            ctx.root.persistent = True
+
+            anchors = [NodeArchitype().__jac__ for _ in range(5)]
+            for anchor in anchors[1:]:
+                anchor.persistent = True
+                anchor.root = other_root.id
+            anchors[2].root = ctx.root.id
+            JacFeature.unrestrict(anchors[3].architype, "CONNECT")
+            JacFeature.allow_root(anchors[4].architype, ctx.root.id, "READ")
+
+            expected = [
+                AccessLevel.WRITE,
+                AccessLevel.NO_ACCESS,
+                AccessLevel.WRITE,
+                AccessLevel.CONNECT,
+                AccessLevel.READ,
+            ]
+            with self.assertLogs("jaclang.plugin.default", "INFO") as logs:
+                self.assertEqual(JacFeature.check_access_bulk(anchors), expected)
+            self.assertEqual(
+                logs.output,
+                [
+                    "INFO:jaclang.plugin.default:Current root doesn't have read"
+                    f" access to NodeAnchor[{anchors[1].id}]"
+                ],
+            )
+            self.assertEqual(
+                [JacFeature.check_access_level(anchor) for anchor in anchors],
+                expected,
+            )
+
+            JacFeature.allow_root(other_root.architype, ctx.root.id, "WRITE")
+            self.assertEqual(
+                JacFeature.check_access_bulk(anchors),
+                [JacFeature.check_access_level(anchor) for anchor in anchors],
+            )
+            self.assertEqual(
+                JacFeature.check_access_bulk(anchors)[1], AccessLevel.WRITE
+            )
+
+            class Override:
+                @staticmethod
+                @hookimpl
+                def check_access_level(to: object) -> AccessLevel:
+                    """Allow reading only."""
+                    return AccessLevel.READ
+
+            # overriding the single anchor hook applies to bulk validation
+            plugin_manager.register(Override)
+            try:
+                self.assertEqual(
+                    JacFeature.check_access_bulk(anchors), [AccessLevel.READ] * 5
+                )
+            finally:
+                plugin_manager.unregister(Override)
+        finally:
+            ctx.close()
+
+    def test_anchor_layout(self) -> None:
+        """Test slotted anchors share the default permission until restricted."""
+        anchors = [NodeArchitype().__jac__ for _ in range(3)]
+        self.assertFalse(hasattr(anchors[0], "__dict__"))
+        self.assertTrue(all(a.access is DEFAULT_PERMISSION for a in anchors))
+        with self.assertRaises(AttributeError):
+            DEFAULT_PERMISSION.all = AccessLevel.WRITE
+
+        JacFeature.unrestrict(anchors[1].architype, "READ")
+        JacFeature.allow_root(anchors[2].architype, anchors[0].id, "WRITE")
+        self.assertIsNot(anchors[1].access, DEFAULT_PERMISSION)
+        self.assertEqual(anchors[1].access.all, AccessLevel.READ)
+        self.assertEqual(
+            anchors[2].access.roots.check(str(anchors[0].id)), AccessLevel.WRITE
+        )
+        self.assertEqual(DEFAULT_PERMISSION.all, AccessLevel.NO_ACCESS)
+        self.assertEqual(dict(DEFAULT_PERMISSION.roots.anchors), {})
+
+        loaded = pickle.loads(pickle.dumps(anchors[0]))
+        self.assertIs(loaded.access, DEFAULT_PERMISSION)
+        stub = anchors[0].make_stub()
+        self.assertFalse(stub.is_populated())
+        stub.sync(loaded)
+        self.assertTrue(stub.is_populated())
+        self.assertIs(stub.architype, loaded.architype)
+
+    def test_untyped_edge_query_pages(self) -> None:
+        """Test queries of any edge type index pending edges a page at a time."""
+        ctx = ExecutionContext.create()
+        try:
+            hub = NodeArchitype()
+            nodes = [NodeArchitype() for _ in range(250)]
+            JacFeature.connect(
+                hub, nodes, JacFeature.build_edge(False, None, None), True
+            )
+            anchor = hub.__jac__
+            # edges loaded from a session without index keys
+            anchor.edges = edges = EdgeIndex(anchor.edges)
+            edges.owner = anchor
+            self.assertEqual(len(edges.pending), 250)
+
+            with mock.patch.object(Anchor, "populate_many") as populate_many:
+                found = edges.find(True, True)
+                self.assertEqual(next(found)[1], True)
+                self.assertEqual(len(edges.pending), 150)
+                self.assertEqual(len(populate_many.call_args_list[0][0][0]), 100)
+
+                self.assertEqual(len(list(found)), 249)
+                self.assertEqual(len(edges.pending), 0)
+                self.assertEqual(populate_many.call_count, 6)
+            self.assertEqual(
+                JacFeature.edges_to_nodes(anchor, EdgeDir.OUT, None, None, None),
+                nodes,
+            )
+        finally:
+            ctx.close()
@@ -3,8 +3,12 @@
 import io
 import os
 import sys
+from uuid import UUID
 
 from jaclang.cli import cli
+from jaclang.compiler.constant import EdgeDir
+from jaclang.plugin.feature import JacFeature
+from jaclang.runtimelib.context import ExecutionContext
 from jaclang.utils.test import TestCase
 
 session = ""
@@ -58,6 +62,58 @@ class TestJaseciPlugin(TestCase):
         self.assertEqual(output, "node a\nnode b")
         self._del_session(session)
 
+    def test_walker_simple_persistent_sqlite(self) -> None:
+        """Test simple persistent object on a SQLite session."""
+        path = self.fixture_abs_path("test_walker_simple_persistent_sqlite.db")
+        session = f"sqlite:///{path}"
+        self._output2buffer()
+        cli.enter(
+            filename=self.fixture_abs_path("simple_persistent.jac"),
+            session=session,
+            entrypoint="create",
+            args=[],
+        )
+        cli.enter(
+            filename=self.fixture_abs_path("simple_persistent.jac"),
+            session=session,
+            entrypoint="traverse",
+            args=[],
+        )
+        output = self.capturedOutput.getvalue().strip()
+        self.assertEqual(output, "node a\nnode b")
+        self._del_session(path)
+
+    def test_prefetch(self) -> None:
+        """Test missing anchors are loaded with a single bulk read."""
+        path = self.fixture_abs_path("test_prefetch.db")
+        session = f"sqlite:///{path}"
+        cli.enter(
+            filename=self.fixture_abs_path("simple_persistent.jac"),
+            session=session,
+            entrypoint="create",
+            args=[],
+        )
+
+        ctx = ExecutionContext.create(session=session)
+        mem = ctx.mem
+        ids = [UUID(key) for key in mem.__shelf__]
+        missing = [id for id in ids if id not in mem.__mem__]
+        self.assertEqual(len(missing), 4)
+
+        reads: list[int] = []
+        get_many = mem.__shelf__.dict.get_many
+        mem.__shelf__.dict.get_many = lambda keys: reads.append(len(keys)) or get_many(
+            keys
+        )
+        mem.prefetch(ids)
+        self.assertEqual(reads, [4])
+        self.assertTrue(all(id in mem.__mem__ for id in ids))
+
+        mem.prefetch(ids)
+        self.assertEqual(reads, [4])
+        ctx.close()
+        self._del_session(path)
+
     def test_entrypoint_root(self) -> None:
         """Test entrypoint being root."""
         session = self.fixture_abs_path("test_entrypoint_root.session")
@@ -269,6 +325,103 @@ class TestJaseciPlugin(TestCase):
         )
         self._del_session(session)
 
+    def test_session_dirty_tracking(self) -> None:
+        """Test only changed anchors are written back on close."""
+        session = self.fixture_abs_path("test_session_dirty_tracking.session")
+        cli.enter(
+            filename=self.fixture_abs_path("simple_persistent.jac"),
+            session=session,
+            entrypoint="create",
+            args=[],
+        )
+
+        ctx = ExecutionContext.create(session=session)
+        [node_a] = [edge.target.architype for edge in ctx.root.edges]
+        [(edge, _)] = node_a.__jac__.edges.find(outgoing=True, incoming=False)
+        node_b = edge.target.architype
+        self.assertEqual((node_a.name, node_b.name), ("node a", "node b"))
+        ctx.close()
+        self.assertEqual(ctx.mem.flushed, 0)
+        self.assertEqual(ctx.mem.skipped, 5)
+
+        ctx = ExecutionContext.create(session=session)
+        [node_a] = [edge.target.architype for edge in ctx.root.edges]
+        node_a.name = "node c"
+        ctx.close()
+        self.assertEqual(ctx.mem.flushed, 1)
+        self.assertEqual(ctx.mem.skipped, 2)
+
+        self._output2buffer()
+        cli.enter(
+            filename=self.fixture_abs_path("simple_persistent.jac"),
+            session=session,
+            entrypoint="traverse",
+            args=[],
+        )
+        self.assertEqual(self.capturedOutput.getvalue().strip(), "node c\nnode b")
+        self._del_session(session)
+
+    def test_session_flush_counters(self) -> None:
+        """Test close counts only anchors actually written or deleted."""
+        session = self.fixture_abs_path("test_session_flush_counters.session")
+        cli.enter(
+            filename=self.fixture_abs_path("simple_persistent.jac"),
+            session=session,
+            entrypoint="create",
+            args=[],
+        )
+
+        ctx = ExecutionContext.create(session=session)
+        [node_a] = [edge.target.architype for edge in ctx.root.edges]
+        [(edge, _)] = node_a.__jac__.edges.find(outgoing=True, incoming=False)
+        node_b = edge.target.architype
+        node_a.name = "node c"
+        self.assertTrue(JacFeature.disconnect(node_a, node_b, EdgeDir.OUT, None, None))
+        with self.assertLogs("jaclang.runtimelib.memory", "INFO") as logs:
+            ctx.close()
+        # node a is written, the edge to node b and the now unreachable node b
+        # are deleted, root and its edge to node a are unchanged
+        self.assertEqual((ctx.mem.flushed, ctx.mem.deleted, ctx.mem.skipped), (1, 2, 2))
+        self.assertEqual(
+            logs.output,
+            [
+                "INFO:jaclang.runtimelib.memory:Session closed: 1 anchors flushed,"
+                " 2 unchanged skipped, 2 deleted"
+            ],
+        )
+
+        self._output2buffer()
+        cli.enter(
+            filename=self.fixture_abs_path("simple_persistent.jac"),
+            session=session,
+            entrypoint="traverse",
+            args=[],
+        )
+        self.assertEqual(self.capturedOutput.getvalue().strip(), "node c")
+        self._del_session(session)
+
+    def test_lazy_edge_loading(self) -> None:
+        """Test typed queries only load matching edges of a supernode."""
+        session = self.fixture_abs_path("test_lazy_edge_loading.session")
+        cli.enter(
+            filename=self.fixture_abs_path("supernode.jac"),
+            session=session,
+            entrypoint="build",
+            args=[],
+        )
+        self._output2buffer()
+        cli.enter(
+            filename=self.fixture_abs_path("supernode.jac"),
+            session=session,
+            entrypoint="query",
+            args=[],
+        )
+        self.assertEqual(
+            self.capturedOutput.getvalue().strip().split("\n"),
+            ["[-1]", "2", "300", "600"],
+        )
+        self._del_session(session)
+
     def trigger_access_validation_test(
         self, give_access_to_full_graph: bool, via_all: bool = False
     ) -> None:
@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import asdict, dataclass, field, fields, is_dataclass
-from enum import IntEnum
+from enum import Enum, IntEnum
 from logging import getLogger
 from pickle import dumps
-from types import UnionType
-from typing import Any, Callable, ClassVar, Optional, TypeVar
+from types import MappingProxyType, UnionType
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Optional, TypeVar
 from uuid import UUID, uuid4
 
 logger = getLogger(__name__)
 
 TARCH = TypeVar("TARCH", bound="Architype")
 TANCH = TypeVar("TANCH", bound="Anchor")
+EdgeKey = tuple[bool, str]
+EdgeKeys = tuple[EdgeKey, ...]
+
+
+IMMUTABLE_TYPES = (int, float, complex, str, bytes, UUID, Enum, type(None))
+
+
+def is_immutable(val: object) -> bool:
+    """Check if value can only change through reassignment."""
+    if isinstance(val, (tuple, frozenset)):
+        return all(is_immutable(i) for i in val)
+    return isinstance(val, IMMUTABLE_TYPES)
 
 
 class AccessLevel(IntEnum):
@@ -36,7 +49,7 @@ class AccessLevel(IntEnum):
                 return val
 
 
-@dataclass
+@dataclass(slots=True)
 class Access:
     """Access Structure."""
 
@@ -47,7 +60,7 @@ class Access:
         return self.anchors.get(anchor, AccessLevel.NO_ACCESS)
 
 
-@dataclass
+@dataclass(slots=True)
 class Permission:
     """Anchor Access Handler."""
 
@@ -55,6 +68,34 @@ class Permission:
     roots: Access = field(default_factory=Access)
 
 
+class SharedPermission(Permission):
+    """Read-only permission shared by every anchor that was never restricted."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        """Create the empty permission."""
+        object.__setattr__(self, "all", AccessLevel.NO_ACCESS)
+        object.__setattr__(
+            self, "roots", Access(anchors=MappingProxyType({}))  # type: ignore[arg-type]
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Reject changes, they have to go through Anchor.writable_access."""
+        raise AttributeError("Shared default permission is read-only!")
+
+    def __hash__(self) -> int:
+        """Hash by identity, the shared instance never changes."""
+        return id(self)
+
+    def __reduce__(self) -> str:
+        """Unpickle as the shared instance."""
+        return "DEFAULT_PERMISSION"
+
+
+DEFAULT_PERMISSION = SharedPermission()
+
+
 @dataclass
 class AnchorReport:
     """Report Handler."""
@@ -63,20 +104,63 @@ class AnchorReport:
     context: dict[str, Any]
 
 
-@dataclass(eq=False, repr=False, kw_only=True)
+@dataclass(eq=False, repr=False, kw_only=True, slots=True)
 class Anchor:
-    """Object Anchor."""
+    """Object Anchor.
+
+    Anchors are slotted: a stub only has its id set and every other slot stays
+    empty until populated. Unrestricted anchors share DEFAULT_PERMISSION.
+    """
 
     architype: Architype
     id: UUID = field(default_factory=uuid4)
     root: Optional[UUID] = None
-    access: Permission = field(default_factory=Permission)
+    access: Permission = DEFAULT_PERMISSION
     persistent: bool = False
     hash: int = 0
 
+    # set on every assignment to the anchor, its architype or its edges
+    # cleared once loaded from a datasource so unchanged anchors are skipped
+    dirty: bool = field(default=True, init=False, repr=False)
+
+    __slot_names__: ClassVar[dict[type[Anchor], tuple[str, ...]]] = {}
+
+    @classmethod
+    def slot_names(cls) -> tuple[str, ...]:
+        """Get the slots of every class of the anchor type."""
+        if (names := Anchor.__slot_names__.get(cls)) is None:
+            names = Anchor.__slot_names__[cls] = tuple(
+                name
+                for base in cls.__mro__
+                for name in base.__dict__.get("__slots__", ())
+                if not name.startswith("__")
+            )
+        return names
+
     def is_populated(self) -> bool:
         """Check if state."""
-        return "architype" in self.__dict__
+        try:
+            object.__getattribute__(self, "architype")
+        except AttributeError:
+            return False
+        return True
+
+    def sync(self, anchor: Anchor) -> None:
+        """Copy the state of a loaded anchor into this one."""
+        for name in anchor.slot_names():
+            try:
+                value = object.__getattribute__(anchor, name)
+            except AttributeError:
+                continue
+            object.__setattr__(self, name, value)
+        if anchor.__class__.__dictoffset__:
+            self.__dict__.update(anchor.__dict__)
+
+    def writable_access(self) -> Permission:
+        """Get the access of the anchor, detached from the shared default."""
+        if self.access is DEFAULT_PERMISSION:
+            self.access = Permission()
+        return self.access
 
     def make_stub(self: TANCH) -> TANCH:
         """Return unsynced copy of anchor."""
@@ -93,7 +177,35 @@ class Anchor:
         jsrc = Jac.get_context().mem
 
         if anchor := jsrc.find_by_id(self.id):
-            self.__dict__.update(anchor.__dict__)
+            self.sync(anchor)
+
+    @staticmethod
+    def populate_many(anchors: Iterable[Anchor]) -> None:
+        """Retrieve multiple Architypes from db in one read."""
+        if stubs := [anchor for anchor in anchors if not anchor.is_populated()]:
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            found = {
+                anchor.id: anchor
+                for anchor in Jac.get_context().mem.find(stub.id for stub in stubs)
+            }
+            for stub in stubs:
+                if anchor := found.get(stub.id):
+                    stub.sync(anchor)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Flag anchor as changed."""
+        object.__setattr__(self, name, value)
+        if name != "dirty":
+            object.__setattr__(self, "dirty", True)
+
+    def is_tracked(self) -> bool:
+        """Check if every change of the anchor goes through attribute assignment."""
+        return all(
+            is_immutable(val)
+            for key, val in self.architype.__dict__.items()
+            if key != "__jac__"
+        )
 
     def __getattr__(self, name: str) -> object:
         """Trigger load if detects unloaded state."""
@@ -130,20 +242,23 @@ class Anchor:
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         """Deserialize Anchor."""
-        self.__dict__.update(state)
+        for key, val in state.items():
+            object.__setattr__(self, key, val)
 
         if self.is_populated() and self.architype:
             self.architype.__jac__ = self
-            self.hash = hash(dumps(self))
+            # in-place mutations of container attributes can't be tracked
+            self.hash = 0 if self.is_tracked() else hash(dumps(self))
+            object.__setattr__(self, "dirty", False)
 
     def __repr__(self) -> str:
         """Override representation."""
         if self.is_populated():
-            attrs = ""
-            for f in fields(self):
-                if f.name in self.__dict__:
-                    attrs += f"{f.name}={self.__dict__[f.name]}, "
-            attrs = attrs[:-2]
+            attrs = ", ".join(
+                f"{f.name}={object.__getattribute__(self, f.name)}"
+                for f in fields(self)
+                if f.repr and f.name in self.slot_names()
+            )
         else:
             attrs = f"id={self.id}"
 
@@ -172,24 +287,281 @@ class Anchor:
         return False
 
 
-@dataclass(eq=False, repr=False, kw_only=True)
+class EdgeIndex:
+    """Ordered edges of a node with an adjacency index by direction and type.
+
+    Edges keep their insertion order. The index groups them by
+    (outgoing, edge architype class name). Index keys are persisted with the node so
+    loaded edges stay stubs until a query reaches them; edges without keys are
+    indexed lazily on the first query.
+    """
+
+    __slots__ = ("owner", "edges", "index", "pending", "counter")
+
+    PAGE_SIZE: ClassVar[int] = 100
+
+    def __init__(
+        self,
+        edges: Iterable[EdgeAnchor] = (),
+        keys: Iterable[EdgeKeys | None] | None = None,
+    ) -> None:
+        """Initialize edge index."""
+        self.owner: NodeAnchor | None = None
+        self.edges: dict[EdgeAnchor, int] = {}
+        self.index: dict[EdgeKey, dict[EdgeAnchor, int]] = {}
+        self.pending: dict[EdgeAnchor, int] = {}
+        self.counter = 0
+        if keys is None:
+            for edge in edges:
+                self.append(edge)
+        else:
+            for edge, edge_keys in zip(edges, keys, strict=True):
+                self.append(edge, edge_keys)
+
+    def append(self, edge: EdgeAnchor, keys: EdgeKeys | None = None) -> None:
+        """Add edge."""
+        if edge not in self.edges:
+            self.edges[edge] = seq = self.counter
+            self.counter += 1
+            if keys is None and self.owner is not None and edge.is_populated():
+                keys = self.edge_keys(edge)
+            if keys is None:
+                self.pending[edge] = seq
+            else:
+                for key in keys:
+                    self.index.setdefault(key, {})[edge] = seq
+            if self.owner is not None:
+                self.owner.dirty = True
+
+    def remove(self, edge: EdgeAnchor) -> bool:
+        """Remove edge, return True if it was present."""
+        if self.edges.pop(edge, None) is None:
+            return False
+        if self.pending.pop(edge, None) is None:
+            for bucket in self.index.values():
+                bucket.pop(edge, None)
+        if self.owner is not None:
+            self.owner.dirty = True
+        return True
+
+    def clear(self) -> None:
+        """Remove all edges."""
+        self.edges.clear()
+        self.index.clear()
+        self.pending.clear()
+        if self.owner is not None:
+            self.owner.dirty = True
+
+    def index_pending(self) -> None:
+        """Register pending edges on their direction and type buckets."""
+        if not self.pending:
+            return
+
+        pending = list(self.pending.items())
+        for i in range(0, len(pending), self.PAGE_SIZE):
+            page = pending[i : i + self.PAGE_SIZE]
+            if self.owner is not None:
+                self.owner.populate_many(edge for edge, _ in page)
+            for edge, seq in page:
+                for key in self.edge_keys(edge):
+                    self.index.setdefault(key, {})[edge] = seq
+                del self.pending[edge]
+
+    def edge_keys(self, edge: EdgeAnchor) -> EdgeKeys:
+        """Get the direction and type buckets of a populated edge."""
+        keys: list[EdgeKey] = []
+        if (
+            (source := edge.source)
+            and (target := edge.target)
+            and (architype := edge.architype)
+        ):
+            name = self.type_name(architype.__class__)
+            if source == self.owner:
+                keys.append((True, name))
+            if target == self.owner:
+                keys.append((False, name))
+        return tuple(keys)
+
+    @staticmethod
+    def type_name(cls: type) -> str:
+        """Get the name an edge type is indexed with."""
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+    @staticmethod
+    def type_names(
+        edge_type: type | UnionType | tuple[type | UnionType, ...],
+    ) -> set[str] | None:
+        """Get names of the edge type and its subclasses, None if not a class."""
+        names: set[str] = set()
+        types: list[Any] = [edge_type]
+        while types:
+            match cls := types.pop():
+                case tuple():
+                    types.extend(cls)
+                case UnionType():
+                    types.extend(cls.__args__)
+                case type():
+                    names.add(EdgeIndex.type_name(cls))
+                    types.extend(cls.__subclasses__())
+                case _:
+                    return None
+        return names
+
+    def dump_keys(self) -> list[EdgeKeys | None]:
+        """Get the index keys of every edge, None for the ones not indexed yet."""
+        keys: dict[EdgeAnchor, list[EdgeKey]] = {
+            edge: [] for edge in self.edges if edge not in self.pending
+        }
+        for key, bucket in self.index.items():
+            for edge in bucket:
+                keys[edge].append(key)
+        return [
+            tuple(edge_keys) if (edge_keys := keys.get(edge)) is not None else None
+            for edge in self.edges
+        ]
+
+    def find(
+        self,
+        outgoing: bool,
+        incoming: bool,
+        edge_type: type | UnionType | tuple[type | UnionType, ...] | None = None,
+    ) -> Iterator[tuple[EdgeAnchor, bool]]:
+        """Iterate (edge, is_outgoing) matching direction and type in order.
+
+        Matching edges and their nodes are loaded a page at a time, only when
+        the iteration reaches them.
+        """
+        # not a class filter, leave it to the filter function
+        names = None if edge_type is None else self.type_names(edge_type)
+        if names is None and self.pending:
+            return self.scan(outgoing, incoming)
+
+        self.index_pending()
+
+        buckets: list[tuple[bool, dict[EdgeAnchor, int]]] = []
+        for (out, name), bucket in self.index.items():
+            if (
+                bucket
+                and (outgoing if out else incoming)
+                and (names is None or name in names)
+            ):
+                buckets.append((out, bucket))
+
+        if len(buckets) == 1:
+            out, bucket = buckets[0]
+            matches = [(edge, out) for edge in bucket]
+        else:
+            matches = [
+                (edge, out)
+                for _, _, edge, out in sorted(
+                    (seq, not out, edge, out)
+                    for out, bucket in buckets
+                    for edge, seq in bucket.items()
+                )
+            ]
+
+        return self.paged(matches)
+
+    def paged(
+        self, matches: list[tuple[EdgeAnchor, bool]]
+    ) -> Iterator[tuple[EdgeAnchor, bool]]:
+        """Load edges and their nodes page by page while iterating."""
+        for i in range(0, len(matches), self.PAGE_SIZE):
+            page = matches[i : i + self.PAGE_SIZE]
+            if self.owner is not None:
+                self.owner.populate_many(edge for edge, _ in page)
+                self.owner.populate_many(
+                    node
+                    for edge, _ in page
+                    if edge.is_populated()
+                    for node in (edge.source, edge.target)
+                )
+            yield from page
+
+    def scan(self, outgoing: bool, incoming: bool) -> Iterator[tuple[EdgeAnchor, bool]]:
+        """Load and index edges of any type page by page while iterating."""
+        edges = list(self.edges)
+        for i in range(0, len(edges), self.PAGE_SIZE):
+            page = edges[i : i + self.PAGE_SIZE]
+            if self.owner is not None:
+                self.owner.populate_many(page)
+            matches: list[tuple[EdgeAnchor, bool]] = []
+            for edge in page:
+                keys = self.edge_keys(edge)
+                if (seq := self.pending.pop(edge, None)) is not None:
+                    for key in keys:
+                        self.index.setdefault(key, {})[edge] = seq
+                outs = {out for out, _ in keys}
+                if outgoing and True in outs:
+                    matches.append((edge, True))
+                if incoming and False in outs:
+                    matches.append((edge, False))
+            if self.owner is not None:
+                self.owner.populate_many(
+                    node for edge, _ in matches for node in (edge.source, edge.target)
+                )
+            yield from matches
+
+    def __iter__(self) -> Iterator[EdgeAnchor]:
+        """Iterate over a snapshot so edges can be removed while iterating."""
+        return iter(list(self.edges))
+
+    def __len__(self) -> int:
+        """Count edges."""
+        return len(self.edges)
+
+    def __contains__(self, edge: object) -> bool:
+        """Check if edge exists."""
+        return edge in self.edges
+
+    def __eq__(self, other: object) -> bool:
+        """Compare edges in order."""
+        if isinstance(other, EdgeIndex):
+            return list(self.edges) == list(other.edges)
+        if isinstance(other, list):
+            return list(self.edges) == other
+        return False
+
+    def __repr__(self) -> str:
+        """Override representation."""
+        return repr(list(self.edges))
+
+
+@dataclass(eq=False, repr=False, kw_only=True, slots=True)
 class NodeAnchor(Anchor):
     """Node Anchor."""
 
     architype: NodeArchitype
-    edges: list[EdgeAnchor]
+    edges: EdgeIndex
+
+    def __post_init__(self) -> None:
+        """Bind edge index to this node."""
+        if not isinstance(self.edges, EdgeIndex):
+            self.edges = EdgeIndex(self.edges)
+        self.edges.owner = self
 
     def __getstate__(self) -> dict[str, object]:
         """Serialize Node Anchor."""
-        state = super().__getstate__()
+        # slots=True rebuilds the class, zero-argument super() can't be used
+        state = super(NodeAnchor, self).__getstate__()
 
         if self.is_populated():
             state["edges"] = [edge.make_stub() for edge in self.edges]
+            state["edge_keys"] = self.edges.dump_keys()
 
         return state
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Deserialize Node Anchor."""
+        if "edges" in state:
+            state["edges"] = edges = EdgeIndex(
+                state["edges"], state.pop("edge_keys", None)
+            )
+            edges.owner = self
+        super(NodeAnchor, self).__setstate__(state)
 
-@dataclass(eq=False, repr=False, kw_only=True)
+
+@dataclass(eq=False, repr=False, kw_only=True, slots=True)
 class EdgeAnchor(Anchor):
     """Edge Anchor."""
 
@@ -200,7 +572,7 @@ class EdgeAnchor(Anchor):
 
     def __getstate__(self) -> dict[str, object]:
         """Serialize Node Anchor."""
-        state = super().__getstate__()
+        state = super(EdgeAnchor, self).__getstate__()
 
         if self.is_populated():
             state.update(
@@ -214,14 +586,14 @@ class EdgeAnchor(Anchor):
         return state
 
 
-@dataclass(eq=False, repr=False, kw_only=True)
+@dataclass(eq=False, repr=False, kw_only=True, slots=True)
 class WalkerAnchor(Anchor):
     """Walker Anchor."""
 
     architype: WalkerArchitype
     path: list[Anchor] = field(default_factory=list)
-    next: list[Anchor] = field(default_factory=list)
-    ignores: list[Anchor] = field(default_factory=list)
+    next: deque[Anchor] = field(default_factory=deque)
+    ignores: set[Anchor] = field(default_factory=set)
     disengaged: bool = False
 
 
@@ -235,6 +607,12 @@ class Architype:
         """Create default architype."""
         self.__jac__ = Anchor(architype=self)
 
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Flag anchor as changed."""
+        super().__setattr__(name, value)
+        if name != "__jac__" and (anchor := self.__dict__.get("__jac__")) is not None:
+            anchor.dirty = True
+
     def __repr__(self) -> str:
         """Override repr for architype."""
         return f"{self.__class__.__name__}"
@@ -247,7 +625,7 @@ class NodeArchitype(Architype):
 
     def __init__(self) -> None:
         """Create node architype."""
-        self.__jac__ = NodeAnchor(architype=self, edges=[])
+        self.__jac__ = NodeAnchor(architype=self, edges=EdgeIndex())
 
 
 class EdgeArchitype(Architype):
@@ -283,7 +661,7 @@ class Root(NodeArchitype):
 
     def __init__(self) -> None:
         """Create root node."""
-        self.__jac__ = NodeAnchor(architype=self, persistent=True, edges=[])
+        self.__jac__ = NodeAnchor(architype=self, persistent=True, edges=EdgeIndex())
 
 
 @dataclass(eq=False)
@@ -297,3 +675,50 @@ class DSFunc:
     def resolve(self, cls: type) -> None:
         """Resolve the function."""
         self.func = getattr(cls, self.name)
+
+
+@dataclass(eq=False)
+class DSDispatch:
+    """Abilities triggered by a walker type on a node type, in call order."""
+
+    __cache__: ClassVar[dict[tuple[type[Architype], type[Architype]], DSDispatch]] = {}
+
+    # `steps` holds (ability, walker_first) pairs. `guarded` is set when the
+    # walker should stop before the first step if it is already disengaged.
+    steps: list[tuple[DSFunc, bool]]
+    guarded: bool
+
+    @classmethod
+    def get(cls, walker: type[Architype], node: type[Architype]) -> DSDispatch:
+        """Get the cached dispatch table of walker type on node type."""
+        if (dispatch := cls.__cache__.get((walker, node))) is None:
+            dispatch = cls.__cache__[(walker, node)] = cls.build(walker, node)
+        return dispatch
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every dispatch table, abilities or types have changed."""
+        cls.__cache__.clear()
+
+    @classmethod
+    def build(cls, walker: type[Architype], node: type[Architype]) -> DSDispatch:
+        """Resolve the abilities of walker type on node type."""
+        steps: list[tuple[DSFunc, bool]] = []
+        guarded = False
+
+        def add(funcs: list[DSFunc], other: type, walker_first: bool) -> None:
+            nonlocal guarded
+            for i in funcs:
+                if walker_first and not i.trigger:
+                    # walker's untriggered abilities only run on spawn/exit
+                    continue
+                if not i.trigger or issubclass(other, i.trigger):
+                    steps.append((i, walker_first))
+                elif not steps:
+                    guarded = True
+
+        add(node._jac_entry_funcs_, walker, False)
+        add(walker._jac_entry_funcs_, node, True)
+        add(walker._jac_exit_funcs_, node, True)
+        add(node._jac_exit_funcs_, walker, False)
+        return cls(steps=steps, guarded=guarded)
@@ -7,9 +7,11 @@ from .architype import (
     AccessLevel,
     Anchor,
     Architype,
+    DSDispatch,
     DSFunc,
     EdgeAnchor,
     EdgeArchitype,
+    EdgeIndex,
     GenericEdge,
     NodeAnchor,
     NodeArchitype,
@@ -26,6 +28,7 @@ __all__ = [
     "Anchor",
     "NodeAnchor",
     "EdgeAnchor",
+    "EdgeIndex",
     "WalkerAnchor",
     "Architype",
     "NodeArchitype",
@@ -34,6 +37,7 @@ __all__ = [
     "GenericEdge",
     "Root",
     "DSFunc",
+    "DSDispatch",
     "Memory",
     "ShelfStorage",
     "ExecutionContext",
@@ -8,7 +8,7 @@ from dataclasses import MISSING
 from typing import Any, Callable, Optional, cast
 from uuid import UUID
 
-from .architype import NodeAnchor, Root
+from .architype import EdgeIndex, NodeAnchor, Root
 from .memory import Memory, ShelfStorage
 
 
@@ -17,7 +17,10 @@ EXECUTION_CONTEXT = ContextVar[Optional["ExecutionContext"]]("ExecutionContext")
 SUPER_ROOT_UUID = UUID("00000000-0000-0000-0000-000000000000")
 SUPER_ROOT_ARCHITYPE = object.__new__(Root)
 SUPER_ROOT_ANCHOR = NodeAnchor(
-    id=SUPER_ROOT_UUID, architype=SUPER_ROOT_ARCHITYPE, persistent=False, edges=[]
+    id=SUPER_ROOT_UUID,
+    architype=SUPER_ROOT_ARCHITYPE,
+    persistent=False,
+    edges=EdgeIndex(),
 )
 SUPER_ROOT_ARCHITYPE.__jac__ = SUPER_ROOT_ANCHOR
 
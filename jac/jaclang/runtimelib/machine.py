@@ -1,5 +1,7 @@
 """Jac Machine module."""
 
+from __future__ import annotations
+
 import inspect
 import marshal
 import os
@@ -7,19 +9,21 @@ import sys
 import tempfile
 import types
 from contextvars import ContextVar
-from typing import Optional, Union
+from typing import Optional, TYPE_CHECKING, Union
 
-from jaclang.compiler.absyntree import Module
-from jaclang.compiler.compile import compile_jac
+from jaclang.compiler.build_cache import load_bytecode
 from jaclang.compiler.constant import Constants as Con
 from jaclang.runtimelib.architype import (
     Architype,
+    DSDispatch,
     EdgeArchitype,
     NodeArchitype,
     WalkerArchitype,
 )
 from jaclang.utils.log import logging
 
+if TYPE_CHECKING:
+    from jaclang.compiler.absyntree import Module
 
 logger = logging.getLogger(__name__)
 
@@ -201,6 +205,7 @@ class JacMachine:
                                     item_name,
                                     new_attr,
                                 )
+                DSDispatch.clear()
                 return (old_module,) if not items else tuple(ret_items)
             except Exception as e:
                 logger.error(f"Failed to update module {module_name}: {e}")
@@ -281,14 +286,22 @@ class JacProgram:
         reload: bool = False,
     ) -> Optional[types.CodeType]:
         """Get the bytecode for a specific module."""
-        if self.mod_bundle and isinstance(self.mod_bundle, Module):
+        if self.mod_bundle:
             codeobj = self.mod_bundle.mod_deps[full_target].gen.py_bytecode
             return marshal.loads(codeobj) if isinstance(codeobj, bytes) else None
+        # named after the file like PyOutPass does, module_name may be __main__
         gen_dir = os.path.join(caller_dir, Con.JAC_GEN_DIR)
-        pyc_file_path = os.path.join(gen_dir, module_name + ".jbc")
-        if cachable and os.path.exists(pyc_file_path) and not reload:
-            with open(pyc_file_path, "rb") as f:
-                return marshal.load(f)
+        base_name = os.path.splitext(os.path.basename(full_target))[0]
+        pyc_file_path = os.path.join(gen_dir, base_name + ".jbc")
+        if (
+            cachable
+            and not reload
+            and (bytecode := load_bytecode(pyc_file_path, full_target))
+        ):
+            return marshal.loads(bytecode)
+
+        # the compiler is only imported once a module has to be compiled
+        from jaclang.compiler.compile import compile_jac
 
         result = compile_jac(full_target, cache_result=cachable)
         if result.errors_had or not result.ir.gen.py_bytecode:
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import sqlite3
 from dataclasses import dataclass, field
-from pickle import dumps
+from logging import getLogger
+from pickle import dumps, loads
 from shelve import Shelf, open
-from typing import Callable, Generator, Generic, Iterable, TypeVar
+from typing import (
+    Callable,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    TypeVar,
+)
 from uuid import UUID
 
 from .architype import Anchor, NodeAnchor, Root, TANCH
 
 ID = TypeVar("ID")
 
+logger = getLogger(__name__)
+
 
 @dataclass
 class Memory(Generic[ID, TANCH]):
@@ -48,6 +60,9 @@ class Memory(Generic[ID, TANCH]):
         """Find one anchor from memory by ids with filter."""
         return next(self.find(ids, filter), None)
 
+    def prefetch(self, ids: Iterable[ID]) -> None:
+        """Load anchors from datasource ahead of use in one read."""
+
     def find_by_id(self, id: ID) -> TANCH | None:
         """Find one by id."""
         return self.__mem__.get(id)
@@ -66,55 +81,178 @@ class Memory(Generic[ID, TANCH]):
                 self.__gc__.add(anchor)
 
 
+class SqliteDict(MutableMapping[bytes, bytes]):
+    """Dbm style mapping stored on a SQLite table.
+
+    Writes are batched in a single transaction committed on sync/close and the
+    database runs in WAL mode so other sessions can keep reading meanwhile.
+    """
+
+    BULK_SIZE = 500
+
+    def __init__(self, path: str) -> None:
+        """Initialize SQLite mapping."""
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS anchors"
+            " (key BLOB PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID"
+        )
+        self.conn.commit()
+
+    def __getitem__(self, key: bytes) -> bytes:
+        """Get value by key."""
+        if row := self.conn.execute(
+            "SELECT value FROM anchors WHERE key = ?", (key,)
+        ).fetchone():
+            return row[0]
+        raise KeyError(key)
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        """Set value by key."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO anchors (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def __delitem__(self, key: bytes) -> None:
+        """Delete value by key."""
+        if not self.conn.execute("DELETE FROM anchors WHERE key = ?", (key,)).rowcount:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over keys."""
+        return (row[0] for row in self.conn.execute("SELECT key FROM anchors"))
+
+    def __len__(self) -> int:
+        """Count entries."""
+        return self.conn.execute("SELECT COUNT(*) FROM anchors").fetchone()[0]
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, bytes]:
+        """Get existing values of multiple keys."""
+        values: dict[bytes, bytes] = {}
+        for i in range(0, len(keys), self.BULK_SIZE):
+            chunk = keys[i : i + self.BULK_SIZE]
+            values.update(
+                self.conn.execute(
+                    "SELECT key, value FROM anchors WHERE key IN"
+                    f" ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        return values
+
+    def sync(self) -> None:
+        """Commit pending writes."""
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.conn.commit()
+        self.conn.close()
+
+
+class SqliteShelf(Shelf[Anchor]):
+    """Shelf on a SQLite table, reading many anchors at once."""
+
+    def __init__(self, backend: SqliteDict) -> None:
+        """Initialize shelf."""
+        super().__init__(backend)
+        self.backend = backend
+
+    def get_many(self, keys: list[str]) -> list[Anchor]:
+        """Get the stored anchors of multiple keys."""
+        rows = self.backend.get_many([key.encode() for key in keys])
+        return [loads(data) for data in rows.values()]
+
+
+# session backends by URI scheme, e.g. `sqlite:///graph.db`
+# plain paths are opened with shelve's default dbm
+SESSION_BACKENDS: dict[str, Callable[[str], MutableMapping[bytes, bytes]]] = {
+    "sqlite": SqliteDict,
+}
+
+
+def open_session(session: str) -> Shelf[Anchor]:
+    """Open session shelf from a path or a `<backend>:///<path>` URI."""
+    scheme, sep, path = session.partition("://")
+    if not sep:
+        return open(session)  # noqa: SIM115
+    if backend := SESSION_BACKENDS.get(scheme):
+        mapping = backend(path.removeprefix("/"))
+        if isinstance(mapping, SqliteDict):
+            return SqliteShelf(mapping)
+        return Shelf(mapping)
+    raise ValueError(f"Unknown session backend {scheme}!")
+
+
 @dataclass
 class ShelfStorage(Memory[UUID, Anchor]):
     """Shelf Handler."""
 
     __shelf__: Shelf[Anchor] | None = None
+    flushed: int = 0
+    skipped: int = 0
+    deleted: int = 0
 
     def __init__(self, session: str | None = None) -> None:
         """Initialize memory handler."""
         super().__init__()
-        self.__shelf__ = open(session) if session else None  # noqa: SIM115
+        self.__shelf__ = open_session(session) if session else None
+        self.flushed = self.skipped = self.deleted = 0
 
     def close(self) -> None:
         """Close memory handler."""
         if isinstance(self.__shelf__, Shelf):
             from jaclang.plugin.feature import JacFeature as Jac
 
+            self.flushed = self.skipped = self.deleted = 0
             for anchor in self.__gc__:
-                self.__shelf__.pop(str(anchor.id), None)
+                if self.__shelf__.pop(str(anchor.id), None) is not None:
+                    self.deleted += 1
                 self.__mem__.pop(anchor.id, None)
 
             for d in self.__mem__.values():
-                if d.persistent and d.hash != hash(dumps(d)):
-                    _id = str(d.id)
-                    if p_d := self.__shelf__.get(_id):
-                        if (
-                            isinstance(p_d, NodeAnchor)
-                            and isinstance(d, NodeAnchor)
-                            and p_d.edges != d.edges
-                            and Jac.check_connect_access(d)
-                        ):
-                            if not d.edges:
-                                self.__shelf__.pop(_id, None)
-                                continue
-                            p_d.edges = d.edges
-
-                        if Jac.check_write_access(d):
-                            if hash(dumps(p_d.access)) != hash(dumps(d.access)):
-                                p_d.access = d.access
-                            if hash(dumps(p_d.architype)) != hash(dumps(d.architype)):
-                                p_d.architype = d.architype
-
-                        self.__shelf__[_id] = p_d
-                    elif not (
-                        isinstance(d, NodeAnchor)
-                        and not isinstance(d.architype, Root)
-                        and not d.edges
+                if not d.persistent:
+                    continue
+
+                # anchors loaded with untracked state fall back to hash check
+                if d.hash == hash(dumps(d)) if d.hash else not d.dirty:
+                    self.skipped += 1
+                    continue
+
+                _id = str(d.id)
+                if p_d := self.__shelf__.get(_id):
+                    if (
+                        isinstance(p_d, NodeAnchor)
+                        and isinstance(d, NodeAnchor)
+                        and p_d.edges != d.edges
+                        and Jac.check_connect_access(d)
                     ):
-                        self.__shelf__[_id] = d
+                        if not d.edges:
+                            self.__shelf__.pop(_id, None)
+                            self.deleted += 1
+                            continue
+                        p_d.edges = d.edges
 
+                    if Jac.check_write_access(d):
+                        p_d.access = d.access
+                        p_d.architype = d.architype
+
+                    self.__shelf__[_id] = p_d
+                    self.flushed += 1
+                elif not (
+                    isinstance(d, NodeAnchor)
+                    and not isinstance(d.architype, Root)
+                    and not d.edges
+                ):
+                    self.__shelf__[_id] = d
+                    self.flushed += 1
+
+            logger.info(
+                f"Session closed: {self.flushed} anchors flushed,"
+                f" {self.skipped} unchanged skipped,"
+                f" {self.deleted} deleted"
+            )
             self.__shelf__.close()
         super().close()
 
@@ -128,20 +266,32 @@ class ShelfStorage(Memory[UUID, Anchor]):
             ids = [ids]
 
         if isinstance(self.__shelf__, Shelf):
+            ids = list(ids)
+            self.prefetch(ids)
             for id in ids:
-                anchor = self.__mem__.get(id)
-
-                if (
-                    not anchor
-                    and id not in self.__gc__
-                    and (_anchor := self.__shelf__.get(str(id)))
-                ):
-                    self.__mem__[id] = anchor = _anchor
-                if anchor and (not filter or filter(anchor)):
+                if (anchor := self.__mem__.get(id)) and (not filter or filter(anchor)):
                     yield anchor
         else:
             yield from super().find(ids, filter)
 
+    def prefetch(self, ids: Iterable[UUID]) -> None:
+        """Load anchors from datasource, in one read if the backend supports it."""
+        if not isinstance(self.__shelf__, Shelf):
+            return
+
+        removed = {anchor.id for anchor in self.__gc__}
+        keys = [str(id) for id in ids if id not in self.__mem__ and id not in removed]
+        if not keys:
+            return
+
+        if isinstance(self.__shelf__, SqliteShelf):
+            for anchor in self.__shelf__.get_many(keys):
+                self.__mem__[anchor.id] = anchor
+        else:
+            for key in keys:
+                if found := self.__shelf__.get(key):
+                    self.__mem__[found.id] = found
+
     def find_by_id(self, id: UUID) -> Anchor | None:
         """Find one by id."""
         data = super().find_by_id(id)
@@ -7,10 +7,10 @@ import sys
 from contextlib import contextmanager
 from typing import Callable, Iterator, TYPE_CHECKING
 
-import jaclang.compiler.absyntree as ast
 from jaclang.compiler.semtable import SemScope
 
 if TYPE_CHECKING:
+    import jaclang.compiler.absyntree as ast
     from jaclang.runtimelib.constructs import NodeAnchor, NodeArchitype
 
 
@@ -117,6 +117,8 @@ def traverse_graph(
 
 def get_sem_scope(node: ast.AstNode) -> SemScope:
     """Get scope of the node."""
+    import jaclang.compiler.absyntree as ast
+
     a = (
         node.name
         if isinstance(node, ast.Module)
@@ -148,6 +150,8 @@ def get_sem_scope(node: ast.AstNode) -> SemScope:
 
 def extract_type(node: ast.AstNode) -> list[str]:
     """Collect type information in assignment using bfs."""
+    import jaclang.compiler.absyntree as ast
+
     extracted_type = []
     if isinstance(node, (ast.BuiltinType, ast.Token)):
         extracted_type.append(node.value)
@@ -160,6 +164,8 @@ def extract_params(
     body: ast.FuncCall,
 ) -> tuple[dict[str, ast.Expr], list[tuple[str, ast3.AST]], list[tuple[str, ast3.AST]]]:
     """Extract model parameters, include and exclude information."""
+    import jaclang.compiler.absyntree as ast
+
     model_params = {}
     include_info = []
     exclude_info = []
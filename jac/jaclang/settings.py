@@ -16,16 +16,23 @@ class Settings:
     pass_timer: bool = False
     collect_py_dep_debug: bool = False
     print_py_raised_ast: bool = False
+    gen_py_debug: bool = False
 
     # Compiler configuration
     disable_mtllm: bool = False
     ignore_test_annex: bool = False
+    compile_jobs: int = 1
+    py_raise_cache: bool = False
+    fast_parser: bool = True
 
     # Formatter configuration
     max_line_length: int = 88
 
     # LSP configuration
     lsp_debug: bool = False
+    lsp_index_cache: bool = True
+    lsp_index_max_files: int = 5_000
+    lsp_module_cache_lines: int = 200_000
 
     def __post_init__(self) -> None:
         """Initialize settings."""
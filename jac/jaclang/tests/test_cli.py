@@ -3,6 +3,7 @@
 import contextlib
 import inspect
 import io
+import json
 import os
 import subprocess
 import sys
@@ -298,6 +299,57 @@ class JacCliTests(TestCase):
         self.assertIn("Errors: 0, Warnings: 0", stdout_value)
         self.assertIn("<module 'pyfunc' from", stdout_value)
 
+    def test_build_profile(self) -> None:
+        """Test compiler pass profile of jac build."""
+        profile_path = self.fixture_abs_path("needs_import.profile.json")
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        cli.build(f"{self.fixture_abs_path('needs_import.jac')}", profile=True)
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue()
+        with open(profile_path) as f:
+            profile = json.load(f)
+        os.remove(profile_path)
+        os.remove(self.fixture_abs_path("needs_import.jir"))
+        self.assertIn("Errors: 0, Warnings: 0", stdout_value)
+        for name in ["SymTabBuildPass", "DefUsePass", "PyastGenPass"]:
+            self.assertRegex(stdout_value, rf"\n{name} +\d+ ")
+        passes = {i["name"]: i for i in profile["passes"]}
+        self.assertGreater(passes["PyastGenPass"]["visits"], 0)
+        self.assertGreater(passes["JacParser"]["peak_bytes"], 0)
+        self.assertEqual(
+            sum(i["visits"] for i in passes["DefUsePass"]["nodes"].values()),
+            passes["DefUsePass"]["visits"],
+        )
+
+    def test_run_cached_skips_compiler(self) -> None:
+        """Test running fresh cached bytecode doesn't import the compiler."""
+        program = (
+            "import sys\n"
+            "from jaclang.cli import cli\n"
+            "cli.run(sys.argv[1])\n"
+            "print(sorted(i for i in sys.modules if i.startswith('jaclang.comp')))\n"
+        )
+        jaclang_dir = os.path.dirname(os.path.dirname(cli.__file__))
+        env = {**os.environ, "PYTHONPATH": os.path.dirname(jaclang_dir)}
+        cached = self.fixture_abs_path(os.path.join("__jac_gen__", "hello.jbc"))
+        if os.path.exists(cached):
+            os.remove(cached)
+        outputs = [
+            subprocess.run(
+                [sys.executable, "-c", program, self.fixture_abs_path("hello.jac")],
+                capture_output=True,
+                text=True,
+                env=env,
+            ).stdout
+            for _ in range(2)
+        ]
+        self.assertIn("Hello World!", outputs[0])
+        self.assertIn("jaclang.compiler.parser", outputs[0])
+        self.assertIn("Hello World!", outputs[1])
+        self.assertNotIn("jaclang.compiler.parser", outputs[1])
+        self.assertNotIn("jaclang.compiler.passes", outputs[1])
+
     def test_cache_no_cache_on_run(self) -> None:
         """Basic test for pass."""
         process = subprocess.Popen(
@@ -5,11 +5,13 @@ import os
 import pickle
 import sys
 import sysconfig
+import tempfile
 
 
 import jaclang.compiler.passes.main as passes
 from jaclang import jac_import
 from jaclang.cli import cli
+from jaclang.compiler import build_cache
 from jaclang.compiler.compile import jac_file_to_pass, jac_pass_to_pass, jac_str_to_pass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
 from jaclang.runtimelib.context import SUPER_ROOT_ANCHOR
@@ -342,6 +344,107 @@ class JacLanguageTests(TestCase):
             stdout_value[5],
         )
 
+    def test_edge_index(self) -> None:
+        """Test typed and directional edge queries through the edge index."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("edge_index", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(stdout_value[0], "[1, 3, 5]")
+        self.assertEqual(stdout_value[1], "[3, 5]")
+        self.assertEqual(stdout_value[2], "[3]")
+        self.assertEqual(stdout_value[3], "[4]")
+        self.assertEqual(stdout_value[4], "[1, 3, 4, 5]")
+        self.assertEqual(stdout_value[5], "[1, 2, 3, 5, 6, 0]")
+        self.assertEqual(stdout_value[6], "[4, 0]")
+        self.assertEqual(stdout_value[7], "['other', 'other']")
+        self.assertEqual(stdout_value[8], "[1, 5]")
+        self.assertEqual(stdout_value[9], "[4, 0]")
+
+    def test_build_cache(self) -> None:
+        """Test cached bytecode is reused until a module or a dependency changes."""
+        from jaclang.compiler.compile import compile_jac
+        from jaclang.settings import settings
+
+        with tempfile.TemporaryDirectory() as tmp:
+            main = os.path.join(tmp, "bc_main.jac")
+            dep = os.path.join(tmp, "bc_dep.jac")
+            with open(main, "w") as f:
+                f.write("import:jac bc_dep;\nwith entry { print(bc_dep.VAL); }\n")
+            with open(dep, "w") as f:
+                f.write("glob VAL = 1;\n")
+            gen = os.path.join(tmp, "__jac_gen__")
+
+            def run() -> str:
+                captured_output = io.StringIO()
+                sys.stdout = captured_output
+                JacMachine(tmp).attach_program(
+                    JacProgram(mod_bundle=None, bytecode=None)
+                )
+                jac_import("bc_main", base_path=tmp)
+                sys.stdout = sys.__stdout__
+                for name in ("bc_main", "bc_dep"):
+                    sys.modules.pop(name, None)
+                return captured_output.getvalue().strip()
+
+            self.assertEqual(run(), "1")
+            main_jbc = os.path.join(gen, "bc_main.jbc")
+            entry = build_cache.read_entry(main_jbc)
+            assert entry is not None
+            self.assertEqual(entry[0]["deps"], {dep: build_cache.file_hash(dep)})
+            self.assertIsNotNone(build_cache.load_bytecode(main_jbc, main))
+
+            written = os.stat(main_jbc).st_mtime_ns
+            self.assertEqual(run(), "1")
+            self.assertEqual(os.stat(main_jbc).st_mtime_ns, written)
+
+            # a full compile writes the Python source a lean run left out
+            main_py = os.path.join(gen, "bc_main.py")
+            self.assertFalse(os.path.exists(main_py))
+            settings.gen_py_debug = True
+            try:
+                compile_jac(main, cache_result=True)
+            finally:
+                settings.gen_py_debug = False
+            self.assertTrue(os.path.exists(main_py))
+            self.assertEqual(os.stat(main_jbc).st_mtime_ns, written)
+
+            with open(dep, "w") as f:
+                f.write("glob VAL = 2;\n")
+            self.assertIsNone(build_cache.load_bytecode(main_jbc, main))
+            self.assertEqual(run(), "2")
+            self.assertIsNotNone(build_cache.load_bytecode(main_jbc, main))
+
+    def test_ds_dispatch(self) -> None:
+        """Test ability dispatch order and disengage across node types."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("ds_dispatch", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue().split("\n")
+        self.assertEqual(
+            stdout_value[:12],
+            [
+                "start",
+                "base entry a",
+                "visit a 1",
+                "special any b",
+                "visit b 2",
+                "leave marked b",
+                "special exit b",
+                "base entry c",
+                "visit c 3",
+                "special any d",
+                "visit d 4",
+                "leave marked d",
+            ],
+        )
+        self.assertEqual(stdout_value[12], "special any b")
+        self.assertEqual(stdout_value[13], "other b")
+        self.assertNotIn("special exit d", stdout_value)
+        self.assertNotIn("done 4", stdout_value)
+
     def test_simple_archs(self) -> None:
         """Test conn assign on edges."""
         captured_output = io.StringIO()
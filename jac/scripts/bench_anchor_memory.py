@@ -0,0 +1,47 @@
+"""Measure memory held by anchors of a large graph.
+
+Builds a tree of nodes, each one connected to its parent, and reports the
+traced allocations of the nodes alone and of the connected graph.
+
+Run with `python scripts/bench_anchor_memory.py [nodes]`.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.constructs import ExecutionContext, NodeArchitype
+
+
+def main(count: int) -> None:
+    """Run the benchmark."""
+    ctx = ExecutionContext.create()
+    edge_spec = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    nodes = [NodeArchitype() for _ in range(count)]
+    created = time.perf_counter() - start
+    node_bytes = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    for idx in range(1, count):
+        Jac.connect(left=nodes[(idx - 1) // 8], right=nodes[idx], edge_spec=edge_spec)
+    connected = time.perf_counter() - start
+    graph_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{'stage':<10}{'seconds':>10}{'total (MiB)':>14}{'per node (B)':>15}")
+    for stage, seconds, size in (
+        ("nodes", created, node_bytes),
+        ("graph", connected, graph_bytes),
+    ):
+        print(f"{stage:<10}{seconds:>10.2f}{size / 2**20:>14.1f}{size / count:>15.0f}")
+    ctx.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,74 @@
+"""Measure compile time and memory of the full and lean code gen schedules.
+
+Compiles every module of examples/reference once through `py_code_gen`, which
+keeps jac/python ast links and unparses python source for tools and the
+language server, and once through `py_code_gen_lean`, which `jac run` uses to
+get bytecode. Reports the best time of each schedule and the peak memory
+traced while compiling the whole corpus.
+
+Run with `python scripts/bench_codegen.py [repeat]`.
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.parser import JacParser
+from jaclang.compiler.passes import Pass
+from jaclang.compiler.passes.main.schedules import py_code_gen, py_code_gen_lean
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "..", "examples", "reference")
+
+
+def compile_all(files: list[str], schedule: list[type[Pass]]) -> list[Pass]:
+    """Compile every file through a schedule."""
+    results = []
+    for file in files:
+        with open(file) as f:
+            source = ast.JacSource(f.read(), mod_path=file)
+        prse: Pass = JacParser(input_ir=source)
+        for pass_cls in schedule:
+            prse = pass_cls(input_ir=prse.ir, prior=prse)
+        results.append(prse)
+    return results
+
+
+def main(repeat: int) -> None:
+    """Run the benchmark."""
+    files = sorted(
+        os.path.join(REFERENCE, name)
+        for name in os.listdir(REFERENCE)
+        if name.endswith(".jac")
+    )
+    logging.disable(logging.CRITICAL)
+    modes = {"full": py_code_gen, "lean": py_code_gen_lean}
+    seconds: dict[str, float] = {}
+    peaks: dict[str, int] = {}
+
+    for _ in range(repeat):
+        for mode, schedule in modes.items():
+            gc.collect()
+            start = time.perf_counter()
+            compile_all(files, schedule)
+            elapsed = time.perf_counter() - start
+            seconds[mode] = min(seconds.get(mode, elapsed), elapsed)
+    for mode, schedule in modes.items():
+        gc.collect()
+        tracemalloc.start()
+        compiled = compile_all(files, schedule)
+        peaks[mode] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del compiled
+
+    print(f"{len(files)} modules, best of {repeat}")
+    print(f"{'schedule':<12}{'time (s)':>10}{'peak (MiB)':>12}")
+    for mode in modes:
+        print(f"{mode:<12}{seconds[mode]:>10.3f}{peaks[mode] / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,62 @@
+"""Measure per-call overhead of pluggy hook calls against resolved dispatch.
+
+Run with `python scripts/bench_hook_dispatch.py [number]`.
+"""
+
+import sys
+import timeit
+
+from jaclang.compiler.constant import EdgeDir
+from jaclang.plugin.feature import JacFeature as Jac, plugin_manager
+from jaclang.runtimelib.constructs import ExecutionContext, NodeArchitype
+
+
+def main(number: int) -> None:
+    """Run the benchmark."""
+    ctx = ExecutionContext.create()
+    node = NodeArchitype()
+    edge_spec = Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None)
+    Jac.connect(
+        left=node, right=[NodeArchitype() for _ in range(8)], edge_spec=edge_spec
+    )
+    anchor = node.__jac__
+    hook, dispatch = plugin_manager.hook, plugin_manager.dispatch
+
+    cases = {
+        "check_read_access": (
+            lambda: hook.check_read_access(to=anchor),
+            lambda: dispatch.check_read_access(to=anchor),
+        ),
+        "edge_ref": (
+            lambda: hook.edge_ref(
+                node_obj=node,
+                target_obj=None,
+                dir=EdgeDir.OUT,
+                filter_func=None,
+                edges_only=False,
+                edge_type=None,
+            ),
+            lambda: dispatch.edge_ref(
+                node_obj=node,
+                target_obj=None,
+                dir=EdgeDir.OUT,
+                filter_func=None,
+                edges_only=False,
+                edge_type=None,
+            ),
+        ),
+    }
+
+    print(f"{'hook':<20}{'pluggy (ns)':>14}{'dispatch (ns)':>16}{'saved':>9}")
+    for name, (via_pluggy, via_dispatch) in cases.items():
+        before = min(timeit.repeat(via_pluggy, number=number, repeat=5)) / number
+        after = min(timeit.repeat(via_dispatch, number=number, repeat=5)) / number
+        print(
+            f"{name:<20}{before * 1e9:>14.0f}{after * 1e9:>16.0f}"
+            f"{(1 - after / before) * 100:>8.1f}%"
+        )
+    ctx.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,93 @@
+"""Measure parser throughput of the parse tree and fast parser paths.
+
+Parses every module of examples/reference one by one, then a large module
+made of the reference modules joined together until it reaches the given
+number of lines. Each corpus is parsed through the lark parse tree and
+TreeToAST (the previous behaviour) and through the fast parser, which builds
+AST nodes in parser callbacks, and both ASTs are checked to be identical.
+
+Run with `python scripts/bench_parser.py [lines] [repeat]`.
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.parser import JacParser
+from jaclang.settings import settings
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "..", "examples", "reference")
+
+
+def load_corpus(lines: int) -> dict[str, list[str]]:
+    """Get reference modules and a large module built from them."""
+    modules = []
+    for name in sorted(os.listdir(REFERENCE)):
+        if name.endswith(".jac"):
+            with open(os.path.join(REFERENCE, name)) as f:
+                modules.append(f.read())
+    # a module docstring can only come first, so those modules are left out
+    joinable = [i for i in modules if not i.startswith('"""')]
+    large: list[str] = []
+    while sum(i.count("\n") + 1 for i in large) < lines:
+        large += joinable
+    return {"reference": modules, "large": ["\n".join(large)]}
+
+
+def parse_all(sources: list[str]) -> tuple[float, list[tuple]]:
+    """Parse every source, return seconds taken and a dump of the ASTs."""
+    parsed = []
+    ast.Test.TEST_COUNT = 0  # names of anonymous tests count up across parses
+    start = time.perf_counter()
+    for source in sources:
+        parsed.append(JacParser(ast.JacSource(source, mod_path="bench.jac")))
+    seconds = time.perf_counter() - start
+    return seconds, [dump(prse) for prse in parsed]
+
+
+def dump(prse: JacParser) -> tuple:
+    """Get what is compared of a parsed module."""
+    mod = prse.ir
+    nodes = [
+        (type(i).__name__, i.loc.pos_start, i.loc.pos_end, isinstance(i, ast.Token))
+        for i in mod._in_mod_nodes
+    ]
+    errors = [i.msg for i in prse.errors_had]
+    return (ast.print_ast_tree(mod), nodes, len(prse.source.comments), errors)
+
+
+def main(lines: int, repeat: int) -> None:
+    """Run the benchmark."""
+    corpus = load_corpus(lines)
+    logging.disable(logging.CRITICAL)
+    modes = {"parse tree": False, "fast": True}
+    results: dict[str, dict[str, float]] = {mode: {} for mode in modes}
+    for _ in range(repeat):
+        for name, sources in corpus.items():
+            dumps = []
+            for mode, fast in modes.items():
+                settings.fast_parser = fast
+                gc.collect()
+                seconds, dumped = parse_all(sources)
+                best = results[mode].get(name)
+                results[mode][name] = seconds if best is None else min(best, seconds)
+                dumps.append(dumped)
+            if dumps[0] != dumps[1]:
+                raise AssertionError(f"Fast parser built a different AST for {name}")
+
+    print(f"best of {repeat}, ASTs identical")
+    print(f"{'corpus':<24}{'lines':>8}{'parse tree (s)':>16}{'fast (s)':>10}")
+    for name, sources in corpus.items():
+        before, after = results["parse tree"][name], results["fast"][name]
+        count = sum(i.count("\n") + 1 for i in sources)
+        print(f"{name:<24}{count:>8}{before:>16.3f}{after:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+    )
@@ -0,0 +1,91 @@
+"""Measure compile time of the pass schedule with per-class handler dispatch.
+
+Compiles every module of examples/reference through the code gen schedule,
+once resolving handlers by name on each visit (the previous behaviour) and
+once through the cached handler tables. `--typed` adds the type checking
+schedule, whose time is dominated by mypy.
+
+Run with `python scripts/bench_pass_dispatch.py [repeat] [--typed]`.
+"""
+
+import gc
+import logging
+import os
+import sys
+from collections import defaultdict
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.parser import JacParser
+from jaclang.compiler.passes import Pass
+from jaclang.compiler.passes.main.schedules import py_code_gen, type_checker_sched
+from jaclang.utils.helpers import pascal_to_snake
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "..", "examples", "reference")
+
+
+def enter_by_name(self: Pass, node: ast.AstNode) -> None:
+    """Resolve enter handler by name on every visit."""
+    if hasattr(self, f"enter_{pascal_to_snake(type(node).__name__)}"):
+        getattr(self, f"enter_{pascal_to_snake(type(node).__name__)}")(node)
+
+
+def exit_by_name(self: Pass, node: ast.AstNode) -> None:
+    """Resolve exit handler by name on every visit."""
+    if hasattr(self, f"exit_{pascal_to_snake(type(node).__name__)}"):
+        getattr(self, f"exit_{pascal_to_snake(type(node).__name__)}")(node)
+
+
+def compile_all(files: list[str], schedule: list[type[Pass]]) -> dict[str, float]:
+    """Compile every file, return seconds spent per pass."""
+    timings: dict[str, float] = defaultdict(float)
+    for file in files:
+        with open(file) as f:
+            source = ast.JacSource(f.read(), mod_path=file)
+        prse: Pass = JacParser(input_ir=source)
+        for pass_cls in schedule:
+            prse = pass_cls(input_ir=prse.ir, prior=prse)
+            timings[pass_cls.__name__] += prse.time_taken
+    return timings
+
+
+def main(repeat: int, typed: bool) -> None:
+    """Run the benchmark."""
+    files = sorted(
+        os.path.join(REFERENCE, name)
+        for name in os.listdir(REFERENCE)
+        if name.endswith(".jac")
+    )
+    schedule = [*py_code_gen, *type_checker_sched] if typed else py_code_gen
+    logging.disable(logging.CRITICAL)
+    modes = {
+        "by name": (enter_by_name, exit_by_name),
+        "cached": (Pass.enter_node, Pass.exit_node),
+    }
+    results: dict[str, dict[str, float]] = {mode: {} for mode in modes}
+
+    for _ in range(repeat):
+        for mode, (enter_fn, exit_fn) in modes.items():
+            Pass.enter_node, Pass.exit_node = enter_fn, exit_fn  # type: ignore[method-assign]
+            gc.collect()
+            for name, seconds in compile_all(files, schedule).items():
+                best = results[mode].get(name)
+                results[mode][name] = seconds if best is None else min(best, seconds)
+    Pass.enter_node, Pass.exit_node = modes["cached"]  # type: ignore[method-assign]
+
+    print(f"{len(files)} modules, best of {repeat}")
+    print(f"{'pass':<24}{'by name (s)':>13}{'cached (s)':>12}{'saved':>9}")
+    for name in dict.fromkeys(i.__name__ for i in schedule):
+        before, after = results["by name"][name], results["cached"][name]
+        print(
+            f"{name:<24}{before:>13.3f}{after:>12.3f}"
+            f"{(1 - after / before) * 100 if before else 0:>8.1f}%"
+        )
+    before, after = (sum(results[mode].values()) for mode in modes)
+    print(
+        f"{'total':<24}{before:>13.3f}{after:>12.3f}{(1 - after / before) * 100:>8.1f}%"
+    )
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--typed"]
+    main(int(args[0]) if args else 3, "--typed" in sys.argv)
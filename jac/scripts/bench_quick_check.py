@@ -0,0 +1,76 @@
+"""Measure language server syntax checks of a large module after small edits.
+
+Builds a module out of the examples/reference modules joined together until
+it reaches the given number of lines, then edits a line in its middle again
+and again. Each edit is checked once by parsing the whole module (the
+previous quick check) and once through the incremental parser the language
+server keeps per document, which only parses the changed top level elements.
+
+Run with `python scripts/bench_quick_check.py [lines] [edits]`.
+"""
+
+import logging
+import os
+import sys
+import time
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.parser import JacParser
+from jaclang.langserve.incremental import IncrementalParser
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "..", "examples", "reference")
+
+
+def load_module(lines: int) -> list[str]:
+    """Get lines of a large module built from the reference modules."""
+    modules = []
+    for name in sorted(os.listdir(REFERENCE)):
+        if name.endswith(".jac"):
+            with open(os.path.join(REFERENCE, name)) as f:
+                modules.append(f.read())
+    # a module docstring can only come first, so those modules are left out
+    joinable = [i for i in modules if not i.startswith('"""')]
+    large: list[str] = []
+    while len(large) < lines:
+        for module in joinable:
+            large += module.splitlines()
+    return large
+
+
+def main(lines: int, edits: int) -> None:
+    """Run the benchmark."""
+    source = load_module(lines)
+    logging.disable(logging.CRITICAL)
+    # edit the first indented line from the middle of the module on
+    target = next(
+        i for i in range(len(source) // 2, len(source)) if source[i].startswith(" ")
+    )
+    parser = IncrementalParser("file:///bench.jac")
+    start = time.perf_counter()
+    parser.check("\n".join(source))
+    first = time.perf_counter() - start
+
+    full = incremental = 0.0
+    for edit in range(edits):
+        source[target] += f"  # edit {edit}"
+        text = "\n".join(source)
+        start = time.perf_counter()
+        JacParser(ast.JacSource(text, mod_path="bench.jac"))
+        full += time.perf_counter() - start
+        parsed = parser.parsed
+        start = time.perf_counter()
+        parser.check(text)
+        incremental += time.perf_counter() - start
+
+    print(f"{len(source)} lines, {len(parser.elements)} top level elements")
+    print(f"first incremental check {first * 1000:.1f} ms")
+    print(f"per edit, mean of {edits}, {parser.parsed - parsed} elements parsed")
+    print(f"  full parse        {full / edits * 1000:>8.1f} ms")
+    print(f"  incremental check {incremental / edits * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+    )
@@ -0,0 +1,90 @@
+"""Measure import time of `jac run` on a program with fresh cached bytecode.
+
+Runs a Jac program once to fill `__jac_gen__`, then runs it again in fresh
+interpreters under `python -X importtime` and reports the wall time, the total
+time spent importing and the slowest top level imports. Compiler modules
+imported while running from the cache are listed too, as only the build cache
+and constants are needed to load cached bytecode.
+
+Run with `python scripts/bench_startup.py [file.jac] [repeat] [--max-ms N]`,
+`--max-ms` fails when the best total import time goes over N milliseconds.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "..", "jaclang", "tests", "fixtures", "hello.jac"
+)
+RUNTIME_COMPILER_MODULES = {
+    "jaclang.compiler",
+    "jaclang.compiler.build_cache",
+    "jaclang.compiler.constant",
+    "jaclang.compiler.semtable",
+}
+
+PROGRAM = """
+import sys
+from jaclang.cli import cli
+cli.run(sys.argv[1])
+print(",".join(i for i in sys.modules if i.startswith("jaclang.compiler")))
+"""
+
+
+def run_once(file: str) -> tuple[float, dict[str, int], list[str]]:
+    """Run file, return wall seconds, top level import times and compiler mods."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROGRAM, file],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    seconds = time.perf_counter() - start
+    imports = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # top level imports are the ones not indented under another import
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    compiler_mods = proc.stdout.strip().splitlines()[-1].split(",")
+    return seconds, imports, compiler_mods
+
+
+def main(file: str, repeat: int, max_ms: float) -> None:
+    """Run the benchmark."""
+    run_once(file)  # fill the bytecode cache
+    best = None
+    for _ in range(repeat):
+        seconds, imports, compiler_mods = run_once(file)
+        total = sum(imports.values()) / 1000
+        if best is None or total < best[1]:
+            best = (seconds, total, imports, compiler_mods)
+    assert best is not None
+    seconds, total, imports, compiler_mods = best
+
+    print(f"{os.path.basename(file)}, best of {repeat}")
+    print(f"wall time {seconds * 1000:.1f} ms, imports {total:.1f} ms")
+    for name, us in sorted(imports.items(), key=lambda i: i[1], reverse=True)[:10]:
+        print(f"  {name:<40}{us / 1000:>10.1f} ms")
+    extra = sorted(set(compiler_mods) - RUNTIME_COMPILER_MODULES)
+    print(f"compiler modules imported beyond the runtime ones: {extra or 'none'}")
+    if max_ms and total > max_ms:
+        sys.exit(f"imports took {total:.1f} ms, more than {max_ms} ms")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    limit = 0.0
+    if "--max-ms" in args:
+        limit = float(args.pop(args.index("--max-ms") + 1))
+        args.remove("--max-ms")
+    main(
+        args[0] if args else FIXTURE,
+        int(args[1]) if len(args) > 1 else 5,
+        limit,
+    )